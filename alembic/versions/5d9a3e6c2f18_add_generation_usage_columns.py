@@ -0,0 +1,36 @@
+"""add generation usage columns
+
+Revision ID: 5d9a3e6c2f18
+Revises: c41e7b2f9a05
+Create Date: 2026-10-18 14:05:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9a3e6c2f18'
+down_revision: Union[str, Sequence[str], None] = 'c41e7b2f9a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('generations', sa.Column('input_tokens', sa.Integer(), nullable=True))
+    op.add_column('generations', sa.Column('output_tokens', sa.Integer(), nullable=True))
+    op.add_column('generations', sa.Column('cached_tokens', sa.Integer(), nullable=True))
+    op.add_column('generations', sa.Column('latency_ms', sa.Integer(), nullable=True))
+    op.add_column('generations', sa.Column('ttft_ms', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('generations', 'ttft_ms')
+    op.drop_column('generations', 'latency_ms')
+    op.drop_column('generations', 'cached_tokens')
+    op.drop_column('generations', 'output_tokens')
+    op.drop_column('generations', 'input_tokens')
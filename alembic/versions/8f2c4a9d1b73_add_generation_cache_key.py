@@ -0,0 +1,30 @@
+"""add generation cache key
+
+Revision ID: 8f2c4a9d1b73
+Revises: 31e01b3d3cad
+Create Date: 2026-10-18 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2c4a9d1b73'
+down_revision: Union[str, Sequence[str], None] = '31e01b3d3cad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('generations', sa.Column('cache_key', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_generations_cache_key'), 'generations', ['cache_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_generations_cache_key'), table_name='generations')
+    op.drop_column('generations', 'cache_key')
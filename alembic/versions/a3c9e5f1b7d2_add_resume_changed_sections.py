@@ -0,0 +1,29 @@
+"""add resume changed_sections
+
+Revision ID: a3c9e5f1b7d2
+Revises: e7b4d2a9c6f1
+Create Date: 2026-10-18 19:05:37.512804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e5f1b7d2'
+down_revision: Union[str, Sequence[str], None] = 'e7b4d2a9c6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resumes', sa.Column('changed_sections', postgresql.ARRAY(sa.String()), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('resumes', 'changed_sections')
@@ -0,0 +1,28 @@
+"""add generation heartbeat_at
+
+Revision ID: a4e8c2d6f913
+Revises: f1a7c3e9b2d4
+Create Date: 2026-10-19 10:24:53.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e8c2d6f913'
+down_revision: Union[str, Sequence[str], None] = 'f1a7c3e9b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('generations', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('generations', 'heartbeat_at')
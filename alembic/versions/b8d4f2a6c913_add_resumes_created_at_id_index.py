@@ -0,0 +1,37 @@
+"""add resumes (created_at, id) index
+
+Revision ID: b8d4f2a6c913
+Revises: a3c9e5f1b7d2
+Create Date: 2026-10-18 20:11:52.904316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d4f2a6c913'
+down_revision: Union[str, Sequence[str], None] = 'a3c9e5f1b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY so building it does not block writes on a large table;
+    # it cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_resumes_created_at_id',
+            'resumes',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_resumes_created_at_id', table_name='resumes', postgresql_concurrently=True)
@@ -0,0 +1,48 @@
+"""add pending and running generation status
+
+Revision ID: c41e7b2f9a05
+Revises: 8f2c4a9d1b73
+Create Date: 2026-10-18 11:40:02.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7b2f9a05'
+down_revision: Union[str, Sequence[str], None] = '8f2c4a9d1b73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # New enum values cannot be used inside the transaction that adds them.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE generationstatus ADD VALUE IF NOT EXISTS 'PENDING'")
+        op.execute("ALTER TYPE generationstatus ADD VALUE IF NOT EXISTS 'RUNNING'")
+
+    op.create_index(
+        'ix_generations_pending',
+        'generations',
+        ['created_at'],
+        unique=False,
+        postgresql_where="status = 'PENDING'",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_generations_pending', table_name='generations')
+
+    # PostgreSQL cannot drop enum values, so rebuild the type without them.
+    op.execute("UPDATE generations SET status = 'FAILED' WHERE status IN ('PENDING', 'RUNNING')")
+    op.execute("ALTER TYPE generationstatus RENAME TO generationstatus_old")
+    op.execute("CREATE TYPE generationstatus AS ENUM ('COMPLETED', 'FAILED')")
+    op.execute(
+        "ALTER TABLE generations ALTER COLUMN status TYPE generationstatus "
+        "USING status::text::generationstatus"
+    )
+    op.execute("DROP TYPE generationstatus_old")
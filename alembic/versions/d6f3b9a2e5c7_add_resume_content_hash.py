@@ -0,0 +1,65 @@
+"""add resume content_hash
+
+Revision ID: d6f3b9a2e5c7
+Revises: b8d4f2a6c913
+Create Date: 2026-10-18 21:37:14.208519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f3b9a2e5c7'
+down_revision: Union[str, Sequence[str], None] = 'b8d4f2a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same expression as services.persistence_service.content_hash_sql
+CONTENT_HASH = "encode(sha256(convert_to(cleaned_data::text, 'UTF8')), 'hex')"
+
+# Every resume that is not the oldest copy of its content, with that oldest copy
+DUPLICATES = """
+    SELECT id, keeper_id FROM (
+        SELECT id, first_value(id) OVER (PARTITION BY content_hash ORDER BY created_at, id) AS keeper_id
+        FROM resumes
+        WHERE content_hash IS NOT NULL
+    ) AS ranked
+    WHERE id <> keeper_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resumes', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.execute(f"UPDATE resumes SET content_hash = {CONTENT_HASH} WHERE content_hash IS NULL")
+
+    # Keep the oldest copy of each resume; generations of the others move to it.
+    op.execute(f"""
+        UPDATE generations SET resume_id = duplicates.keeper_id
+        FROM ({DUPLICATES}) AS duplicates
+        WHERE generations.resume_id = duplicates.id
+    """)
+    op.execute(f"DELETE FROM resumes WHERE id IN (SELECT id FROM ({DUPLICATES}) AS duplicates)")
+
+    # CONCURRENTLY so building it does not block writes on a large table;
+    # it cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_resumes_content_hash',
+            'resumes',
+            ['content_hash'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Deduplicated resumes are not restored.
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_resumes_content_hash', table_name='resumes', postgresql_concurrently=True)
+    op.drop_column('resumes', 'content_hash')
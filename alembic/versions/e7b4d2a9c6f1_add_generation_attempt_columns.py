@@ -0,0 +1,30 @@
+"""add generation attempt columns
+
+Revision ID: e7b4d2a9c6f1
+Revises: 5d9a3e6c2f18
+Create Date: 2026-10-18 16:42:11.384920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b4d2a9c6f1'
+down_revision: Union[str, Sequence[str], None] = '5d9a3e6c2f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('generations', sa.Column('attempts', sa.Integer(), nullable=True))
+    op.add_column('generations', sa.Column('hedge_won', sa.Boolean(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('generations', 'hedge_won')
+    op.drop_column('generations', 'attempts')
@@ -0,0 +1,30 @@
+"""add generation lease columns
+
+Revision ID: f1a7c3e9b2d4
+Revises: d6f3b9a2e5c7
+Create Date: 2026-10-18 23:12:41.537902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c3e9b2d4'
+down_revision: Union[str, Sequence[str], None] = 'd6f3b9a2e5c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('generations', sa.Column('started_at', sa.DateTime(), nullable=True))
+    op.add_column('generations', sa.Column('run_after', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('generations', 'run_after')
+    op.drop_column('generations', 'started_at')
@@ -0,0 +1,105 @@
+"""
+Microbenchmark for utils.clean_text and clean_text_list against the
+previous implementation (module-level re.sub + NFC on every call).
+
+    python benchmarks/clean_text_bench.py
+    python benchmarks/clean_text_bench.py --number 20000 --json clean_text.json
+
+Outputs are checked for equality before anything is timed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import timeit
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import clean_text, clean_text_list  # noqa: E402
+
+
+def legacy_clean_text(s):
+    if s is None:
+        return None
+    t = " ".join(s.split())
+    if not t:
+        return None
+    t = re.sub(r"[\U00010000-\U0010FFFF]", "", t)
+    t = unicodedata.normalize("NFC", t)
+    return t or None
+
+
+def legacy_clean_list(values):
+    cleaned, seen = [], set()
+    for value in values:
+        if not value:
+            continue
+        value = legacy_clean_text(value)
+        if not value:
+            continue
+        if value.lower() in seen:
+            continue
+        seen.add(value.lower())
+        cleaned.append(value)
+    return cleaned
+
+
+CORPORA = {
+    "ascii_short": ["Python", "FastAPI", "PostgreSQL", "Acme Corp", "Senior Engineer"],
+    "ascii_bullet": [
+        "Built and operated a  high-throughput   ingestion pipeline processing 2M events/day "
+        "with p99 latency under 50ms across three regions.",
+    ],
+    "unicode_name": ["José Álvarez", "Zoë Ångström", "Nguyễn Văn An", "東京 エンジニア"],
+    "emoji_mixed": ["Rocket 🚀 launches", "Team player 🤝", "Data ✨ wrangling"],
+}
+
+
+def bench(fn, values, number: int) -> float:
+    """Best-of-5 nanoseconds per string."""
+    timer = timeit.Timer(lambda: [fn(value) for value in values])
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / (number * len(values)) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=5000, help="loops per timing run")
+    parser.add_argument("--json", type=Path, default=None, help="also write results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    for name, values in CORPORA.items():
+        for value in values:
+            assert clean_text(value) == legacy_clean_text(value), value
+
+        legacy = bench(legacy_clean_text, values, args.number)
+        current = bench(clean_text, values, args.number)
+        results[f"clean_text/{name}"] = {"legacy_ns": legacy, "current_ns": current, "speedup": legacy / current}
+
+    skills = [value for values in CORPORA.values() for value in values] * 10
+    assert clean_text_list(skills) == legacy_clean_list(skills)
+
+    legacy = min(timeit.repeat(lambda: legacy_clean_list(skills), repeat=5, number=args.number // 10))
+    current = min(timeit.repeat(lambda: clean_text_list(skills), repeat=5, number=args.number // 10))
+    results["clean_text_list/mixed"] = {
+        "legacy_ns": legacy / (args.number // 10 * len(skills)) * 1e9,
+        "current_ns": current / (args.number // 10 * len(skills)) * 1e9,
+        "speedup": legacy / current,
+    }
+
+    for name, result in results.items():
+        print(f"{name:<28} legacy {result['legacy_ns']:8.1f} ns  current {result['current_ns']:8.1f} ns  "
+              f"x{result['speedup']:.2f}")
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Round trips and latency for storing a resume with its generation.
+
+Compares the previous ORM path (session.add + flush for the resume, then
+create_generation; add_all + one flush for batches) with the single-statement
+CTE insert in services.persistence_service:
+
+    DATABASE_URL=postgresql+asyncpg://... python benchmarks/persistence_bench.py
+    python benchmarks/persistence_bench.py --database-url ... --rtt-ms 2 --json persistence.json
+
+Needs a migrated PostgreSQL database. Every write is rolled back. The
+CTE path also deduplicates on resumes.content_hash, so a resume it writes
+repeatedly is inserted once and then reused, as in production. Round
+trips are statements sent to the driver, counted with SQLAlchemy's
+before_cursor_execute event; --rtt-ms adds that much simulated network
+latency to each one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from config import settings  # noqa: E402
+from db import GenerationStatus, ResumeRecord  # noqa: E402
+from db.session import engine_options  # noqa: E402
+from models import ResumeIn  # noqa: E402
+from services import (  # noqa: E402
+    clean_and_validate_resume,
+    create_generation,
+    create_resume_with_generation,
+    create_resumes_with_generations,
+    new_resume_with_generation,
+    serialize_cleaned_data,
+)
+from services.ai_service import GenerationUsage  # noqa: E402
+from validation_bench import make_payload  # noqa: E402
+
+
+BATCH_SIZES = (10, 50, 500)
+
+MARKDOWN = "# Resume\n\n" + "- Shipped a thing that mattered\n" * 40
+USAGE = GenerationUsage(input_tokens=900, output_tokens=600, latency_ms=2400)
+
+
+class RoundTrips:
+    def __init__(self, rtt_ms: float):
+        self.count = 0
+        self.rtt = rtt_ms / 1000
+
+    def __call__(self, *_args) -> None:
+        self.count += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+
+async def orm_single(session: AsyncSession, resume_out) -> None:
+    resume_record = ResumeRecord(cleaned_data=serialize_cleaned_data(resume_out))
+    session.add(resume_record)
+    await session.flush()
+    await create_generation(
+        session,
+        resume_id=resume_record.id,
+        status=GenerationStatus.COMPLETED,
+        markdown_output=MARKDOWN,
+        ai_model="gpt-4o-mini",
+        usage=USAGE,
+    )
+
+
+async def cte_single(session: AsyncSession, resume_out) -> None:
+    await create_resume_with_generation(
+        session,
+        resume_out,
+        status=GenerationStatus.COMPLETED,
+        markdown_output=MARKDOWN,
+        ai_model="gpt-4o-mini",
+        usage=USAGE,
+    )
+
+
+def make_pairs(resume_outs):
+    return [
+        new_resume_with_generation(resume_out, GenerationStatus.COMPLETED, MARKDOWN, "gpt-4o-mini", usage=USAGE)
+        for resume_out in resume_outs
+    ]
+
+
+async def orm_bulk(session: AsyncSession, resume_outs) -> None:
+    session.add_all([record for pair in make_pairs(resume_outs) for record in pair])
+    await session.flush()
+
+
+async def cte_bulk(session: AsyncSession, resume_outs) -> None:
+    await create_resumes_with_generations(session, make_pairs(resume_outs))
+
+
+async def measure(engine, round_trips: RoundTrips, write, arg, number: int) -> dict[str, float]:
+    """Median ms and round trips per call; each call runs in its own rolled-back transaction."""
+    timings = []
+    trips = []
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        # Warm the connection and asyncpg's prepared statement cache first.
+        await write(session, arg)
+        await session.rollback()
+
+        for _ in range(number):
+            await session.begin()
+            before = round_trips.count
+            started = time.perf_counter()
+            await write(session, arg)
+            timings.append((time.perf_counter() - started) * 1000)
+            trips.append(round_trips.count - before)
+            await session.rollback()
+
+    return {"ms": statistics.median(timings), "round_trips": statistics.median(trips)}
+
+
+async def run(database_url: str, number: int, rtt_ms: float, seed: int) -> dict[str, dict[str, float]]:
+    engine = create_async_engine(database_url, **engine_options(database_url))
+    round_trips = RoundTrips(rtt_ms)
+    event.listen(engine.sync_engine, "before_cursor_execute", round_trips)
+
+    rng = random.Random(seed)
+    resume_outs = [
+        clean_and_validate_resume(ResumeIn.model_validate(make_payload(rng, index, 3, 5, 12)))
+        for index in range(max(BATCH_SIZES))
+    ]
+
+    results = {}
+    try:
+        results["single"] = {
+            "orm": await measure(engine, round_trips, orm_single, resume_outs[0], number),
+            "cte": await measure(engine, round_trips, cte_single, resume_outs[0], number),
+        }
+        for size in BATCH_SIZES:
+            batch = resume_outs[:size]
+            results[f"bulk_{size}"] = {
+                "orm": await measure(engine, round_trips, orm_bulk, batch, max(1, number // size)),
+                "cte": await measure(engine, round_trips, cte_bulk, batch, max(1, number // size)),
+            }
+    finally:
+        await engine.dispose()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="defaults to DATABASE_URL")
+    parser.add_argument("--number", type=int, default=200, help="single-pair writes per path")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="simulated network latency per round trip")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", type=Path, default=None, help="also write results to this file")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("a PostgreSQL database is required (--database-url or DATABASE_URL)")
+
+    results = asyncio.run(run(args.database_url, max(1, args.number), args.rtt_ms, args.seed))
+
+    for name, paths in results.items():
+        orm, cte = paths["orm"], paths["cte"]
+        print(f"{name:<9} orm {orm['round_trips']:4.0f} trips {orm['ms']:8.2f} ms   "
+              f"cte {cte['round_trips']:4.0f} trips {cte['ms']:8.2f} ms   x{orm['ms'] / cte['ms']:.2f}")
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Lookup cost of utils.SkillIndex as the taxonomy grows.
+
+Builds synthetic taxonomies from the bundled one up to 50k+ aliases and
+times canonical() for known aliases and for misses, plus clean_skills over
+a 40-skill list with and without canonicalization:
+
+    python benchmarks/skill_index_bench.py
+    python benchmarks/skill_index_bench.py --sizes 1000 50000 200000 --json skill_index.json
+
+Per-lookup time should stay flat across sizes (one dict probe each).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import SkillIndex, clean_text_list, load_skill_index  # noqa: E402
+
+
+def synthetic_taxonomy(aliases: int, seed: int) -> dict[str, list[str]]:
+    """The bundled taxonomy plus generated skills, 5 aliases each, until `aliases` is reached."""
+    rng = random.Random(seed)
+    with open(Path(__file__).resolve().parent.parent / "utils" / "skill_taxonomy.json", encoding="utf-8") as f:
+        taxonomy: dict[str, list[str]] = json.load(f)
+
+    total = sum(1 + len(names) for names in taxonomy.values())
+    n = 0
+    while total < aliases:
+        stem = "".join(rng.choices(string.ascii_lowercase, k=8))
+        taxonomy[f"Skill{n} {stem.title()}"] = [f"sk{n}{stem}{variant}" for variant in "abcde"]
+        total += 6
+        n += 1
+    return taxonomy
+
+
+def per_call_ns(fn, values: list[str], number: int) -> float:
+    timer = timeit.Timer(lambda: [fn(value) for value in values])
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / (number * len(values)) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 5_000, 50_000, 200_000],
+                        help="alias counts to build (0 = bundled taxonomy only)")
+    parser.add_argument("--number", type=int, default=2000, help="loops per timing run")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", type=Path, default=None, help="also write results to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bundled = load_skill_index()
+    resume_skills = ["JS", "Python", "node js", "K8s", "postgres", "Haskell", "Terraform", "pyhton"] * 5
+
+    results = {}
+    for size in args.sizes:
+        taxonomy = synthetic_taxonomy(size, args.seed)
+        started = time.perf_counter()
+        index = SkillIndex(taxonomy)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        known = rng.choices([name for names in taxonomy.values() for name in names], k=200)
+        unknown = [f"unlisted skill {n}" for n in range(200)]
+
+        results[str(len(index))] = {
+            "aliases": len(index),
+            "canonical_skills": index.canonical_count,
+            "build_ms": build_ms,
+            "hit_ns": per_call_ns(index.canonical, known, args.number),
+            "miss_ns": per_call_ns(index.canonical, unknown, args.number),
+            "clean_skills_ns": per_call_ns(
+                lambda skill, index=index: clean_text_list([skill], canonical=index.canonical),
+                resume_skills,
+                args.number,
+            ),
+        }
+
+    plain = per_call_ns(lambda skill: clean_text_list([skill]), resume_skills, args.number)
+
+    print(f"bundled taxonomy: {len(bundled)} aliases / {bundled.canonical_count} skills")
+    print(f"clean_text_list without an index: {plain:8.1f} ns/skill")
+    for result in results.values():
+        print(f"{result['aliases']:>8} aliases  build {result['build_ms']:8.1f} ms  "
+              f"hit {result['hit_ns']:6.1f} ns  miss {result['miss_ns']:6.1f} ns  "
+              f"clean_skills {result['clean_skills_ns']:7.1f} ns/skill")
+
+    if args.json is not None:
+        args.json.write_text(json.dumps({"plain_clean_ns": plain, "results": results}, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Benchmark suite for the validation pipeline.
+
+Builds synthetic ResumeIn corpora, from typical submissions to pathological
+ones, and times clean_and_validate_resume plus each cleaner on its own:
+
+    python benchmarks/validation_bench.py --json baseline.json
+    # ... change validations/* or utils/utils.py ...
+    python benchmarks/validation_bench.py --compare baseline.json
+
+With --compare the run exits 1 if a stage's best (--statistic min, the
+default) or median time is more than `threshold` (fractional) slower than
+in the baseline file, in the first run and in each of --confirm-runs
+reruns of the corpora that regressed. One noisy run does not fail the gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import ResumeIn  # noqa: E402
+from services import clean_and_validate_resume  # noqa: E402
+from utils import clean_skills, clean_urls, date_cache  # noqa: E402
+from validations import (  # noqa: E402
+    clean_certifications,
+    clean_education,
+    clean_experience,
+    phone_cache,
+    to_e164,
+)
+
+
+FIRST_NAMES = ["John", "Ada", "Grace", "Alan", "Linus", "Margaret", "Dennis", "Barbara"]
+UNICODE_NAMES = ["Zoë Ångström", "José Álvarez-Núñez", "Nguyễn Văn An", "Søren Kierkegård", "Đặng Thị Mỹ", "東京 太郎"]
+COMPANIES = ["acme corp", "globex", "initech", "umbrella", "hooli", "stark industries"]
+POSITIONS = ["software engineer", "senior backend engineer", "staff engineer", "tech lead"]
+SKILLS = ["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "Redis", "AWS", "Terraform", "Go", "React"]
+BULLET_WORDS = (
+    "built operated scaled migrated designed reduced latency throughput pipeline service api "
+    "database cache queue cluster region customers revenue reliability incidents on-call"
+).split()
+UNICODE_WORDS = ["café", "naïve", "résumé", "façade", "Zürich", "São Paulo", "🚀", "✨", "日本語"]
+
+# Memoized cleaner results; cleared before every timed run of a cold stage
+MEMO_CACHES = (date_cache, phone_cache)
+
+
+def bullet(rng: random.Random, words: int, unicode_share: float) -> str:
+    picked = [
+        rng.choice(UNICODE_WORDS) if rng.random() < unicode_share else rng.choice(BULLET_WORDS)
+        for _ in range(words)
+    ]
+    return "  ".join(picked).capitalize()
+
+
+def make_payload(
+    rng: random.Random,
+    index: int,
+    experiences: int,
+    bullets: int,
+    skills: int,
+    unicode_share: float = 0.0,
+) -> dict[str, Any]:
+    name_pool = UNICODE_NAMES if unicode_share else FIRST_NAMES
+    start_year = 2024 - experiences
+
+    return {
+        "name": f"Dr. {rng.choice(name_pool)} {rng.choice(name_pool)}",
+        "email": f"  Person{index}@Example.COM ",
+        "phone": f"+1816555{index % 10000:04d}",
+        "location": {"country": "united states", "state": "missouri", "city": "kansas city"},
+        "urls": [f"https://github.com/user{index}", f"HTTPS://LinkedIn.com/in/user{index}/", f"https://github.com/user{index}/"],
+        "experience": [
+            {
+                "company": rng.choice(COMPANIES),
+                "position": [rng.choice(POSITIONS), rng.choice(POSITIONS)],
+                "start_date": f"{start_year + n}-0{rng.randint(1, 9)}-15",
+                "end_date": f"{start_year + n + 1}-0{rng.randint(1, 9)}-01",
+                "description": [bullet(rng, 18, unicode_share) for _ in range(bullets)],
+                "location": "kansas city, mo",
+            }
+            for n in range(experiences)
+        ],
+        "skills": [
+            f"{rng.choice(SKILLS)} {n // len(SKILLS)}" if skills > len(SKILLS) else rng.choice(SKILLS)
+            for n in range(skills)
+        ],
+        "education": [
+            {"school": "university of missouri", "degree": "b.s. computer science",
+             "start_date": "2010-08-20", "graduation_date": "2014-05-15", "gpa": 3.6},
+        ],
+        "certifications": [
+            {"name": "AWS Certified Developer", "issuer": "amazon web services",
+             "issue_date": "2021-03-01", "expiry_date": "2024-03-01",
+             "credential_id": f" ABC-{index} ", "verification_url": "https://aws.amazon.com/verify"},
+        ],
+    }
+
+
+# name -> (resumes, experiences, bullets per experience, skills, unicode share)
+CORPORA: dict[str, tuple[int, int, int, int, float]] = {
+    "typical": (50, 3, 5, 12, 0.0),
+    "senior": (20, 12, 8, 40, 0.0),
+    "unicode_heavy": (50, 3, 5, 12, 0.4),
+    "long_skills": (20, 2, 3, 500, 0.0),
+    "pathological": (3, 50, 20, 300, 0.1),
+}
+
+
+def build_corpus(name: str, seed: int) -> list[dict[str, Any]]:
+    count, experiences, bullets, skills, unicode_share = CORPORA[name]
+    rng = random.Random(f"{seed}:{name}")
+    return [make_payload(rng, n, experiences, bullets, skills, unicode_share) for n in range(count)]
+
+
+def time_stage(fn: Callable[[], Any], calls: int, repeat: int, setup: Callable[[], None] | None = None) -> dict[str, float]:
+    """Microseconds per call over `repeat` runs of `fn` (which makes `calls` calls)."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter_ns()
+        fn()
+        samples.append((time.perf_counter_ns() - started) / 1000 / calls)
+
+    return {
+        "median_us": statistics.median(samples),
+        "min_us": min(samples),
+        "mean_us": statistics.fmean(samples),
+        "stdev_us": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def clear_memo_caches() -> None:
+    for cache in MEMO_CACHES:
+        cache.clear()
+
+
+def bench_corpus(payloads: list[dict[str, Any]], repeat: int) -> dict[str, dict[str, float]]:
+    resumes = [ResumeIn.model_validate(payload) for payload in payloads]
+    n = len(resumes)
+    url_lists = [[str(url) for url in resume.urls or []] for resume in resumes]
+    phones = [resume.phone for resume in resumes]
+
+    def each(fn: Callable[[Any], Any], items: list[Any]) -> Callable[[], None]:
+        def run() -> None:
+            for item in items:
+                fn(item)
+        return run
+
+    def cold(fn: Callable[[Any], Any], items: list[Any]) -> dict[str, float]:
+        return time_stage(each(fn, items), n, repeat, setup=clear_memo_caches)
+
+    # Every stage but to_e164_cached starts from empty memo caches, so no
+    # run is sped up by what an earlier run or stage left behind.
+    stages = {
+        "parse_resume_in": cold(ResumeIn.model_validate, payloads),
+        "clean_and_validate_resume": cold(clean_and_validate_resume, resumes),
+        "clean_experience": cold(clean_experience, [r.experience for r in resumes]),
+        "clean_education": cold(clean_education, [r.education for r in resumes]),
+        "clean_certifications": cold(clean_certifications, [r.certifications for r in resumes]),
+        "clean_urls": cold(clean_urls, url_lists),
+        "clean_skills": cold(clean_skills, [r.skills for r in resumes]),
+        "to_e164": cold(to_e164, phones),
+        "to_e164_cached": time_stage(each(to_e164, phones), n, repeat),
+    }
+    clear_memo_caches()
+    return stages
+
+
+def run(corpora: list[str], repeat: int, seed: int) -> dict[str, Any]:
+    results = {}
+    for name in corpora:
+        results[name] = bench_corpus(build_corpus(name, seed), repeat)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float, statistic: str) -> set[tuple[str, str]]:
+    """Print per-stage ratios of `statistic` against the baseline and return the regressed (corpus, stage)s."""
+    key = f"{statistic}_us"
+    regressions = set()
+    for corpus, stages in current["results"].items():
+        for stage, stats in stages.items():
+            base = baseline.get("results", {}).get(corpus, {}).get(stage)
+            if base is None:
+                continue
+
+            ratio = stats[key] / base[key]
+            marker = "REGRESSION" if ratio > 1 + threshold else ""
+            print(f"{corpus:<14} {stage:<26} {base[key]:10.1f} -> {stats[key]:10.1f} us  x{ratio:5.2f} {marker}")
+            if marker:
+                regressions.add((corpus, stage))
+    return regressions
+
+
+def confirmed_regressions(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+    statistic: str,
+    confirm_runs: int,
+    seed: int,
+    ) -> list[str]:
+    """
+    Stages that regress in `report` and again in each of `confirm_runs`
+    reruns of their corpora; a stage that recovers in any rerun is noise.
+    """
+    regressions = compare(report, baseline, threshold, statistic)
+    repeat = report["meta"]["repeat"]
+
+    for attempt in range(confirm_runs):
+        if not regressions:
+            break
+
+        corpora = sorted({corpus for corpus, _ in regressions})
+        print(f"Confirming {len(regressions)} regression(s), rerun {attempt + 1}/{confirm_runs}: {', '.join(corpora)}")
+        regressions &= compare(run(corpora, repeat, seed), baseline, threshold, statistic)
+
+    return sorted(f"{corpus}/{stage}" for corpus, stage in regressions)
+
+
+def print_results(report: dict[str, Any]) -> None:
+    for corpus, stages in report["results"].items():
+        print(f"[{corpus}]")
+        for stage, stats in stages.items():
+            print(f"  {stage:<26} median {stats['median_us']:10.1f} us  min {stats['min_us']:10.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", action="append", choices=sorted(CORPORA), help="run only these corpora (repeatable)")
+    parser.add_argument("--repeat", type=int, default=31, help="timed runs per stage")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", type=Path, default=None, help="write results to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON from an earlier --json run")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed fractional slowdown per stage")
+    parser.add_argument("--statistic", choices=("min", "median"), default="min", help="per-stage time compared")
+    parser.add_argument("--confirm-runs", type=int, default=2, help="reruns a regression must survive to fail")
+    args = parser.parse_args()
+
+    report = run(args.corpus or list(CORPORA), max(1, args.repeat), args.seed)
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.compare is None:
+        print_results(report)
+        return
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    regressions = confirmed_regressions(
+        report, baseline, args.threshold, args.statistic, max(0, args.confirm_runs), args.seed
+    )
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
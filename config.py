@@ -14,9 +14,23 @@ class Settings:
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
 
+    # Re-validate output models built from cleaned data (slower; on in tests)
+    STRICT_MODEL_VALIDATION: bool = os.getenv("STRICT_MODEL_VALIDATION", str(DEBUG)).lower() == "true"
+
     # Database Settings (when I add the database)
     DATABASE_URL: str | None = os.getenv("DATABASE_URL")
 
+    # Connection pool per app process; size it from /api/v1/metrics/db-pool
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds, -1 disables
+    # Costs a round trip per checkout; only needed when the server or a proxy
+    # drops idle connections sooner than DB_POOL_RECYCLE
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "False").lower() == "true"
+    # asyncpg prepared statement caches (0 behind PgBouncer in transaction mode)
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
     # File Upload Settings
     MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", "10485760"))  # 10MB
     ALLOWED_EXTENSIONS: set = {".pdf", ".docx", ".txt"}
@@ -24,6 +38,64 @@ class Settings:
     # OpenAI Settings
     OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    # Point at scripts/fake_openai_server.py (e.g. http://127.0.0.1:9100/v1) for load tests
+    OPENAI_BASE_URL: str | None = os.getenv("OPENAI_BASE_URL")
+
+    # Local OpenAI budgets (0 disables a budget) and circuit breaker
+    OPENAI_REQUESTS_PER_MINUTE: int = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+    OPENAI_TOKENS_PER_MINUTE: int = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
+    OPENAI_RATE_LIMIT_QUEUE_SIZE: int = int(os.getenv("OPENAI_RATE_LIMIT_QUEUE_SIZE", "100"))
+    OPENAI_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("OPENAI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    OPENAI_CIRCUIT_RESET_SECONDS: float = float(os.getenv("OPENAI_CIRCUIT_RESET_SECONDS", "30"))
+
+    # OpenAI deadlines, retries (exponential backoff with full jitter) and hedging
+    OPENAI_TIMEOUT_SECONDS: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "30"))
+    OPENAI_TOTAL_TIMEOUT_SECONDS: float = float(os.getenv("OPENAI_TOTAL_TIMEOUT_SECONDS", "90"))
+    OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+    OPENAI_RETRY_BASE_DELAY: float = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "0.5"))
+    OPENAI_RETRY_MAX_DELAY: float = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "8"))
+    OPENAI_HEDGE_ENABLED: bool = os.getenv("OPENAI_HEDGE_ENABLED", "False").lower() == "true"
+    OPENAI_HEDGE_PERCENTILE: float = float(os.getenv("OPENAI_HEDGE_PERCENTILE", "95"))
+    OPENAI_HEDGE_MIN_SAMPLES: int = int(os.getenv("OPENAI_HEDGE_MIN_SAMPLES", "20"))
+
+    # Resume listing totals: default strategy for ?skip= pages and the TTL of
+    # the "cached" strategy's exact count
+    RESUME_COUNT_STRATEGY: str = os.getenv("RESUME_COUNT_STRATEGY", "exact").lower()
+    RESUME_COUNT_CACHE_TTL_SECONDS: float = float(os.getenv("RESUME_COUNT_CACHE_TTL_SECONDS", "60"))
+
+    # Generation cache (0 disables the in-process tier)
+    GENERATION_CACHE_SIZE: int = int(os.getenv("GENERATION_CACHE_SIZE", "256"))
+
+    # Async generation jobs ("memory" or "database" queue backend)
+    GENERATION_WORKERS: int = int(os.getenv("GENERATION_WORKERS", "2"))
+    GENERATION_QUEUE_BACKEND: str = os.getenv("GENERATION_QUEUE_BACKEND", "memory").lower()
+    GENERATION_QUEUE_POLL_INTERVAL: float = float(os.getenv("GENERATION_QUEUE_POLL_INTERVAL", "1.0"))
+    # RUNNING jobs whose lease was not renewed for this long are assumed
+    # orphaned and requeued; workers renew every third of it
+    GENERATION_JOB_LEASE_SECONDS: float = float(os.getenv("GENERATION_JOB_LEASE_SECONDS", "300"))
+
+    # Batch generation
+    GENERATION_BATCH_CONCURRENCY: int = int(os.getenv("GENERATION_BATCH_CONCURRENCY", "8"))
+    GENERATION_BATCH_MAX_ITEMS: int = int(os.getenv("GENERATION_BATCH_MAX_ITEMS", "500"))
+
+    # Memoized phone normalization (0 disables the cache)
+    PHONE_CACHE_SIZE: int = int(os.getenv("PHONE_CACHE_SIZE", "10000"))
+
+    # Memoized free-form date parsing (0 disables the cache)
+    DATE_CACHE_SIZE: int = int(os.getenv("DATE_CACHE_SIZE", "4096"))
+
+    # Skill alias taxonomy JSON ({canonical: [aliases]}); unset uses the bundled
+    # utils/skill_taxonomy.json, an empty value disables canonicalization
+    SKILL_TAXONOMY_PATH: str | None = os.getenv("SKILL_TAXONOMY_PATH")
+
+    # NDJSON batch validation; longer lines are rejected per record
+    VALIDATION_BATCH_MAX_LINE_BYTES: int = int(os.getenv("VALIDATION_BATCH_MAX_LINE_BYTES", "1048576"))
+
+    # Off-loop validation: "none", "thread" or "process" pool; single payloads
+    # are offloaded once they have this many list entries, batches always are
+    VALIDATION_EXECUTOR: str = os.getenv("VALIDATION_EXECUTOR", "none").lower()
+    VALIDATION_EXECUTOR_WORKERS: int = int(os.getenv("VALIDATION_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+    VALIDATION_OFFLOAD_MIN_ITEMS: int = int(os.getenv("VALIDATION_OFFLOAD_MIN_ITEMS", "150"))
 
     # APP KEY ONLY WHILE THIS IS BACKEND ONLY API
     APP_API_KEY: str | None = os.getenv("APP_API_KEY")
@@ -1,5 +1,5 @@
 from db.models import Base, ResumeRecord, GenerationRecord, GenerationStatus
-from db.session import get_db, dispose_db, init_db
+from db.session import get_db, dispose_db, init_db, is_db_configured, pool_metrics, pool_stats, session_scope
 
 __all__ = [
     "Base",
@@ -8,5 +8,9 @@ __all__ = [
     "GenerationStatus",
     "get_db",
     "dispose_db", 
-    "init_db"
+    "init_db",
+    "is_db_configured",
+    "pool_metrics",
+    "pool_stats",
+    "session_scope",
 ]
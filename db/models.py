@@ -2,9 +2,9 @@ from __future__ import annotations
 
 
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import DateTime, String, Text, func, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, func, text, ForeignKey, Enum as SQLEnum
 import uuid
 import enum
 
@@ -12,11 +12,19 @@ class Base(DeclarativeBase):
     pass
 
 class GenerationStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
 
 class ResumeRecord(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Keyset pagination walks (created_at, id) backwards
+        Index("ix_resumes_created_at_id", "created_at", "id"),
+        # Identical cleaned_data is stored once; inserts upsert on this
+        Index("uq_resumes_content_hash", "content_hash", unique=True),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
@@ -26,6 +34,12 @@ class ResumeRecord(Base):
 
     cleaned_data: Mapped[dict] = mapped_column(JSONB)
 
+    # SHA-256 hex of cleaned_data's canonical jsonb text (content_hash_sql)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # Sections whose cleaned value the last PATCH actually changed
+    changed_sections: Mapped[list[str] | None] = mapped_column(ARRAY(String), nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
         server_default=func.now(),
@@ -44,6 +58,10 @@ class ResumeRecord(Base):
 
 class GenerationRecord(Base):
     __tablename__ = "generations"
+    __table_args__ = (
+        # Workers claim the oldest PENDING job; the enum stores member names
+        Index("ix_generations_pending", "created_at", postgresql_where=text("status = 'PENDING'")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -64,6 +82,35 @@ class GenerationRecord(Base):
 
     ai_model: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
+    cache_key: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        index=True,
+    )
+
+    input_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    output_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    cached_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    ttft_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    attempts: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    hedge_won: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+
+    # Job queue bookkeeping: when a worker claimed the row (also the claim's
+    # fencing token), when that worker last renewed its lease, and the
+    # earliest time a requeued PENDING row may be claimed again
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    run_after: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
         server_default=func.now(),
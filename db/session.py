@@ -1,10 +1,97 @@
 from __future__ import annotations
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 from fastapi import HTTPException   
 
+from sqlalchemy import exc, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import settings
 
+# Upper bounds of the connection wait histogram buckets, in milliseconds
+POOL_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """How long checkouts wait for a connection, and how many time out."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.acquired = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self._buckets = [0] * (len(POOL_WAIT_BUCKETS_MS) + 1)
+
+    def observe(self, wait_ms: float) -> None:
+        self.acquired += 1
+        self.wait_ms_total += wait_ms
+        self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        self._buckets[bisect_left(POOL_WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def stats(self) -> dict[str, Any]:
+        # Cumulative, Prometheus style: le_<ms> counts waits at or under the bound
+        histogram: dict[str, int] = {}
+        running = 0
+        for bound, count in zip((*POOL_WAIT_BUCKETS_MS, None), self._buckets):
+            running += count
+            histogram["le_inf" if bound is None else f"le_{bound}ms"] = running
+
+        return {
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "wait_ms_avg": self.wait_ms_total / self.acquired if self.acquired else 0.0,
+            "wait_ms_max": self.wait_ms_max,
+            "wait_ms_histogram": histogram,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times every checkout: the wait for a free
+    connection, or for a new one to connect when the pool can still grow.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+
+        pool_metrics.observe((time.perf_counter() - started) * 1000)
+        return connection
+
+
+def engine_options(database_url: str) -> dict[str, Any]:
+    """create_async_engine keyword arguments built from the DB_* settings."""
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        # asyncpg's own statement cache and SQLAlchemy's prepared statement cache
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+
+    return options
+
 _engine: AsyncEngine | None = None
 _async_session_local: async_sessionmaker[AsyncSession] | None = None
 
@@ -18,7 +105,7 @@ def init_db():
     if not settings.DATABASE_URL: 
         return 
 
-    _engine = create_async_engine(settings.DATABASE_URL)
+    _engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
     _async_session_local = async_sessionmaker(
         _engine,
@@ -44,4 +131,39 @@ async def get_db():
     async with _async_session_local() as session:
         yield session
 
- 
\ No newline at end of file
+
+def is_db_configured() -> bool:
+    return _async_session_local is not None
+
+
+def pool_stats() -> dict[str, Any] | None:
+    """Live pool occupancy plus checkout wait metrics, or None without a database."""
+    if _engine is None:
+        return None
+
+    pool = _engine.pool
+    # QueuePool.overflow() counts up from -pool_size as connections are opened
+    opened = pool.size() + pool.overflow()
+
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "connections": max(0, opened),
+        **pool_metrics.stats(),
+    }
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """
+    Standalone session for work that outlives the request dependency
+    (streaming bodies, background workers).
+    """
+    if _async_session_local is None:
+        raise RuntimeError("Database not configured")
+
+    async with _async_session_local() as session:
+        yield session
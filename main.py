@@ -4,9 +4,17 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from db import dispose_db, init_db
+from db import dispose_db, init_db, is_db_configured
 from config import settings
-from routes.routes import router as resume_router
+from routes.routes import get_ai_service, router as resume_router
+from routes.metrics import router as metrics_router
+from services import (
+    default_count_strategy,
+    start_generation_workers,
+    start_validation_executor,
+    stop_generation_workers,
+    stop_validation_executor,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,10 +22,16 @@ logging.basicConfig(
 )
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    default_count_strategy()
     init_db()
+    await start_validation_executor()
+    if is_db_configured() and settings.OPENAI_API_KEY:
+        await start_generation_workers(get_ai_service())
     try:
         yield
     finally:
+        await stop_generation_workers()
+        await stop_validation_executor()
         await dispose_db()
 
 app = FastAPI(title="Resume Builder API",lifespan=lifespan)
@@ -31,6 +45,7 @@ app.add_middleware(
 )
 
 app.include_router(resume_router)
+app.include_router(metrics_router)
 
 @app.get("/api/health")
 async def health():
@@ -1,16 +1,34 @@
-from .resume import ResumeIn, ResumeOut, PhoneIn, PhoneOut, ResumeItem, PaginatedResumesResponse
+from .resume import (
+    ResumeIn,
+    ResumeOut,
+    ResumePatch,
+    ResumePatchOut,
+    PhoneIn,
+    PhoneOut,
+    ResumeItem,
+    CountStrategy,
+    ListingMode,
+    PaginatedResumesResponse,
+)
 from .location import LocationBase, LocationIn, LocationOut
 from .experience import ExperienceBase, ExperienceIn, ExperienceOut
 from .education import EducationBase, EducationIn, EducationOut
 from .certification import CertificationBase, CertificationIn, CertificationOut
+from .generation import GenerationJobOut, GenerationOut, GenerationModelMetrics, GenerationMetricsResponse
+from .trusted import build_trusted
+from .dates import MonthDate, OptionalMonthDate, format_month
 
 __all__ = [
     # Resume
     "ResumeIn",
     "ResumeOut",
+    "ResumePatch",
+    "ResumePatchOut",
     "PhoneIn",
     "PhoneOut",
     "ResumeItem",
+    "CountStrategy",
+    "ListingMode",
     "PaginatedResumesResponse",
     # Location
     "LocationBase",
@@ -28,5 +46,16 @@ __all__ = [
     "CertificationBase",
     "CertificationIn",
     "CertificationOut",
+    # Generation
+    "GenerationJobOut",
+    "GenerationOut",
+    "GenerationModelMetrics",
+    "GenerationMetricsResponse",
+    # Construction
+    "build_trusted",
+    # Dates
+    "MonthDate",
+    "OptionalMonthDate",
+    "format_month",
 ]
 
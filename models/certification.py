@@ -2,6 +2,8 @@ from __future__ import annotations
 from pydantic import BaseModel, HttpUrl, Field, field_serializer
 from datetime import date
 
+from .dates import OptionalMonthDate, format_month
+
 
 class CertificationBase(BaseModel):
     """
@@ -11,8 +13,8 @@ class CertificationBase(BaseModel):
 
     name: str = Field(min_length=1)
     issuer: str = Field(min_length=1)
-    issue_date: date | None = None
-    expiry_date: date | None = None
+    issue_date: OptionalMonthDate = None
+    expiry_date: OptionalMonthDate = None
     credential_id: str | None = None
     verification_url: HttpUrl | None = None  
 
@@ -25,5 +27,5 @@ class CertificationOut(CertificationBase):
     """Clean, validated certification data ready for output or AI processing."""
 
     @field_serializer("issue_date", "expiry_date")
-    def _ym(self, v: date | None, _info) -> str | None:
-        return None if v is None else v.strftime("%Y-%m")
\ No newline at end of file
+    def _ym(self, v: date | None) -> str | None:
+        return format_month(v)
\ No newline at end of file
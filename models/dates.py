@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Annotated, Any
+
+from pydantic import BeforeValidator
+
+from utils import is_present_date, parse_month
+
+
+def parse_month_date(value: Any) -> Any:
+    """
+    Accept the month-level strings resumes use ("Jan 2020", "01/2020",
+    "2020-01", "Present") for date fields. Anything else, including what
+    clean_date's fuzzy fallback would guess at, is passed through unchanged
+    so Pydantic reports its usual date error.
+    """
+    if not isinstance(value, str):
+        return value
+    if is_present_date(value):
+        return None
+
+    parsed = parse_month(value)
+    return parsed if parsed is not None else value
+
+
+def format_month(value: date | None) -> str | None:
+    """Serialize a date as YYYY-MM; slicing isoformat() is several times faster than strftime."""
+    return None if value is None else value.isoformat()[:7]
+
+
+# Date fields that also take month-level strings, normalized to the 1st.
+# The validator wraps the whole Optional so "Present" can become None.
+MonthDate = Annotated[date, BeforeValidator(parse_month_date)]
+OptionalMonthDate = Annotated[date | None, BeforeValidator(parse_month_date)]
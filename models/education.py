@@ -3,6 +3,8 @@ from typing import Annotated
 from datetime import date
 from pydantic import BaseModel, Field, field_serializer
 
+from .dates import OptionalMonthDate, format_month
+
 
 class EducationBase(BaseModel):
     """
@@ -12,8 +14,8 @@ class EducationBase(BaseModel):
 
     school: Annotated[str, Field(min_length=1)]
     degree: str | None = None
-    start_date: date | None = None 
-    graduation_date: date | None = None
+    start_date: OptionalMonthDate = None
+    graduation_date: OptionalMonthDate = None
     gpa: float | None = Field(default=None, ge=0.0, le=4.0)
 
 
@@ -26,6 +28,6 @@ class EducationOut(EducationBase):
     graduation_date: date | None = None  
 
     @field_serializer("start_date", "graduation_date")
-    def _ym(self, v: date | None, _info) -> str | None:
-        return None if v is None else v.strftime("%Y-%m")
+    def _ym(self, v: date | None) -> str | None:
+        return format_month(v)
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 from datetime import date
 from pydantic import BaseModel, Field, field_serializer
 
+from .dates import MonthDate, OptionalMonthDate, format_month
+
 
 class ExperienceBase(BaseModel):
     """
@@ -11,8 +13,8 @@ class ExperienceBase(BaseModel):
 
     company: str = Field(min_length=1)
     position: list[str] = Field(min_length=1)
-    start_date: date
-    end_date: date | None = None
+    start_date: MonthDate
+    end_date: OptionalMonthDate = None
     description: list[str] = Field(default_factory=list)
     location: str | None = None
 
@@ -34,6 +36,6 @@ class ExperienceOut(ExperienceBase):
     end_date: date | None = None  
 
     @field_serializer("start_date", "end_date")
-    def _ym(self, v: date | None, _info) -> str | None:
-        return None if v is None else v.strftime("%Y-%m")
+    def _ym(self, v: date | None) -> str | None:
+        return format_month(v)
 
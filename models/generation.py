@@ -0,0 +1,56 @@
+from __future__ import annotations
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict
+
+from db.models import GenerationStatus
+
+
+class GenerationJobOut(BaseModel):
+    """Returned when an async generation job is accepted."""
+
+    generation_id: UUID
+    resume_id: UUID
+    status: GenerationStatus
+
+
+class GenerationOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    resume_id: UUID
+    status: GenerationStatus
+    markdown_output: str | None = None
+    ai_model: str | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cached_tokens: int | None = None
+    latency_ms: int | None = None
+    ttft_ms: int | None = None
+    attempts: int | None = None
+    hedge_won: bool | None = None
+    created_at: datetime
+
+
+class GenerationModelMetrics(BaseModel):
+    """Aggregated latency and token usage for one model."""
+
+    ai_model: str | None = None
+    generations: int
+    upstream_calls: int
+    latency_ms_p50: float | None = None
+    latency_ms_p95: float | None = None
+    latency_ms_p99: float | None = None
+    ttft_ms_p50: float | None = None
+    ttft_ms_p95: float | None = None
+    ttft_ms_p99: float | None = None
+    input_tokens: int
+    output_tokens: int
+    cached_tokens: int
+    retried: int
+    hedge_wins: int
+
+
+class GenerationMetricsResponse(BaseModel):
+    window_hours: int
+    models: list[GenerationModelMetrics]
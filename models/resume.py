@@ -1,8 +1,9 @@
 from __future__ import annotations
+import enum
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
-from pydantic import BaseModel, ConfigDict, EmailStr, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, HttpUrl, Field, model_validator
 
 
 
@@ -89,6 +90,47 @@ class ResumeOut(BaseModel):
     ) 
 
 
+class ResumePatch(BaseModel):
+    """
+    Partial resume update. Only the sections present in the body are
+    re-cleaned and written; each one replaces the stored section whole.
+    Optional sections can be cleared with null.
+    """
+
+    name: str | None = Field(default=None, min_length=1)
+    email: EmailStr | None = None
+    phone: PhoneIn | None = None
+    location: LocationIn | None = None
+    urls: list[HttpUrl] | None = None
+    experience: list[ExperienceIn] | None = None
+    skills: Annotated[list[str], Field(min_length=1)] | None = None
+    education: list[EducationIn] | None = None
+    certifications: list[CertificationIn] | None = None
+
+    model_config = {"extra": "forbid"}
+
+    @model_validator(mode="after")
+    def _check_sections(self) -> "ResumePatch":
+        if not self.model_fields_set:
+            raise ValueError("At least one section is required.")
+
+        for section in ("name", "email", "phone", "skills"):
+            if section in self.model_fields_set and getattr(self, section) is None:
+                raise ValueError(f"{section} can not be removed.")
+        return self
+
+
+class ResumePatchOut(BaseModel):
+    """Result of a PATCH: the re-cleaned sections and which of them actually changed."""
+
+    id: UUID
+    updated_at: datetime
+    changed_sections: list[str]
+    cleaned: dict[str, Any]
+    warnings: list[str] = Field(default_factory=list)
+    generation_id: UUID | None = None
+
+
 class ResumeItem(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -97,12 +139,31 @@ class ResumeItem(BaseModel):
     updated_at: datetime
 
 
+class CountStrategy(str, enum.Enum):
+    """How a listing total is produced."""
+
+    EXACT = "exact"  # count(*) on every request
+    ESTIMATED = "estimated"  # PostgreSQL planner statistics (pg_class.reltuples)
+    CACHED = "cached"  # exact count(*) reused for a TTL, refreshed in the background
+
+
+class ListingMode(str, enum.Enum):
+    """How GET /api/v1/resume/ pages through resumes."""
+
+    OFFSET = "offset"  # skip + limit, with a total
+    CURSOR = "cursor"  # keyset pages via next_cursor
+
+
 class PaginatedResumesResponse(BaseModel): 
     items: list[ResumeItem]
-    total: int
-    skip: int
+    total: int | None = None
+    total_strategy: CountStrategy | None = None
+    skip: int | None = None
     limit: int
     has_more: bool
+    # Opaque keyset cursor for the next page; None on the last page
+    next_cursor: str | None = None
 
 ResumeIn.model_rebuild()
 ResumeOut.model_rebuild()
+ResumePatch.model_rebuild()
@@ -0,0 +1,80 @@
+from datetime import timedelta
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import get_db, pool_stats
+from models import GenerationMetricsResponse
+from routes.routes import get_ai_service, verify_api_key
+from services import (
+    AIService,
+    generation_cache,
+    generation_flight,
+    get_generation_metrics,
+    get_validation_executor,
+)
+from validations import phone_cache
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["Metrics"])
+
+
+@router.get("/generation-cache")
+async def generation_cache_metrics(
+    _: None = Depends(verify_api_key),
+) -> dict[str, int | float]:
+    return generation_cache.stats()
+
+
+@router.get("/generation-coalescing")
+async def generation_coalescing_metrics(
+    _: None = Depends(verify_api_key),
+) -> dict[str, int]:
+    return generation_flight.stats()
+
+
+@router.get("/phone-cache")
+async def phone_cache_metrics(
+    _: None = Depends(verify_api_key),
+) -> dict[str, int | float]:
+    return phone_cache.stats()
+
+
+@router.get("/validation-executor")
+async def validation_executor_metrics(
+    _: None = Depends(verify_api_key),
+) -> dict[str, Any]:
+    executor = get_validation_executor()
+    if executor is None:
+        return {"mode": "none"}
+    return executor.stats()
+
+
+@router.get("/db-pool")
+async def db_pool_metrics(
+    _: None = Depends(verify_api_key),
+) -> dict[str, Any]:
+    stats = pool_stats()
+    if stats is None:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    return stats
+
+
+@router.get("/ai-service")
+async def ai_service_metrics(
+    ai_service: AIService = Depends(get_ai_service),
+    _: None = Depends(verify_api_key),
+) -> dict[str, Any]:
+    return ai_service.stats()
+
+
+@router.get("/generations", response_model=GenerationMetricsResponse)
+async def generation_metrics(
+    window_hours: int = Query(24, ge=1, le=24 * 90),
+    _: None = Depends(verify_api_key),
+    db: AsyncSession = Depends(get_db),
+) -> GenerationMetricsResponse:
+    return GenerationMetricsResponse(
+        window_hours=window_hours,
+        models=await get_generation_metrics(db, timedelta(hours=window_hours)),
+    )
@@ -0,0 +1,55 @@
+import json
+from typing import Any
+
+from pydantic import BaseModel
+from starlette.requests import ClientDisconnect
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+try:
+    import orjson
+except ImportError:  # the "speedups" extra; stdlib json is used without it
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, matching Starlette's JSONResponse output."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse that writes Pydantic models straight to JSON bytes in one
+    pass with pydantic-core, and anything else with orjson when installed.
+
+    Return it from a route, e.g. FastJSONResponse(resume_out), so FastAPI
+    skips re-validating the model against response_model and running
+    jsonable_encoder on the dump before it ever reaches render().
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return dumps(content)
+
+
+class RequestStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body iterator reads the request body itself.
+
+    Starlette's StreamingResponse consumes `receive` while it streams, to
+    watch for client disconnects, which would swallow request body chunks.
+    Here the body iterator is the only reader; a disconnect surfaces as
+    ClientDisconnect from request.stream() and simply ends the response.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except ClientDisconnect:
+            return
+
+        if self.background is not None:
+            await self.background()
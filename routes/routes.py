@@ -1,18 +1,56 @@
 import logging
+import time
 from functools import lru_cache
+from typing import Any
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Header, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Body, Depends, HTTPException, Header, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
-from db import get_db, GenerationStatus, ResumeRecord
-from models import ResumeIn, ResumeOut, ResumeItem, PaginatedResumesResponse
-from services import AIService, clean_and_validate_resume, create_resume, create_generation
+from db import get_db, is_db_configured, GenerationStatus
+from models import (
+    ResumeIn,
+    ResumeOut,
+    ResumeItem,
+    CountStrategy,
+    ListingMode,
+    ResumePatch,
+    ResumePatchOut,
+    PaginatedResumesResponse,
+    GenerationJobOut,
+    GenerationOut,
+)
+from services import (
+    AIService,
+    DuplicateResumeError,
+    ai_http_exception,
+    clean_resume_sections,
+    create_generation,
+    create_resume_with_generation,
+    decode_resume_cursor,
+    default_count_strategy,
+    generate_markdown,
+    get_generation,
+    get_job_queue,
+    list_resumes_offset,
+    list_resumes_page,
+    patch_resume_sections,
+    resolve_resume_total,
+    serialize_cleaned_sections,
+    stream_batch_generation,
+    stream_batch_validation,
+    stream_generation_events,
+    validate_resume,
+)
+from routes.responses import FastJSONResponse, RequestStreamingResponse
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/resume", tags=["Resume"])
+# Routes that return a model wrap it in FastJSONResponse themselves; the
+# default class only covers responses FastAPI still encodes.
+router = APIRouter(prefix="/api/v1/resume", tags=["Resume"], default_response_class=FastJSONResponse)
 
 
 @lru_cache
@@ -39,42 +77,68 @@ async def verify_api_key(x_api_key: str | None = Header(default=None)) -> None:
         )
 
 
+def server_timing(**stages: float) -> str:
+    """Format stage durations in milliseconds as a Server-Timing header value."""
+    return ", ".join(f"{name};dur={duration:.1f}" for name, duration in stages.items())
+
+
 @router.post("/validate", response_model=ResumeOut)
 async def validate_resume_route(
     payload: ResumeIn,
     _: None = Depends(verify_api_key)
-    ) -> ResumeOut:
-    return clean_and_validate_resume(payload)
+    ) -> FastJSONResponse:
+    return FastJSONResponse(await validate_resume(payload))
+
+
+@router.post("/validate/batch")
+async def validate_resume_batch_route(
+    request: Request,
+    _: None = Depends(verify_api_key),
+) -> StreamingResponse:
+    # The body is newline-delimited ResumeIn records, read and validated
+    # incrementally; each record gets its own result line.
+    return RequestStreamingResponse(
+        stream_batch_validation(request.stream()),
+        media_type="application/x-ndjson",
+    )
+
     
 @router.post("/generate", response_model=ResumeOut)
 async def generate_resume_route(
     payload: ResumeIn,
+    bypass_cache: bool = Query(False),
     db: AsyncSession = Depends(get_db),
     ai_service: AIService = Depends(get_ai_service),
     _: None = Depends(verify_api_key),
-) -> ResumeOut:
+) -> FastJSONResponse:
 
-    resume_out = clean_and_validate_resume(payload)
+    started = time.perf_counter()
+    resume_out = await validate_resume(payload)
+    validated = time.perf_counter()
 
     try:
-        ai_content = await ai_service.generate_resume(resume_out)
-    except Exception:
-        logger.exception("AI resume generation failed")
-        raise HTTPException(
-            status_code=503,
-            detail="AI generation failed",
+        generated = await generate_markdown(
+            db,
+            ai_service,
+            resume_out,
+            bypass_cache=bypass_cache,
         )
+    except Exception as exc:
+        logger.exception("AI resume generation failed")
+        raise ai_http_exception(exc)
+
+    generated_at = time.perf_counter()
 
     try: 
         async with db.begin():
-            resume_record = await create_resume(db, resume_out)
-
-            await create_generation(
-                db, 
-                resume_id=resume_record.id,
+            await create_resume_with_generation(
+                db,
+                resume_out,
                 status=GenerationStatus.COMPLETED,
-                markdown_output=ai_content,
-                ai_model=settings.OPENAI_MODEL
+                markdown_output=generated.markdown,
+                ai_model=settings.OPENAI_MODEL,
+                cache_key=generated.cache_key,
+                usage=generated.usage,
             )
     except Exception: 
         logger.exception("Database persistence failed")
@@ -83,40 +147,231 @@ async def generate_resume_route(
             detail="Database persistence failed",
         )
 
-    resume_out.ai_resume_markdown = ai_content
+    timing = server_timing(
+        validate=(validated - started) * 1000,
+        generate=(generated_at - validated) * 1000,
+        persist=(time.perf_counter() - generated_at) * 1000,
+    )
+
+    resume_out.ai_resume_markdown = generated.markdown
     resume_out.ai_model = settings.OPENAI_MODEL
-    return resume_out
+    return FastJSONResponse(resume_out, headers={"Server-Timing": timing})
+
+
+@router.post("/generate/stream")
+async def generate_resume_stream_route(
+    payload: ResumeIn,
+    bypass_cache: bool = Query(False),
+    ai_service: AIService = Depends(get_ai_service),
+    _: None = Depends(verify_api_key),
+) -> StreamingResponse:
+    # The request-scoped session is closed before a streaming body runs,
+    # so the stream persists through its own session once it completes.
+    if not is_db_configured():
+        raise HTTPException(status_code=503, detail="Database not configured")
+
+    resume_out = await validate_resume(payload)
+
+    return StreamingResponse(
+        stream_generation_events(ai_service, resume_out, bypass_cache=bypass_cache),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
     
 
+@router.post("/generate/batch")
+async def generate_resume_batch_route(
+    items: list[dict[str, Any]] = Body(..., min_length=1),
+    bypass_cache: bool = Query(False),
+    ai_service: AIService = Depends(get_ai_service),
+    _: None = Depends(verify_api_key),
+) -> StreamingResponse:
+    # Items are validated one by one so a bad entry is reported in its own
+    # result line instead of rejecting the whole batch.
+    if len(items) > settings.GENERATION_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {settings.GENERATION_BATCH_MAX_ITEMS} items",
+        )
+
+    if not is_db_configured():
+        raise HTTPException(status_code=503, detail="Database not configured")
+
+    return StreamingResponse(
+        stream_batch_generation(ai_service, items, bypass_cache=bypass_cache),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/generate/jobs", response_model=GenerationJobOut, status_code=202)
+async def generate_resume_job_route(
+    payload: ResumeIn,
+    db: AsyncSession = Depends(get_db),
+    _: None = Depends(verify_api_key),
+) -> FastJSONResponse:
+    queue = get_job_queue()
+    if queue is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Generation workers not running",
+        )
+
+    resume_out = await validate_resume(payload)
+
+    try:
+        async with db.begin():
+            resume_record, generation_record = await create_resume_with_generation(
+                db,
+                resume_out,
+                status=GenerationStatus.PENDING,
+                markdown_output=None,
+                ai_model=settings.OPENAI_MODEL,
+            )
+    except Exception:
+        logger.exception("Database persistence failed")
+        raise HTTPException(
+            status_code=503,
+            detail="Database persistence failed",
+        )
+
+    await queue.enqueue(generation_record.id)
+
+    job = GenerationJobOut(
+        generation_id=generation_record.id,
+        resume_id=resume_record.id,
+        status=GenerationStatus.PENDING,
+    )
+    return FastJSONResponse(job, status_code=202)
+
+
+@router.patch("/{resume_id}", response_model=ResumePatchOut)
+async def patch_resume_route(
+    resume_id: UUID,
+    patch: ResumePatch,
+    regenerate: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+    _: None = Depends(verify_api_key),
+) -> FastJSONResponse:
+    # Only the sections in the body are cleaned and merged into the stored
+    # cleaned_data; the rest of the resume is never read or re-validated.
+    queue = get_job_queue() if regenerate else None
+    if regenerate and queue is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Generation workers not running",
+        )
+
+    cleaned, warnings = clean_resume_sections(patch)
+    sections = serialize_cleaned_sections(cleaned)
+    generation_id = None
+
+    try:
+        async with db.begin():
+            patched = await patch_resume_sections(db, resume_id, sections)
+            if patched is None:
+                raise HTTPException(status_code=404, detail="Resume not found")
+
+            updated_at, changed_keys = patched
+            if queue is not None and changed_keys:
+                generation_record = await create_generation(
+                    db,
+                    resume_id=resume_id,
+                    status=GenerationStatus.PENDING,
+                    markdown_output=None,
+                    ai_model=settings.OPENAI_MODEL,
+                )
+                generation_id = generation_record.id
+    except HTTPException:
+        raise
+    except DuplicateResumeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    except Exception:
+        logger.exception("Database persistence failed")
+        raise HTTPException(
+            status_code=503,
+            detail="Database persistence failed",
+        )
+
+    if generation_id is not None:
+        await queue.enqueue(generation_id)
+
+    return FastJSONResponse(ResumePatchOut(
+        id=resume_id,
+        updated_at=updated_at,
+        changed_sections=[key.removeprefix("cleaned_") for key in changed_keys],
+        cleaned=sections,
+        warnings=warnings,
+        generation_id=generation_id,
+    ))
+
+
+@router.get("/generations/{generation_id}", response_model=GenerationOut)
+async def get_generation_route(
+    generation_id: UUID,
+    _: None = Depends(verify_api_key),
+    db: AsyncSession = Depends(get_db),
+) -> FastJSONResponse:
+    generation_record = await get_generation(db, generation_id)
+    if generation_record is None:
+        raise HTTPException(status_code=404, detail="Generation not found")
+
+    return FastJSONResponse(GenerationOut.model_validate(generation_record))
+
+
 @router.get("/", response_model=PaginatedResumesResponse)
 async def get_resumes(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=100), 
+    limit: int = Query(20, ge=1, le=100),
+    mode: ListingMode | None = Query(
+        None,
+        description="offset unless cursor is given; mode=cursor starts keyset paging",
+    ),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    skip: int | None = Query(None, ge=0, description="OFFSET paging; slow on deep pages"),
+    count: CountStrategy | None = Query(
+        None,
+        description="How to compute total; omitted means RESUME_COUNT_STRATEGY "
+        "in offset mode and no total in cursor mode",
+    ),
     _: None = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
-    ) -> PaginatedResumesResponse:
+    ) -> FastJSONResponse:
 
-    total_stmt = select(func.count()).select_from(ResumeRecord)
-    total_result = await db.execute(total_stmt)
-    total = total_result.scalar_one()
+    if mode is None:
+        mode = ListingMode.CURSOR if cursor is not None else ListingMode.OFFSET
 
-    stmt = (
-        select(ResumeRecord)
-        .order_by(ResumeRecord.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
+    if mode is ListingMode.CURSOR and skip is not None:
+        raise HTTPException(status_code=400, detail="Use either cursor or skip, not both")
 
-    result = await db.execute(stmt)
-    resume_records = result.scalars().all()
+    if mode is ListingMode.OFFSET:
+        if cursor is not None:
+            raise HTTPException(status_code=400, detail="cursor requires mode=cursor")
+
+        skip = skip or 0
+        rows, has_more = await list_resumes_offset(db, skip, limit)
+        total, total_strategy = await resolve_resume_total(db, count or default_count_strategy())
+
+        return FastJSONResponse(PaginatedResumesResponse(
+            items=[ResumeItem.model_validate(row) for row in rows],
+            total=total,
+            total_strategy=total_strategy,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+        ))
+
+    try:
+        after = decode_resume_cursor(cursor) if cursor is not None else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    items = [ResumeItem.model_validate(record) for record in resume_records]
-    has_more = skip + len(items) < total
+    rows, next_cursor = await list_resumes_page(db, limit, after)
+    total, total_strategy = await resolve_resume_total(db, count) if count is not None else (None, None)
 
-    return PaginatedResumesResponse(
-        items=items,
+    return FastJSONResponse(PaginatedResumesResponse(
+        items=[ResumeItem.model_validate(row) for row in rows],
         total=total,
-        skip=skip,
+        total_strategy=total_strategy,
         limit=limit,
-        has_more=has_more,
-    )
\ No newline at end of file
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor,
+    ))
@@ -0,0 +1,222 @@
+"""
+Local stand-in for the OpenAI Responses API, for load testing /generate
+without spending API credits.
+
+Run it, then point the API at it:
+
+    python scripts/fake_openai_server.py --port 9100 --latency-ms 1500 --error-rate 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:9100/v1 OPENAI_API_KEY=fake uvicorn main:app
+
+Only POST /v1/responses is implemented, with and without `stream: true`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class FakeConfig:
+    latency_dist: str = "lognormal"
+    latency_ms: float = 1500.0
+    latency_sigma: float = 0.4
+    ttft_ms: float = 300.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    output_tokens: int = 400
+    cached_ratio: float = 0.0
+    seed: int | None = None
+
+
+config = FakeConfig()
+rng = random.Random()
+app = FastAPI(title="Fake OpenAI Responses API")
+
+
+def sample_latency_seconds() -> float:
+    """Total response time drawn from the configured distribution."""
+    median = config.latency_ms / 1000
+
+    if config.latency_dist == "fixed":
+        return median
+    if config.latency_dist == "uniform":
+        spread = median * config.latency_sigma
+        return max(0.0, rng.uniform(median - spread, median + spread))
+    if config.latency_dist == "exponential":
+        return rng.expovariate(1 / median)
+
+    return rng.lognormvariate(0, config.latency_sigma) * median
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def prompt_text(body: dict[str, Any]) -> str:
+    messages = body.get("input") or []
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(message.get("content", "")) for message in messages)
+
+
+def fake_markdown(prompt: str) -> list[str]:
+    """Deterministic-looking resume markdown, split into roughly one token per word."""
+    name = "Candidate"
+    for line in prompt.splitlines():
+        if line.startswith("Name:"):
+            name = line.removeprefix("Name:").strip() or name
+            break
+
+    words = [f"# {name}\n\n## Summary\n"]
+    filler = "Engineer with hands-on experience building reliable backend services and APIs.".split()
+    while len(words) < config.output_tokens:
+        words.extend(f"{word} " for word in filler)
+    return words[: config.output_tokens]
+
+
+def usage_block(prompt: str, output_tokens: int) -> dict[str, Any]:
+    input_tokens = estimate_tokens(prompt)
+    return {
+        "input_tokens": input_tokens,
+        "input_tokens_details": {"cached_tokens": int(input_tokens * config.cached_ratio)},
+        "output_tokens": output_tokens,
+        "output_tokens_details": {"reasoning_tokens": 0},
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+def response_object(response_id: str, model: str, text: str, usage: dict[str, Any] | None) -> dict[str, Any]:
+    return {
+        "id": response_id,
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": model,
+        "output": [
+            {
+                "id": f"msg_{uuid.uuid4().hex}",
+                "type": "message",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": usage,
+    }
+
+
+def injected_error() -> JSONResponse | None:
+    roll = rng.random()
+    if roll < config.rate_limit_rate:
+        return JSONResponse(
+            status_code=429,
+            headers={"retry-after": "1"},
+            content={"error": {"message": "Rate limit reached (fake)", "type": "requests", "code": "rate_limit_exceeded"}},
+        )
+    if roll < config.rate_limit_rate + config.error_rate:
+        return JSONResponse(
+            status_code=500,
+            content={"error": {"message": "Injected failure (fake)", "type": "server_error", "code": None}},
+        )
+    return None
+
+
+def sse(event: dict[str, Any]) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def stream_events(response_id: str, model: str, prompt: str, total: float) -> AsyncIterator[str]:
+    tokens = fake_markdown(prompt)
+    item_id = f"msg_{uuid.uuid4().hex}"
+    ttft = min(config.ttft_ms / 1000, total)
+    per_token = max(0.0, total - ttft) / max(1, len(tokens))
+    sequence = 0
+
+    created = response_object(response_id, model, "", None) | {"status": "in_progress"}
+    yield sse({"type": "response.created", "sequence_number": sequence, "response": created})
+    await asyncio.sleep(ttft)
+
+    for token in tokens:
+        sequence += 1
+        yield sse({
+            "type": "response.output_text.delta",
+            "sequence_number": sequence,
+            "item_id": item_id,
+            "output_index": 0,
+            "content_index": 0,
+            "delta": token,
+            "logprobs": [],
+        })
+        if per_token:
+            await asyncio.sleep(per_token)
+
+    text = "".join(tokens)
+    yield sse({
+        "type": "response.completed",
+        "sequence_number": sequence + 1,
+        "response": response_object(response_id, model, text, usage_block(prompt, len(tokens))),
+    })
+
+
+@app.post("/v1/responses")
+async def create_response(request: Request):
+    body = await request.json()
+    model = body.get("model", "fake-model")
+    prompt = prompt_text(body)
+    response_id = f"resp_{uuid.uuid4().hex}"
+    total = sample_latency_seconds()
+
+    error = injected_error()
+    if error is not None:
+        await asyncio.sleep(min(total, config.ttft_ms / 1000))
+        return error
+
+    if body.get("stream"):
+        return StreamingResponse(
+            stream_events(response_id, model, prompt, total),
+            media_type="text/event-stream",
+        )
+
+    await asyncio.sleep(total)
+    tokens = fake_markdown(prompt)
+    return response_object(response_id, model, "".join(tokens), usage_block(prompt, len(tokens)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "lognormal", "exponential"], default=config.latency_dist)
+    parser.add_argument("--latency-ms", type=float, default=config.latency_ms, help="median total response time")
+    parser.add_argument("--latency-sigma", type=float, default=config.latency_sigma, help="lognormal sigma / uniform relative spread")
+    parser.add_argument("--ttft-ms", type=float, default=config.ttft_ms, help="time to first streamed token")
+    parser.add_argument("--error-rate", type=float, default=config.error_rate, help="fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=config.rate_limit_rate, help="fraction answered with 429")
+    parser.add_argument("--output-tokens", type=int, default=config.output_tokens)
+    parser.add_argument("--cached-ratio", type=float, default=config.cached_ratio, help="share of input tokens reported as cached")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    for field in FakeConfig.__dataclass_fields__:
+        setattr(config, field, getattr(args, field))
+    rng.seed(config.seed)
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
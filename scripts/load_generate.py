@@ -0,0 +1,201 @@
+"""
+Open-loop load generator for POST /api/v1/resume/generate.
+
+Requests are fired at a fixed rate regardless of how fast responses come
+back, so queueing inside the API shows up as latency instead of being hidden
+by a slower client. Pair it with scripts/fake_openai_server.py to measure
+the API itself rather than OpenAI:
+
+    python scripts/load_generate.py --payload resumes.jsonl --rps 20 --duration 60 \\
+        --api-key "$APP_API_KEY" --bypass-cache --json results.json
+
+Payload files may hold one JSON object, a JSON array of objects, or one
+object per line (.jsonl); requests cycle through them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+
+DEFAULT_PAYLOAD = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python", "FastAPI", "PostgreSQL"],
+}
+
+
+@dataclass
+class Results:
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    stages_ms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Counter = field(default_factory=Counter)
+
+
+def load_payloads(path: Path | None) -> list[dict[str, Any]]:
+    if path is None:
+        return [DEFAULT_PAYLOAD]
+
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        payloads = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        data = json.loads(text)
+        payloads = data if isinstance(data, list) else [data]
+
+    if not payloads:
+        raise SystemExit(f"No payloads found in {path}")
+    return payloads
+
+
+def parse_server_timing(header: str | None) -> dict[str, float]:
+    """`validate;dur=1.2, generate;dur=830.0` -> {"validate": 1.2, "generate": 830.0}"""
+    stages: dict[str, float] = {}
+    if not header:
+        return stages
+
+    for metric in header.split(","):
+        name, *params = (part.strip() for part in metric.split(";"))
+        for param in params:
+            key, _, value = param.partition("=")
+            if key == "dur":
+                try:
+                    stages[name] = float(value)
+                except ValueError:
+                    pass
+    return stages
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+def summarize(values: list[float]) -> dict[str, float | None]:
+    return {
+        "count": len(values),
+        "mean": statistics.fmean(values) if values else None,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+
+async def send_one(client: httpx.AsyncClient, payload: dict[str, Any], params: dict[str, str], results: Results) -> None:
+    started = time.perf_counter()
+    try:
+        response = await client.post("/api/v1/resume/generate", json=payload, params=params)
+    except httpx.HTTPError as exc:
+        results.errors[type(exc).__name__] += 1
+        return
+
+    results.latencies_ms.append((time.perf_counter() - started) * 1000)
+    results.statuses[response.status_code] += 1
+    for name, duration in parse_server_timing(response.headers.get("server-timing")).items():
+        results.stages_ms[name].append(duration)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    payloads = load_payloads(args.payload)
+    headers = {"X-API-Key": args.api_key} if args.api_key else {}
+    params = {"bypass_cache": "true"} if args.bypass_cache else {}
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    results = Results()
+
+    async with httpx.AsyncClient(base_url=args.url, headers=headers, timeout=args.timeout, limits=limits) as client:
+        interval = 1 / args.rps
+        total = int(args.rps * args.duration)
+        tasks = []
+        started = time.perf_counter()
+
+        for n in range(total):
+            # Schedule against the start time so a slow loop does not drift the rate.
+            delay = started + n * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            payload = payloads[n % len(payloads)]
+            tasks.append(asyncio.create_task(send_one(client, payload, params, results)))
+
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    completed = sum(results.statuses.values())
+    return {
+        "target_rps": args.rps,
+        "duration_s": round(elapsed, 3),
+        "sent": total,
+        "completed": completed,
+        "throughput_rps": round(completed / elapsed, 2) if elapsed else 0.0,
+        "success_rps": round(results.statuses.get(200, 0) / elapsed, 2) if elapsed else 0.0,
+        "statuses": {str(code): count for code, count in sorted(results.statuses.items())},
+        "client_errors": dict(results.errors),
+        "latency_ms": summarize(results.latencies_ms),
+        "server_timing_ms": {name: summarize(values) for name, values in sorted(results.stages_ms.items())},
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    def row(label: str, stats: dict[str, float | None]) -> str:
+        cells = " ".join(
+            f"{key}={stats[key]:.1f}" if stats[key] is not None else f"{key}=-"
+            for key in ("p50", "p95", "p99", "max")
+        )
+        return f"  {label:<10} n={stats['count']:<6} {cells}"
+
+    print(f"sent {report['sent']} in {report['duration_s']}s "
+          f"(target {report['target_rps']} rps, achieved {report['throughput_rps']} rps, "
+          f"{report['success_rps']} rps succeeded)")
+    print(f"statuses: {report['statuses']}")
+    if report["client_errors"]:
+        print(f"client errors: {report['client_errors']}")
+    print("latency (ms):")
+    print(row("total", report["latency_ms"]))
+    for name, stats in report["server_timing_ms"].items():
+        print(row(name, stats))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--payload", type=Path, default=None, help=".json or .jsonl file of ResumeIn bodies")
+    parser.add_argument("--rps", type=float, default=10.0, help="target request rate")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to keep sending")
+    parser.add_argument("--api-key", default=None, help="value for the X-API-Key header")
+    parser.add_argument("--bypass-cache", action="store_true", help="send bypass_cache=true so every request reaches the AI")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--max-connections", type=int, default=1000)
+    parser.add_argument("--json", type=Path, default=None, help="also write the report to this file")
+    args = parser.parse_args()
+
+    if args.rps <= 0 or args.duration <= 0:
+        parser.error("--rps and --duration must be positive")
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if not report["completed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
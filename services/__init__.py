@@ -1,12 +1,126 @@
-from .ai_service import AIService
-from .prompts import build_resume_prompt
-from .validation_service import clean_and_validate_resume
-from .persistence_service import create_resume, create_generation
+from .ai_service import AIService, GenerationResult, GenerationUsage
+from .prompts import build_resume_prompt, build_resume_messages, PROMPT_VERSION, RESUME_INSTRUCTIONS
+from .validation_service import clean_and_validate_resume, clean_resume_sections, payload_weight
+from .validation_executor import (
+    ValidationExecutor,
+    get_validation_executor,
+    start_validation_executor,
+    stop_validation_executor,
+    validate_resume,
+)
+from .persistence_service import (
+    DuplicateResumeError,
+    create_generation,
+    create_resume_with_generation,
+    create_resumes_with_generations,
+    insert_resumes_with_generations,
+    new_resume_with_generation,
+    count_resumes,
+    decode_resume_cursor,
+    estimate_resumes,
+    encode_resume_cursor,
+    find_completed_generation,
+    get_generation,
+    get_generation_metrics,
+    list_pending_generations,
+    list_resumes_offset,
+    list_resumes_page,
+    load_resume_out,
+    patch_resume_sections,
+    reclaim_stale_generations,
+    renew_generation_lease,
+    requeue_generation,
+    serialize_cleaned_data,
+    serialize_cleaned_sections,
+)
+from .count_service import CachedCount, default_count_strategy, resolve_resume_total, resume_count_cache
+from .cache_service import GenerationCache, generation_cache, generation_cache_key
+from .resilience import (
+    AICircuitOpenError,
+    AIRateLimitError,
+    AIRateLimiter,
+    CircuitBreaker,
+    TokenBucket,
+    ai_http_exception,
+)
+from .single_flight import SingleFlight
+from .generation_service import (
+    GeneratedResume,
+    generate_markdown,
+    generation_flight,
+    stream_generation_events,
+)
+from .batch_service import stream_batch_generation, stream_batch_validation
+from .job_service import (
+    DatabaseJobQueue,
+    InProcessJobQueue,
+    get_job_queue,
+    start_generation_workers,
+    stop_generation_workers,
+)
 
 __all__ = [
     "AIService",
+    "GenerationResult",
+    "GenerationUsage",
     "build_resume_prompt",
+    "build_resume_messages",
+    "RESUME_INSTRUCTIONS",
+    "PROMPT_VERSION",
     "clean_and_validate_resume",
-    "create_resume",
+    "clean_resume_sections",
+    "payload_weight",
+    "ValidationExecutor",
+    "get_validation_executor",
+    "start_validation_executor",
+    "stop_validation_executor",
+    "validate_resume",
+    "DuplicateResumeError",
     "create_generation",
+    "create_resume_with_generation",
+    "create_resumes_with_generations",
+    "insert_resumes_with_generations",
+    "new_resume_with_generation",
+    "count_resumes",
+    "estimate_resumes",
+    "decode_resume_cursor",
+    "encode_resume_cursor",
+    "list_resumes_offset",
+    "list_resumes_page",
+    "find_completed_generation",
+    "get_generation",
+    "get_generation_metrics",
+    "load_resume_out",
+    "list_pending_generations",
+    "reclaim_stale_generations",
+    "renew_generation_lease",
+    "requeue_generation",
+    "patch_resume_sections",
+    "serialize_cleaned_data",
+    "serialize_cleaned_sections",
+    "CachedCount",
+    "default_count_strategy",
+    "resolve_resume_total",
+    "resume_count_cache",
+    "GenerationCache",
+    "generation_cache",
+    "generation_cache_key",
+    "GeneratedResume",
+    "generate_markdown",
+    "generation_flight",
+    "SingleFlight",
+    "AICircuitOpenError",
+    "AIRateLimitError",
+    "AIRateLimiter",
+    "CircuitBreaker",
+    "TokenBucket",
+    "ai_http_exception",
+    "stream_generation_events",
+    "stream_batch_generation",
+    "stream_batch_validation",
+    "DatabaseJobQueue",
+    "InProcessJobQueue",
+    "get_job_queue",
+    "start_generation_workers",
+    "stop_generation_workers",
 ]
@@ -1,32 +1,323 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
 from models import ResumeOut
-from config import settings 
+from config import settings
 from openai import AsyncOpenAI
-from services.prompts import build_resume_prompt
+from services.prompts import build_resume_messages, estimate_tokens
+from services.resilience import (
+    AIRateLimiter,
+    CircuitBreaker,
+    LatencyWindow,
+    backoff_delay,
+    is_retryable,
+    is_upstream_failure,
+    upstream_retry_after,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GenerationUsage:
+    """Token usage and upstream timings for one AI generation."""
+
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cached_tokens: int | None = None
+    latency_ms: int | None = None
+    ttft_ms: int | None = None
+    attempts: int | None = None
+    hedge_won: bool | None = None
+
+
+@dataclass
+class GenerationResult:
+    markdown: str
+    usage: GenerationUsage
 
 
-class AIService: 
-    def __init__(self): 
-        if not settings.OPENAI_API_KEY: 
+def elapsed_ms(started: float) -> int:
+    return round((time.perf_counter() - started) * 1000)
+
+
+class AIService:
+    def __init__(self):
+        if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not configured.")
 
         self.api_key = settings.OPENAI_API_KEY
         self.gpt_model = settings.OPENAI_MODEL
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # Retries and deadlines are handled here, not by the SDK, so they can
+        # share the rate limiter, circuit breaker and total deadline.
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=settings.OPENAI_BASE_URL,
+            max_retries=0,
+            timeout=settings.OPENAI_TIMEOUT_SECONDS,
+        )
+
+        self.rate_limiter = AIRateLimiter(
+            requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE,
+            max_queue=settings.OPENAI_RATE_LIMIT_QUEUE_SIZE,
+        )
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.OPENAI_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.OPENAI_CIRCUIT_RESET_SECONDS,
+        )
+
+        self.latencies = LatencyWindow()
+
+        self.input_tokens = 0
+        self.cached_input_tokens = 0
+        self.retries = 0
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+
+    def _request_kwargs(self, cleaned: ResumeOut) -> dict[str, Any]:
+        return {
+            "model": self.gpt_model,
+            "input": build_resume_messages(cleaned),
+            "temperature": 0.2,
+        }
+
+    def _record_usage(self, response_usage: Any, usage: GenerationUsage) -> None:
+        """Copy token counts from the response and track prompt-cache reuse."""
+        if response_usage is None:
+            return
+
+        details = getattr(response_usage, "input_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or 0
+
+        usage.input_tokens = response_usage.input_tokens
+        usage.output_tokens = response_usage.output_tokens
+        usage.cached_tokens = cached
+
+        self.input_tokens += response_usage.input_tokens or 0
+        self.cached_input_tokens += cached
+        logger.info(
+            "OpenAI usage: input_tokens=%s cached_tokens=%s output_tokens=%s",
+            response_usage.input_tokens,
+            cached,
+            response_usage.output_tokens,
+        )
+
+    async def _admit(self, request: dict[str, Any]) -> None:
+        """
+        Fail fast while the breaker is open, wait for rate budget, then pass
+        the breaker. The half-open trial is only claimed once admitted, so a
+        rate-limit rejection cannot hold it; callers release it in a finally.
+        """
+        self.circuit_breaker.check()
+
+        prompt_tokens = sum(estimate_tokens(message["content"]) for message in request["input"])
+        await self.rate_limiter.acquire(prompt_tokens)
+
+        self.circuit_breaker.before_call()
+
+    def _record_outcome(self, exc: BaseException | None) -> None:
+        # Any answer that is not an upstream failure (a 400, say) shows the upstream is healthy.
+        if exc is not None and is_upstream_failure(exc):
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
 
-    async def generate_resume(self, cleaned: ResumeOut) -> str:
-        prompt = build_resume_prompt(cleaned)
+    def _retry_delay(self, exc: BaseException, attempt: int, deadline: float) -> float | None:
+        """Seconds to wait before the next attempt, or None to give up."""
+        if attempt >= settings.OPENAI_MAX_RETRIES or not is_retryable(exc):
+            return None
 
-        response = await self.client.responses.create(
-            model=self.gpt_model,
-            input=[{"role": "user", "content": prompt}],
-            temperature=0.2,
+        delay = backoff_delay(
+            attempt,
+            settings.OPENAI_RETRY_BASE_DELAY,
+            settings.OPENAI_RETRY_MAX_DELAY,
+            upstream_retry_after(exc),
         )
+        if time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def _hedge_delay(self) -> float | None:
+        if not settings.OPENAI_HEDGE_ENABLED or len(self.latencies) < settings.OPENAI_HEDGE_MIN_SAMPLES:
+            return None
+        return self.latencies.percentile(settings.OPENAI_HEDGE_PERCENTILE)
+
+    def _can_hedge(self, request: dict[str, Any]) -> bool:
+        """A hedge only goes out if it fits the budget right now; it never queues."""
+        if self.circuit_breaker.state != CircuitBreaker.CLOSED:
+            return False
+
+        prompt_tokens = sum(estimate_tokens(message["content"]) for message in request["input"])
+        return self.rate_limiter.try_acquire(prompt_tokens)
+
+    async def _create(self, request: dict[str, Any], timeout: float) -> Any:
+        return await asyncio.wait_for(self.client.responses.create(**request, timeout=timeout), timeout)
+
+    async def _hedged_create(self, request: dict[str, Any], timeout: float) -> tuple[Any, bool]:
+        """
+        Send the request; if it is still running after the recent latency
+        percentile, send a duplicate and take whichever succeeds first.
+        Returns the response and whether the hedge won.
+        """
+        primary = asyncio.ensure_future(self._create(request, timeout))
+        tasks = [primary]
+
+        try:
+            delay = self._hedge_delay()
+            if delay is None or delay >= timeout:
+                return await primary, False
+
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._can_hedge(request):
+                return await primary, False
+
+            self.hedges_fired += 1
+            hedge = asyncio.ensure_future(self._create(request, timeout))
+            tasks.append(hedge)
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result(), task is hedge
+
+            # Both failed: report the primary's error.
+            raise primary.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def generate_resume(self, cleaned: ResumeOut) -> GenerationResult:
+        request = self._request_kwargs(cleaned)
+        usage = GenerationUsage(attempts=0, hedge_won=False)
+        deadline = time.monotonic() + settings.OPENAI_TOTAL_TIMEOUT_SECONDS
+
+        for attempt in itertools.count():
+            await self._admit(request)
+            usage.attempts += 1
+            attempt_started = time.perf_counter()
+            timeout = min(settings.OPENAI_TIMEOUT_SECONDS, max(0.0, deadline - time.monotonic()))
+
+            try:
+                response, usage.hedge_won = await self._hedged_create(request, timeout)
+
+                markdown = (response.output_text or "").strip()
+                if not markdown:
+                    raise RuntimeError("OpenAI returned empty resume content.")
+            except Exception as exc:
+                self._record_outcome(exc)
+
+                delay = self._retry_delay(exc, attempt, deadline)
+                if delay is None:
+                    raise
+
+                self.retries += 1
+                logger.warning("OpenAI attempt %s failed (%r); retrying in %.2fs", usage.attempts, exc, delay)
+                await asyncio.sleep(delay)
+                continue
+            else:
+                self._record_outcome(None)
+            finally:
+                # Cancellation records nothing; give a half-open trial back.
+                self.circuit_breaker.release_trial()
+
+            self.latencies.record(time.perf_counter() - attempt_started)
+
+            # Timed from the winning attempt, so limiter queueing and retry
+            # backoff stay out of the upstream latency. The whole body arrives
+            # at once, so first token == full latency.
+            usage.latency_ms = usage.ttft_ms = elapsed_ms(attempt_started)
+            self._record_usage(response.usage, usage)
+            return GenerationResult(markdown=markdown, usage=usage)
+
+    async def stream_resume(
+        self,
+        cleaned: ResumeOut,
+        usage: GenerationUsage | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Yield markdown text deltas as the Responses API streams them.
+        Timings and token counts are written into `usage` as they become known.
+
+        Failed attempts are retried only until the first delta has been
+        yielded; after that the error goes to the caller. Streams are not hedged.
+        """
+        usage = usage if usage is not None else GenerationUsage()
+        usage.attempts, usage.hedge_won = 0, False
+        request = self._request_kwargs(cleaned)
+        deadline = time.monotonic() + settings.OPENAI_TOTAL_TIMEOUT_SECONDS
+
+        for attempt in itertools.count():
+            await self._admit(request)
+            usage.attempts += 1
+            attempt_started = time.perf_counter()
+            timeout = min(settings.OPENAI_TIMEOUT_SECONDS, max(0.0, deadline - time.monotonic()))
+
+            try:
+                # `timeout` bounds connecting and each read, i.e. the gap between events.
+                stream = await asyncio.wait_for(
+                    self.client.responses.create(**request, stream=True, timeout=timeout),
+                    timeout,
+                )
+
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        if event.delta:
+                            if usage.ttft_ms is None:
+                                usage.ttft_ms = elapsed_ms(attempt_started)
+                            yield event.delta
+                    elif event.type == "response.completed":
+                        usage.latency_ms = elapsed_ms(attempt_started)
+                        self._record_usage(event.response.usage, usage)
+                    elif event.type == "response.failed":
+                        raise RuntimeError("OpenAI resume stream failed.")
+                    elif event.type == "error":
+                        raise RuntimeError(f"OpenAI resume stream error: {event.message}")
+            except Exception as exc:
+                self._record_outcome(exc)
+
+                delay = None if usage.ttft_ms is not None else self._retry_delay(exc, attempt, deadline)
+                if delay is None:
+                    raise
+
+                self.retries += 1
+                logger.warning("OpenAI stream attempt %s failed (%r); retrying in %.2fs", usage.attempts, exc, delay)
+                await asyncio.sleep(delay)
+                continue
+            else:
+                self._record_outcome(None)
+            finally:
+                # Cancellation or a consumer closing the stream records nothing.
+                self.circuit_breaker.release_trial()
 
-        markdown = (response.output_text or "").strip()
-        if not markdown:
-            raise RuntimeError("OpenAI returned empty resume content.")
-        
-        return markdown
+            return
 
+    def stats(self) -> dict[str, Any]:
+        return {
+            "model": self.gpt_model,
+            "rate_limiter": self.rate_limiter.stats(),
+            "circuit_breaker": self.circuit_breaker.stats(),
+            "retries": self.retries,
+            "hedging": {
+                "enabled": settings.OPENAI_HEDGE_ENABLED,
+                "delay_ms": round(delay * 1000) if (delay := self._hedge_delay()) is not None else None,
+                "fired": self.hedges_fired,
+                "won": self.hedge_wins,
+            },
+            "prompt_cache": {
+                "input_tokens": self.input_tokens,
+                "cached_input_tokens": self.cached_input_tokens,
+                "cached_ratio": self.cached_input_tokens / self.input_tokens if self.input_tokens else 0.0,
+            },
+        }
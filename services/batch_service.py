@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator
+
+from collections import deque
+
+from fastapi import HTTPException
+
+from config import settings
+from db import GenerationRecord, GenerationStatus, ResumeRecord, session_scope
+from models import ResumeOut
+from services.ai_service import AIService
+from services.generation_service import generate_markdown
+from services.persistence_service import (
+    create_resumes_with_generations,
+    new_resume_with_generation,
+)
+from services.resilience import ai_http_exception
+from services.validation_executor import (
+    ValidationFailure,
+    get_validation_executor,
+    submit_validation,
+    validate_items,
+    validate_line_task,
+)
+
+logger = logging.getLogger(__name__)
+
+# Completed items are written in chunks of this size while the batch streams.
+BATCH_PERSIST_CHUNK = 50
+
+# Validation batches hand control back to the event loop this often.
+VALIDATION_YIELD_EVERY = 100
+
+
+def ndjson_line(data: dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str) + "\n"
+
+
+async def iter_ndjson_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[bytes | None]:
+    """
+    Split a byte stream into non-blank lines without buffering the whole body.
+    A line longer than `max_line_bytes` is dropped and yielded as None, both
+    when it arrives whole inside one chunk and when an unfinished line
+    outgrows the limit (its buffer is discarded as soon as it does).
+    """
+    buffer = b""
+    oversized = False
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            if oversized:
+                oversized = False
+                yield None
+            elif len(line) > max_line_bytes:
+                yield None
+            elif line.strip():
+                yield line
+
+        if len(buffer) > max_line_bytes:
+            oversized = True
+            buffer = b""
+
+    if oversized:
+        yield None
+    elif buffer.strip():
+        yield buffer
+
+
+def item_error(index: int, exc: HTTPException | ValidationFailure) -> dict[str, Any]:
+    return {
+        "type": "item",
+        "index": index,
+        "ok": False,
+        "status_code": exc.status_code,
+        "detail": exc.detail,
+    }
+
+
+async def stream_batch_generation(
+    ai_service: AIService,
+    items: list[Any],
+    bypass_cache: bool = False,
+) -> AsyncIterator[str]:
+    """
+    Validate every item, fan out AI generation under a semaphore and stream
+    one NDJSON line per item as it finishes, followed by a summary line.
+
+    Successful items are stored with client-generated ids in bulk chunks,
+    one INSERT statement per chunk. Once its chunk is written, an item whose
+    resume was already stored gets a "deduplicated" line with the stored
+    resume_id. If the chunk fails, each of its items gets a second item line
+    with ok false (503), and that line supersedes the ids sent earlier.
+    Item ids become readable once the summary line reports them persisted.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.GENERATION_BATCH_CONCURRENCY))
+
+    async def run(
+        index: int,
+        resume_out: ResumeOut | ValidationFailure,
+    ) -> tuple[dict[str, Any], tuple[ResumeRecord, GenerationRecord] | None]:
+        if isinstance(resume_out, ValidationFailure):
+            return item_error(index, resume_out), None
+
+        async with semaphore:
+            try:
+                async with session_scope() as session:
+                    generated = await generate_markdown(
+                        session,
+                        ai_service,
+                        resume_out,
+                        bypass_cache=bypass_cache,
+                    )
+            except Exception as exc:
+                logger.exception("AI resume generation failed for batch item %s", index)
+                return item_error(index, ai_http_exception(exc)), None
+
+        resume_record, generation_record = new_resume_with_generation(
+            resume_out,
+            status=GenerationStatus.COMPLETED,
+            markdown_output=generated.markdown,
+            ai_model=ai_service.gpt_model,
+            cache_key=generated.cache_key,
+            usage=generated.usage,
+        )
+
+        result = {
+            "type": "item",
+            "index": index,
+            "ok": True,
+            "resume_id": str(resume_record.id),
+            "generation_id": str(generation_record.id),
+            "ai_model": ai_service.gpt_model,
+            "cache_hit": generated.cache_hit,
+            "ai_resume_markdown": generated.markdown,
+        }
+        return result, (resume_record, generation_record)
+
+    pending: list[tuple[int, tuple[ResumeRecord, GenerationRecord]]] = []
+    counts = {"succeeded": 0, "failed": 0, "persisted": 0, "persistence_failed": 0}
+
+    async def persist() -> list[str]:
+        """
+        Store the pending chunk. Returns an error line per item if it could
+        not be stored, else a line per item whose resume was already stored.
+        """
+        chunk = pending[:]
+        pending.clear()
+        client_ids = [resume.id for _, (resume, _) in chunk]
+        try:
+            async with session_scope() as session, session.begin():
+                await create_resumes_with_generations(session, [records for _, records in chunk])
+        except Exception:
+            logger.exception("Batch persistence failed for %s items", len(chunk))
+            counts["persistence_failed"] += len(chunk)
+            error = HTTPException(status_code=503, detail="Database persistence failed")
+            return [ndjson_line(item_error(index, error)) for index, _ in chunk]
+
+        counts["persisted"] += len(chunk)
+        return [
+            ndjson_line({"type": "deduplicated", "index": index, "resume_id": str(resume.id)})
+            for (index, (resume, _)), client_id in zip(chunk, client_ids)
+            if resume.id != client_id
+        ]
+
+    # All items are validated in one pass (in the validation pool if one is running).
+    validated = await validate_items(items)
+
+    tasks = [asyncio.create_task(run(index, resume_out)) for index, resume_out in enumerate(validated)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result, records = await next_done
+
+            if records is None:
+                counts["failed"] += 1
+            else:
+                counts["succeeded"] += 1
+                pending.append((result["index"], records))
+
+            yield ndjson_line(result)
+
+            if len(pending) >= BATCH_PERSIST_CHUNK:
+                for line in await persist():
+                    yield line
+
+        if pending:
+            for line in await persist():
+                yield line
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    yield ndjson_line({"type": "summary", "total": len(items), **counts})
+
+
+async def aenumerate(items: AsyncIterator[Any]) -> AsyncIterator[tuple[int, Any]]:
+    index = 0
+    async for item in items:
+        yield index, item
+        index += 1
+
+
+async def stream_batch_validation(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Validate newline-delimited ResumeIn records as they arrive and stream
+    one NDJSON result line per record, in order, followed by a summary line.
+
+    With a validation pool running, up to a few lines per worker are in
+    flight at once; otherwise each line is validated inline as it is read.
+    """
+    executor = get_validation_executor()
+    window = executor.workers * 4 if executor is not None else 1
+    pending: deque[tuple[int, asyncio.Future[dict[str, Any] | ValidationFailure]]] = deque()
+    counts = {"succeeded": 0, "failed": 0}
+    index = -1
+
+    async def result_line() -> str:
+        line_index, future = pending.popleft()
+        result = await future
+
+        if isinstance(result, ValidationFailure):
+            counts["failed"] += 1
+            return ndjson_line(item_error(line_index, result))
+
+        counts["succeeded"] += 1
+        return ndjson_line({"type": "item", "index": line_index, "ok": True, "resume": result})
+
+    async for index, line in aenumerate(iter_ndjson_lines(chunks, settings.VALIDATION_BATCH_MAX_LINE_BYTES)):
+        if line is None:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(ValidationFailure(413, f"Line exceeds {settings.VALIDATION_BATCH_MAX_LINE_BYTES} bytes"))
+        else:
+            future = submit_validation(validate_line_task, line)
+        pending.append((index, future))
+
+        while pending and (len(pending) >= window or pending[0][1].done()):
+            yield await result_line()
+
+        if index % VALIDATION_YIELD_EVERY == VALIDATION_YIELD_EVERY - 1:
+            await asyncio.sleep(0)
+
+    while pending:
+        yield await result_line()
+
+    yield ndjson_line({"type": "summary", "total": index + 1, **counts})
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from models import ResumeOut
+from services.persistence_service import find_completed_generation, serialize_cleaned_data
+from services.prompts import PROMPT_VERSION
+from utils import LRUCache
+
+
+def generation_cache_key(
+    resume_out: ResumeOut,
+    model: str,
+    prompt_version: str = PROMPT_VERSION,
+) -> str:
+    """
+    Stable SHA-256 over the stored cleaned_data, the model and the prompt version.
+    """
+    payload = {
+        "cleaned_data": serialize_cleaned_data(resume_out),
+        "model": model,
+        "prompt_version": prompt_version,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """
+    Two-tier cache of generated markdown.
+
+    Tier one is a bounded in-process LRU. Tier two is the COMPLETED
+    GenerationRecord rows already stored under the same cache key.
+    """
+
+    def __init__(self, max_size: int):
+        self._memory: LRUCache[str, str] = LRUCache(max_size)
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    async def get(self, session: AsyncSession, cache_key: str) -> str | None:
+        markdown = self._memory.get(cache_key)
+        if markdown is not None:
+            self.memory_hits += 1
+            return markdown
+
+        record = await find_completed_generation(session, cache_key)
+        if record is not None and record.markdown_output:
+            self.db_hits += 1
+            self._memory.set(cache_key, record.markdown_output)
+            return record.markdown_output
+
+        self.misses += 1
+        return None
+
+    def set(self, cache_key: str, markdown: str) -> None:
+        self._memory.set(cache_key, markdown)
+
+    def record_bypass(self) -> None:
+        self.bypassed += 1
+
+    def clear(self) -> None:
+        self._memory.clear()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def stats(self) -> dict[str, int | float]:
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": len(self._memory),
+            "max_size": self._memory.max_size,
+        }
+
+
+generation_cache = GenerationCache(settings.GENERATION_CACHE_SIZE)
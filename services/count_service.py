@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from db import session_scope
+from models import CountStrategy
+from services.persistence_service import count_resumes, estimate_resumes
+
+logger = logging.getLogger(__name__)
+
+
+class CachedCount:
+    """
+    An exact count reused for `ttl` seconds. Once stale it is still served
+    while a single background task recounts through its own session; only
+    the first call in the process waits for a count.
+    """
+
+    def __init__(self, ttl: float, count: Callable[[AsyncSession], Awaitable[int]]):
+        self.ttl = ttl
+        self._count = count
+        self.value: int | None = None
+        self.refreshed_at = 0.0
+        self.refreshes = 0
+        self._refresh: asyncio.Task | None = None
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self.refreshed_at >= self.ttl
+
+    async def get(self, session: AsyncSession) -> int:
+        if self.value is None:
+            self._store(await self._count(session))
+        elif self.is_stale() and self._refresh is None:
+            self._refresh = asyncio.create_task(self._refresh_in_background())
+
+        return self.value
+
+    def clear(self) -> None:
+        self.value = None
+        self.refreshed_at = 0.0
+
+    def _store(self, value: int) -> None:
+        self.value = value
+        self.refreshed_at = time.monotonic()
+        self.refreshes += 1
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            async with session_scope() as session:
+                self._store(await self._count(session))
+        except Exception:
+            logger.exception("Background count refresh failed")
+        finally:
+            self._refresh = None
+
+
+resume_count_cache = CachedCount(settings.RESUME_COUNT_CACHE_TTL_SECONDS, count_resumes)
+
+
+def default_count_strategy() -> CountStrategy:
+    """
+    RESUME_COUNT_STRATEGY as a CountStrategy. The app lifespan calls this at
+    startup, so a bad value stops the app instead of failing every listing.
+    """
+    try:
+        return CountStrategy(settings.RESUME_COUNT_STRATEGY)
+    except ValueError:
+        choices = ", ".join(strategy.value for strategy in CountStrategy)
+        raise ValueError(
+            f"RESUME_COUNT_STRATEGY must be one of {choices}, not {settings.RESUME_COUNT_STRATEGY!r}"
+        ) from None
+
+
+async def resolve_resume_total(
+    session: AsyncSession,
+    strategy: CountStrategy,
+) -> tuple[int, CountStrategy]:
+    """
+    Total number of resumes under the requested strategy, and the strategy
+    that actually produced it: an estimate falls back to an exact count
+    while the table has no planner statistics yet.
+    """
+    if strategy == CountStrategy.ESTIMATED:
+        estimate = await estimate_resumes(session)
+        if estimate is not None:
+            return estimate, CountStrategy.ESTIMATED
+
+    if strategy == CountStrategy.CACHED:
+        return await resume_count_cache.get(session), CountStrategy.CACHED
+
+    return await count_resumes(session), CountStrategy.EXACT
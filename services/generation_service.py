@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import GenerationStatus, session_scope
+from models import ResumeOut
+from services.ai_service import AIService, GenerationResult, GenerationUsage
+from services.cache_service import generation_cache, generation_cache_key
+from services.persistence_service import create_resume_with_generation
+from services.resilience import ai_http_exception
+from services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Identical requests already waiting on OpenAI share one call.
+generation_flight: SingleFlight[GenerationResult] = SingleFlight()
+
+
+@dataclass
+class GeneratedResume:
+    markdown: str
+    cache_key: str
+    cache_hit: bool
+    # None when no upstream call was made for this request (cache hit or
+    # coalesced onto another request's call), so usage is stored only once.
+    usage: GenerationUsage | None = None
+
+
+async def generate_markdown(
+    session: AsyncSession,
+    ai_service: AIService,
+    resume_out: ResumeOut,
+    bypass_cache: bool = False,
+) -> GeneratedResume:
+    """
+    Return AI markdown for a cleaned resume, serving repeats from the generation cache.
+    """
+    cache_key = generation_cache_key(resume_out, ai_service.gpt_model)
+
+    if bypass_cache:
+        generation_cache.record_bypass()
+    else:
+        # Short transaction so the connection is not held during the AI call.
+        try:
+            async with session.begin():
+                cached = await generation_cache.get(session, cache_key)
+        except Exception:
+            logger.exception("Generation cache lookup failed")
+            cached = None
+
+        if cached is not None:
+            return GeneratedResume(markdown=cached, cache_key=cache_key, cache_hit=True)
+
+    result, shared = await generation_flight.do(
+        cache_key,
+        lambda: ai_service.generate_resume(resume_out),
+    )
+    generation_cache.set(cache_key, result.markdown)
+
+    return GeneratedResume(
+        markdown=result.markdown,
+        cache_key=cache_key,
+        cache_hit=False,
+        usage=None if shared else result.usage,
+    )
+
+
+def sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def stream_generation_events(
+    ai_service: AIService,
+    resume_out: ResumeOut,
+    bypass_cache: bool = False,
+) -> AsyncIterator[str]:
+    """
+    Stream markdown deltas as SSE frames, then persist the resume and
+    generation once the stream has completed.
+
+    Emits `delta` frames with a `text` field, then a single `done` frame
+    with the stored ids, or an `error` frame if generation or persistence fails.
+    """
+    cache_key = generation_cache_key(resume_out, ai_service.gpt_model)
+    cached: str | None = None
+
+    if bypass_cache:
+        generation_cache.record_bypass()
+    else:
+        try:
+            async with session_scope() as session, session.begin():
+                cached = await generation_cache.get(session, cache_key)
+        except Exception:
+            logger.exception("Generation cache lookup failed")
+
+    usage: GenerationUsage | None = None
+
+    if cached is not None:
+        markdown = cached
+        yield sse_event("delta", {"text": cached})
+    else:
+        usage = GenerationUsage()
+        chunks: list[str] = []
+        try:
+            async for delta in ai_service.stream_resume(resume_out, usage):
+                chunks.append(delta)
+                yield sse_event("delta", {"text": delta})
+        except Exception as exc:
+            logger.exception("AI resume stream failed")
+            error = ai_http_exception(exc)
+            yield sse_event("error", {"detail": error.detail, "status_code": error.status_code})
+            return
+
+        markdown = "".join(chunks).strip()
+        if not markdown:
+            yield sse_event("error", {"detail": "AI generation failed"})
+            return
+
+        generation_cache.set(cache_key, markdown)
+
+    try:
+        async with session_scope() as session, session.begin():
+            resume_record, generation_record = await create_resume_with_generation(
+                session,
+                resume_out,
+                status=GenerationStatus.COMPLETED,
+                markdown_output=markdown,
+                ai_model=ai_service.gpt_model,
+                cache_key=cache_key,
+                usage=usage,
+            )
+    except Exception:
+        logger.exception("Database persistence failed")
+        yield sse_event("error", {"detail": "Database persistence failed"})
+        return
+
+    yield sse_event(
+        "done",
+        {
+            "resume_id": str(resume_record.id),
+            "generation_id": str(generation_record.id),
+            "ai_model": ai_service.gpt_model,
+            "cache_hit": cached is not None,
+        },
+    )
+
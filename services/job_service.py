@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import select
+
+from config import settings
+from db import GenerationStatus, ResumeRecord, GenerationRecord, session_scope
+from services.ai_service import AIService
+from services.generation_service import generate_markdown
+from services.persistence_service import (
+    claim_generation,
+    claim_next_pending_generation,
+    finish_generation,
+    list_pending_generations,
+    load_resume_out,
+    reclaim_stale_generations,
+    renew_generation_lease,
+    requeue_generation,
+)
+from services.resilience import AICircuitOpenError, AIRateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JobClaim:
+    """A claimed generation; claimed_at (its started_at) fences the claim's writes."""
+
+    generation_id: UUID
+    claimed_at: datetime
+
+
+class GenerationJobQueue(Protocol):
+    async def enqueue(self, generation_id: UUID, delay: float = 0.0) -> None:
+        """Make a PENDING generation claimable, after `delay` seconds."""
+        ...
+
+    async def claim(self) -> JobClaim:
+        """Wait for the next generation and mark it RUNNING."""
+        ...
+
+
+class InProcessJobQueue:
+    """
+    asyncio.Queue of PENDING generation ids. Jobs only reach workers in
+    this process; on restart the worker pool re-enqueues the PENDING rows.
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue()
+
+    async def enqueue(self, generation_id: UUID, delay: float = 0.0) -> None:
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self._queue.put_nowait, generation_id)
+        else:
+            self._queue.put_nowait(generation_id)
+
+    async def claim(self) -> JobClaim:
+        while True:
+            generation_id = await self._queue.get()
+
+            async with session_scope() as session, session.begin():
+                claimed_at = await claim_generation(session, generation_id)
+
+            if claimed_at is not None:
+                return JobClaim(generation_id, claimed_at)
+
+
+class DatabaseJobQueue:
+    """
+    Uses the generations table itself as the queue. Workers on any node claim
+    PENDING rows with SELECT ... FOR UPDATE SKIP LOCKED and poll when idle.
+    """
+
+    def __init__(self, poll_interval: float):
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+
+    async def enqueue(self, generation_id: UUID, delay: float = 0.0) -> None:
+        # The row is already committed; just wake a local worker early.
+        # Delayed rows carry run_after and are picked up by polling.
+        if delay <= 0:
+            self._wakeup.set()
+
+    async def claim(self) -> JobClaim:
+        while True:
+            async with session_scope() as session, session.begin():
+                claimed = await claim_next_pending_generation(session)
+
+            if claimed is not None:
+                return JobClaim(*claimed)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def run_generation_job(ai_service: AIService, queue: GenerationJobQueue, claim: JobClaim) -> None:
+    """
+    Generate markdown for a claimed generation and store the outcome.
+
+    Local throttling (rate limiter or open circuit) puts the job back on the
+    queue for retry_after seconds instead of failing it. If storing the
+    result fails, the job is marked FAILED rather than left RUNNING. Every
+    write is fenced by the claim: once the lease was lost and the job
+    reclaimed, this run's outcome is discarded.
+    """
+    generation_id = claim.generation_id
+
+    async with session_scope() as session:
+        async with session.begin():
+            result = await session.execute(
+                select(ResumeRecord.cleaned_data)
+                .join(GenerationRecord, GenerationRecord.resume_id == ResumeRecord.id)
+                .where(GenerationRecord.id == generation_id)
+            )
+            cleaned_data = result.scalar_one()
+
+        try:
+            generated = await generate_markdown(session, ai_service, load_resume_out(cleaned_data))
+        except (AIRateLimitError, AICircuitOpenError) as exc:
+            delay = max(exc.retry_after, 1.0)
+            logger.warning("AI calls throttled; retrying job %s in %.1fs", generation_id, delay)
+            async with session.begin():
+                requeued = await requeue_generation(session, generation_id, claim.claimed_at, delay)
+            if requeued:
+                await queue.enqueue(generation_id, delay)
+            else:
+                logger.warning("Lost the claim on job %s before requeueing it", generation_id)
+            return
+        except Exception:
+            logger.exception("AI resume generation failed for job %s", generation_id)
+            async with session.begin():
+                await finish_generation(session, generation_id, claim.claimed_at, GenerationStatus.FAILED)
+            return
+
+        try:
+            async with session.begin():
+                stored = await finish_generation(
+                    session,
+                    generation_id,
+                    claim.claimed_at,
+                    GenerationStatus.COMPLETED,
+                    markdown_output=generated.markdown,
+                    cache_key=generated.cache_key,
+                    usage=generated.usage,
+                )
+        except Exception:
+            logger.exception("Storing the result of job %s failed", generation_id)
+            async with session.begin():
+                await finish_generation(session, generation_id, claim.claimed_at, GenerationStatus.FAILED)
+            return
+
+        if not stored:
+            logger.warning("Lost the claim on job %s; discarding its result", generation_id)
+
+
+class GenerationWorkerPool:
+    """
+    Workers draining the job queue, plus a reaper that returns RUNNING jobs
+    whose lease expired (their worker or process died or stalled) to PENDING.
+
+    A worker renews its job's lease every third of `lease` seconds, so a
+    slow AI call never expires it. If a renewal finds the claim already
+    lost, the job is cancelled instead of spending AI budget a second time.
+    """
+
+    def __init__(self, queue: GenerationJobQueue, ai_service: AIService, size: int, lease: float):
+        self.queue = queue
+        self.ai_service = ai_service
+        self.size = max(1, size)
+        self.lease = lease
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"generation-worker-{n}")
+            for n in range(self.size)
+        ]
+        self._tasks.append(asyncio.create_task(self._reap(), name="generation-reaper"))
+
+    async def recover(self) -> None:
+        """Requeue orphaned RUNNING jobs and enqueue every PENDING one."""
+        async with session_scope() as session, session.begin():
+            reclaimed = await reclaim_stale_generations(session, self.lease)
+            pending = await list_pending_generations(session)
+
+        if reclaimed:
+            logger.warning("Requeued %d generation jobs with an expired lease", len(reclaimed))
+
+        for generation_id, delay in pending:
+            await self.queue.enqueue(generation_id, delay)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                claim = await self.queue.claim()
+                await self._run_with_lease(claim)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Generation worker failed")
+                await asyncio.sleep(settings.GENERATION_QUEUE_POLL_INTERVAL)
+
+    async def _run_with_lease(self, claim: JobClaim) -> None:
+        job = asyncio.create_task(run_generation_job(self.ai_service, self.queue, claim))
+        try:
+            while not job.done():
+                await asyncio.wait({job}, timeout=self.lease / 3)
+                if not job.done() and not await self._renew(claim):
+                    logger.warning("Lost the lease on job %s; cancelling it", claim.generation_id)
+                    job.cancel()
+                    await asyncio.wait({job})
+                    return
+            job.result()
+        finally:
+            job.cancel()
+
+    async def _renew(self, claim: JobClaim) -> bool:
+        try:
+            async with session_scope() as session, session.begin():
+                return await renew_generation_lease(session, claim.generation_id, claim.claimed_at)
+        except Exception:
+            # Keep the job running; the claim fences its writes if the lease lapses.
+            logger.exception("Renewing the lease on job %s failed", claim.generation_id)
+            return True
+
+    async def _reap(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease / 2)
+            try:
+                async with session_scope() as session, session.begin():
+                    reclaimed = await reclaim_stale_generations(session, self.lease)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Reclaiming stale generation jobs failed")
+                continue
+
+            for generation_id in reclaimed:
+                await self.queue.enqueue(generation_id)
+
+
+_pool: GenerationWorkerPool | None = None
+
+
+def get_job_queue() -> GenerationJobQueue | None:
+    """The queue feeding the running worker pool, or None if workers are not running."""
+    return _pool.queue if _pool is not None else None
+
+
+def build_job_queue() -> GenerationJobQueue:
+    if settings.GENERATION_QUEUE_BACKEND == "database":
+        return DatabaseJobQueue(settings.GENERATION_QUEUE_POLL_INTERVAL)
+
+    return InProcessJobQueue()
+
+
+async def start_generation_workers(ai_service: AIService) -> None:
+    global _pool
+
+    if _pool is not None:
+        return
+
+    _pool = GenerationWorkerPool(
+        build_job_queue(),
+        ai_service,
+        settings.GENERATION_WORKERS,
+        settings.GENERATION_JOB_LEASE_SECONDS,
+    )
+    try:
+        await _pool.recover()
+    except Exception:
+        logger.exception("Recovering generation jobs at startup failed")
+    _pool.start()
+
+
+async def stop_generation_workers() -> None:
+    global _pool
+
+    if _pool is not None:
+        await _pool.stop()
+
+    _pool = None
@@ -1,47 +1,730 @@
 from __future__ import annotations
 
+import base64
+import json
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any, Sequence
 from uuid import UUID
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Insert,
+    Row,
+    Text,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import ResumeRecord, GenerationRecord, GenerationStatus
-from models import ResumeOut
+from models import ResumeOut, GenerationModelMetrics
+from services.ai_service import GenerationUsage
 
 
-async def create_resume(
-    session: AsyncSession, 
-    resume_out: ResumeOut
-    ) -> ResumeRecord:
-    """Storing a cleaned version of resume in the db"""
+class DuplicateResumeError(ValueError):
+    """The change would make a resume's cleaned_data identical to another stored resume."""
 
-    resume_record = ResumeRecord(
-        cleaned_data=resume_out.model_dump(
-            mode="json",
-            exclude={"ok", "warnings", "ai_resume_markdown", "ai_resume_pdf_url", "ai_model"},
-            exclude_none=True,
-    ))
+    def __init__(self):
+        super().__init__("An identical resume already exists")
 
-    session.add(resume_record)
-    await session.flush()
 
-    return resume_record
+CLEANED_DATA_EXCLUDE = {"ok", "warnings", "ai_resume_markdown", "ai_resume_pdf_url", "ai_model"}
+
+
+# Date fields that cleaned_data stores as "YYYY-MM", per cleaned section
+CLEANED_DATE_FIELDS = {
+    "cleaned_experience": ("start_date", "end_date"),
+    "cleaned_education": ("start_date", "graduation_date"),
+    "cleaned_certifications": ("issue_date", "expiry_date"),
+}
+
+
+def serialize_cleaned_data(resume_out: ResumeOut) -> dict[str, Any]:
+    """The JSON-safe cleaned resume fields that get stored as cleaned_data"""
+    return resume_out.model_dump(
+        mode="json",
+        exclude=CLEANED_DATA_EXCLUDE,
+        exclude_none=True,
+    )
+
+
+def serialize_cleaned_sections(sections: dict[str, Any]) -> dict[str, Any]:
+    """
+    serialize_cleaned_data for a subset of ResumeOut fields, e.g. the output
+    of clean_resume_sections. Cleared sections stay None.
+    """
+    present = {key for key, value in sections.items() if value is not None}
+    partial = ResumeOut.model_construct(_fields_set=present, **{key: sections[key] for key in present})
+    return {
+        **dict.fromkeys(sections),
+        **partial.model_dump(mode="json", include=present, exclude_none=True),
+    }
+
+
+def usage_columns(usage: GenerationUsage | None) -> dict[str, int | None]:
+    """GenerationRecord column values for a generation's usage metadata"""
+    return asdict(usage) if usage is not None else {}
+
+
+def load_resume_out(cleaned_data: dict[str, Any]) -> ResumeOut:
+    """Rebuild a ResumeOut from stored cleaned_data"""
+    data: dict[str, Any] = {"ok": True, **cleaned_data}
+
+    for section, date_fields in CLEANED_DATE_FIELDS.items():
+        entries = data.get(section)
+        if not entries:
+            continue
+
+        restored: list[dict[str, Any]] = []
+        for entry in entries:
+            entry = dict(entry)
+            for field in date_fields:
+                if isinstance(entry.get(field), str):
+                    entry[field] = f"{entry[field]}-01"
+            restored.append(entry)
+
+        data[section] = restored
+
+    return ResumeOut.model_validate(data)
+
+
+def content_hash_sql(cleaned_data: ColumnElement) -> ColumnElement[str]:
+    """
+    SQL for a resume's content_hash: SHA-256 hex of cleaned_data's jsonb text.
+    jsonb output has sorted keys and fixed spacing, so equal documents hash
+    equally however they were built. The content_hash migration backfills
+    existing rows with the same expression.
+    """
+    text_form = func.convert_to(cast(cleaned_data, Text), literal_column("'UTF8'"))
+    return func.encode(func.sha256(text_form), literal_column("'hex'"))
+
+
+def canonical_cleaned_data(cleaned_data: dict[str, Any]) -> str:
+    """Key for spotting identical cleaned_data in memory before it is sent"""
+    return json.dumps(cleaned_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def incoming_resumes(resumes: Sequence[ResumeRecord]) -> CTE:
+    """(id, cleaned_data, content_hash) rows for resumes about to be upserted"""
+    rows = values(
+        column("id", ResumeRecord.id.type),
+        column("cleaned_data", JSONB),
+        name="incoming_rows",
+    ).data([(resume.id, resume.cleaned_data) for resume in resumes])
+
+    return select(
+        rows.c.id,
+        rows.c.cleaned_data,
+        content_hash_sql(rows.c.cleaned_data).label("content_hash"),
+    ).cte("incoming_resumes")
+
+
+def insert_new_resumes(incoming: CTE) -> Insert:
+    """
+    INSERT the incoming resumes whose content_hash is not stored yet.
+    DO NOTHING leaves existing rows alone: no dead tuple or WAL record for a
+    resubmitted resume, but RETURNING then only reports the inserted rows.
+    """
+    return (
+        pg_insert(ResumeRecord)
+        .from_select(
+            ["id", "cleaned_data", "content_hash"],
+            select(incoming.c.id, incoming.c.cleaned_data, incoming.c.content_hash),
+        )
+        .on_conflict_do_nothing(index_elements=[ResumeRecord.content_hash])
+    )
+
+
+def stored_resumes(incoming: CTE) -> CTE:
+    """
+    (id, content_hash) of the row holding each incoming resume's content:
+    the rows just inserted, plus the already stored rows they conflicted
+    with. Every CTE reads the snapshot taken when the statement started, so
+    the second branch never sees the first one's rows. A conflicting row
+    committed by another transaction after that snapshot is missing from
+    both; create_resumes_with_generations retries those pairs.
+    """
+    inserted = (
+        insert_new_resumes(incoming)
+        .returning(ResumeRecord.id, ResumeRecord.content_hash)
+        .cte("inserted_resumes")
+    )
+    existing = select(ResumeRecord.id, ResumeRecord.content_hash).where(
+        ResumeRecord.content_hash.in_(select(incoming.c.content_hash))
+    )
+    return union_all(select(inserted.c.id, inserted.c.content_hash), existing).cte("stored_resumes")
+
+
+async def patch_resume_sections(
+    session: AsyncSession,
+    resume_id: UUID,
+    sections: dict[str, Any],
+    ) -> tuple[datetime, list[str]] | None:
+    """
+    Merge serialized sections (serialize_cleaned_sections; None clears a
+    section) into a stored resume in one UPDATE, without reading
+    cleaned_data back: `(cleaned_data || patch) - cleared_keys`.
+
+    The sections whose stored value actually differs are computed in the
+    same statement against the pre-update row and saved as changed_sections.
+    content_hash is recomputed from the merged document in the same
+    statement. Returns (updated_at, changed cleaned_data keys), or None if
+    the resume does not exist; raises DuplicateResumeError if the result is
+    identical to another stored resume (the transaction is then unusable).
+    """
+    patch = {key: value for key, value in sections.items() if value is not None}
+    cleared = [key for key, value in sections.items() if value is None]
+
+    # Cleared sections compare as JSON null, which is what a missing key reads as.
+    entry = func.jsonb_each(literal(sections, JSONB)).table_valued("key", "value").alias("section")
+    stored = func.coalesce(ResumeRecord.cleaned_data.op("->")(entry.c.key), literal_column("'null'::jsonb"))
+    changed = (
+        select(func.coalesce(func.array_agg(entry.c.key), literal([], ARRAY(Text))))
+        .where(stored.is_distinct_from(entry.c.value))
+        .scalar_subquery()
+    )
+
+    cleaned_data = ResumeRecord.cleaned_data.op("||", return_type=JSONB)(literal(patch, JSONB))
+    if cleared:
+        cleaned_data = cleaned_data.op("-", return_type=JSONB)(literal(cleared, ARRAY(Text)))
+
+    stmt = (
+        update(ResumeRecord)
+        .where(ResumeRecord.id == resume_id)
+        .values(
+            cleaned_data=cleaned_data,
+            content_hash=content_hash_sql(cleaned_data),
+            changed_sections=changed,
+            updated_at=func.now(),
+        )
+        .returning(ResumeRecord.updated_at, ResumeRecord.changed_sections)
+    )
+
+    try:
+        row = (await session.execute(stmt)).one_or_none()
+    except IntegrityError as exc:
+        if "uq_resumes_content_hash" in str(exc.orig):
+            raise DuplicateResumeError() from exc
+        raise
+
+    if row is None:
+        return None
+    return row.updated_at, list(row.changed_sections)
 
 
 async def create_generation(
     session: AsyncSession,
     resume_id: UUID,
-    status: GenerationStatus, 
-    markdown_output: str | None,  
-    ai_model: str | None
+    status: GenerationStatus,
+    markdown_output: str | None,
+    ai_model: str | None,
+    cache_key: str | None = None,
+    usage: GenerationUsage | None = None,
     ) -> GenerationRecord:
     """Store an AI generation attempt"""
     generation_record = GenerationRecord(
         resume_id=resume_id,
-        status=status, 
+        status=status,
         markdown_output=markdown_output,
-        ai_model=ai_model
+        ai_model=ai_model,
+        cache_key=cache_key,
+        **usage_columns(usage),
     )
 
     session.add(generation_record)
     await session.flush()
 
-    return generation_record
\ No newline at end of file
+    return generation_record
+
+
+def new_resume_with_generation(
+    resume_out: ResumeOut,
+    status: GenerationStatus,
+    markdown_output: str | None,
+    ai_model: str | None,
+    cache_key: str | None = None,
+    usage: GenerationUsage | None = None,
+    ) -> tuple[ResumeRecord, GenerationRecord]:
+    """Unsaved (resume, generation) records with client-generated ids"""
+    resume_record = ResumeRecord(id=uuid.uuid4(), cleaned_data=serialize_cleaned_data(resume_out))
+    generation_record = GenerationRecord(
+        id=uuid.uuid4(),
+        resume_id=resume_record.id,
+        status=status,
+        markdown_output=markdown_output,
+        ai_model=ai_model,
+        cache_key=cache_key,
+        **usage_columns(usage),
+    )
+    return resume_record, generation_record
+
+
+# Generation columns written on insert; created_at keeps its server default
+GENERATION_INSERT_COLUMNS = tuple(c for c in GenerationRecord.__table__.c if c.name != "created_at")
+
+# Pairs per INSERT; 17 bind parameters each stays well under PostgreSQL's 32767
+PAIRS_PER_INSERT = 1000
+
+
+def insert_resumes_with_generations(pairs: Sequence[tuple[ResumeRecord, GenerationRecord]]) -> Insert:
+    """
+    One statement writing both tables:
+
+        WITH incoming_resumes AS (SELECT id, cleaned_data, content_hash FROM (VALUES ...)),
+        inserted_resumes AS (INSERT INTO resumes ... ON CONFLICT (content_hash) DO NOTHING RETURNING id, content_hash),
+        stored_resumes AS (SELECT ... FROM inserted_resumes UNION ALL SELECT ... FROM resumes WHERE content_hash IN ...)
+        INSERT INTO generations (...) SELECT ... JOIN incoming_resumes JOIN stored_resumes
+        RETURNING id, resume_id
+
+    Each generation is attached to whichever row holds its resume's content,
+    new or already stored; RETURNING maps generation ids to those resume ids.
+    A generation whose resume row was not visible (see stored_resumes) is not
+    inserted and is missing from RETURNING.
+    Identical resumes within `pairs` are sent once, since one INSERT cannot
+    upsert the same row twice. Generation columns are cast because a VALUES
+    column that is NULL in every row would otherwise be typed text.
+    """
+    first_ids: dict[str, UUID] = {}
+    resume_ids: dict[UUID, UUID] = {}
+    resumes: list[ResumeRecord] = []
+    for resume, _ in pairs:
+        key = canonical_cleaned_data(resume.cleaned_data)
+        if key not in first_ids:
+            first_ids[key] = resume.id
+            resumes.append(resume)
+        resume_ids[resume.id] = first_ids[key]
+
+    incoming = incoming_resumes(resumes)
+    stored = stored_resumes(incoming)
+
+    new_generations = values(
+        *(column(c.name, c.type) for c in GENERATION_INSERT_COLUMNS),
+        name="new_generations",
+    ).data([
+        tuple(
+            resume_ids[generation.resume_id] if c.key == "resume_id" else getattr(generation, c.key)
+            for c in GENERATION_INSERT_COLUMNS
+        )
+        for _, generation in pairs
+    ])
+
+    rows = (
+        select(*(
+            stored.c.id if c.key == "resume_id" else cast(new_generations.c[c.name], c.type)
+            for c in GENERATION_INSERT_COLUMNS
+        ))
+        .select_from(new_generations)
+        .join(incoming, incoming.c.id == new_generations.c.resume_id)
+        .join(stored, stored.c.content_hash == incoming.c.content_hash)
+    )
+    return (
+        insert(GenerationRecord)
+        .from_select([c.name for c in GENERATION_INSERT_COLUMNS], rows)
+        .add_cte(incoming, stored)
+        .returning(GenerationRecord.id, GenerationRecord.resume_id)
+    )
+
+
+async def create_resume_with_generation(
+    session: AsyncSession,
+    resume_out: ResumeOut,
+    status: GenerationStatus,
+    markdown_output: str | None,
+    ai_model: str | None,
+    cache_key: str | None = None,
+    usage: GenerationUsage | None = None,
+    ) -> tuple[ResumeRecord, GenerationRecord]:
+    """
+    Store a cleaned resume and its generation in a single round trip. If an
+    identical resume is already stored, the generation attaches to it.
+
+    The returned records carry the stored ids but are not attached to the
+    session, and server defaults (created_at) are not loaded.
+    """
+    pair = new_resume_with_generation(resume_out, status, markdown_output, ai_model, cache_key, usage)
+    await create_resumes_with_generations(session, [pair])
+    return pair
+
+
+async def create_resumes_with_generations(
+    session: AsyncSession,
+    pairs: Sequence[tuple[ResumeRecord, GenerationRecord]],
+    ) -> None:
+    """
+    Store many (resume, generation) pairs, one statement per PAIRS_PER_INSERT.
+
+    Records must carry client-generated ids (new_resume_with_generation) so
+    the generations can reference their resumes before anything is written.
+    They are read as plain values and never added to the session. A resume
+    whose cleaned_data is already stored is not inserted again: its records
+    are updated to the stored resume's id instead.
+
+    Pairs left out because an identical resume was committed concurrently
+    are sent again once; the retry's fresh snapshot sees that row.
+    """
+    for start in range(0, len(pairs), PAIRS_PER_INSERT):
+        chunk = pairs[start:start + PAIRS_PER_INSERT]
+
+        for _ in range(2):
+            result = await session.execute(insert_resumes_with_generations(chunk))
+            stored_ids = dict(result.all())
+
+            for resume, generation in chunk:
+                if generation.id in stored_ids:
+                    resume.id = generation.resume_id = stored_ids[generation.id]
+
+            chunk = [pair for pair in chunk if pair[1].id not in stored_ids]
+            if not chunk:
+                break
+        else:
+            raise RuntimeError(f"{len(chunk)} generations could not be linked to a stored resume")
+
+
+def encode_resume_cursor(created_at: datetime, resume_id: UUID) -> str:
+    """Opaque keyset cursor: base64url of the last row's (created_at, id)"""
+    raw = json.dumps([created_at.isoformat(), str(resume_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_resume_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Inverse of encode_resume_cursor; raises ValueError for anything else"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, resume_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), UUID(resume_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+# ResumeItem columns; listing never loads cleaned_data
+RESUME_ITEM_COLUMNS = (ResumeRecord.id, ResumeRecord.created_at, ResumeRecord.updated_at)
+
+
+async def list_resumes_page(
+    session: AsyncSession,
+    limit: int,
+    after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[Row], str | None]:
+    """
+    Newest-first page of resumes strictly after the `after` (created_at, id)
+    position, read with a row-value comparison the (created_at, id) index
+    can seek to. Fetches limit + 1 rows to know whether another page exists.
+    Returns the rows and the next page's cursor (None on the last page).
+    """
+    stmt = (
+        select(*RESUME_ITEM_COLUMNS)
+        .order_by(ResumeRecord.created_at.desc(), ResumeRecord.id.desc())
+        .limit(limit + 1)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(ResumeRecord.created_at, ResumeRecord.id) < tuple_(*after))
+
+    rows = list((await session.execute(stmt)).all())
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_resume_cursor(rows[-1].created_at, rows[-1].id)
+
+
+async def list_resumes_offset(
+    session: AsyncSession,
+    skip: int,
+    limit: int,
+    ) -> tuple[list[Row], bool]:
+    """Legacy OFFSET page and whether more rows follow; cost grows with `skip`"""
+    stmt = (
+        select(*RESUME_ITEM_COLUMNS)
+        .order_by(ResumeRecord.created_at.desc(), ResumeRecord.id.desc())
+        .offset(skip)
+        .limit(limit + 1)
+    )
+    rows = list((await session.execute(stmt)).all())
+    return rows[:limit], len(rows) > limit
+
+
+async def count_resumes(session: AsyncSession) -> int:
+    """Exact count(*) over resumes (a full scan)"""
+    result = await session.execute(select(func.count()).select_from(ResumeRecord))
+    return result.scalar_one()
+
+
+async def estimate_resumes(session: AsyncSession) -> int | None:
+    """
+    Row estimate from planner statistics (pg_class.reltuples), kept current by
+    autovacuum/ANALYZE; None if the table has never been analyzed
+    """
+    result = await session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": ResumeRecord.__tablename__},
+    )
+    estimate = result.scalar_one_or_none()
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
+async def find_completed_generation(
+    session: AsyncSession,
+    cache_key: str,
+    ) -> GenerationRecord | None:
+    """Most recent COMPLETED generation stored under the given cache key"""
+    stmt = (
+        select(GenerationRecord)
+        .where(
+            GenerationRecord.cache_key == cache_key,
+            GenerationRecord.status == GenerationStatus.COMPLETED,
+            GenerationRecord.markdown_output.is_not(None),
+        )
+        .order_by(GenerationRecord.created_at.desc())
+        .limit(1)
+    )
+
+    result = await session.execute(stmt)
+    return result.scalars().first()
+
+
+async def get_generation(
+    session: AsyncSession,
+    generation_id: UUID,
+    ) -> GenerationRecord | None:
+    return await session.get(GenerationRecord, generation_id)
+
+
+# Column values that mark a generation as claimed by a worker
+CLAIM_VALUES = {"status": GenerationStatus.RUNNING, "started_at": func.now(), "heartbeat_at": None, "run_after": None}
+
+
+def owned_by_claim(generation_id: UUID, claimed_at: datetime) -> list[ColumnElement[bool]]:
+    """
+    WHERE clauses matching a generation only while it is still RUNNING under
+    the claim that set started_at = claimed_at. Once the row is reclaimed or
+    claimed again, updates from the old worker match nothing.
+    """
+    return [
+        GenerationRecord.id == generation_id,
+        GenerationRecord.status == GenerationStatus.RUNNING,
+        GenerationRecord.started_at == claimed_at,
+    ]
+
+
+async def claim_generation(
+    session: AsyncSession,
+    generation_id: UUID,
+    ) -> datetime | None:
+    """
+    Move a PENDING generation to RUNNING and return the claim's started_at;
+    None if another worker got it first
+    """
+    stmt = (
+        update(GenerationRecord)
+        .where(
+            GenerationRecord.id == generation_id,
+            GenerationRecord.status == GenerationStatus.PENDING,
+        )
+        .values(**CLAIM_VALUES)
+        .returning(GenerationRecord.started_at)
+    )
+
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def claim_next_pending_generation(session: AsyncSession) -> tuple[UUID, datetime] | None:
+    """
+    Claim the oldest PENDING generation with SELECT ... FOR UPDATE SKIP LOCKED,
+    so several API nodes can drain the same generations table. Requeued rows
+    are skipped until their run_after time. Returns (id, started_at).
+    """
+    stmt = (
+        select(GenerationRecord.id)
+        .where(
+            GenerationRecord.status == GenerationStatus.PENDING,
+            or_(GenerationRecord.run_after.is_(None), GenerationRecord.run_after <= func.now()),
+        )
+        .order_by(GenerationRecord.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+
+    result = await session.execute(stmt)
+    generation_id = result.scalar_one_or_none()
+    if generation_id is None:
+        return None
+
+    result = await session.execute(
+        update(GenerationRecord)
+        .where(GenerationRecord.id == generation_id)
+        .values(**CLAIM_VALUES)
+        .returning(GenerationRecord.started_at)
+    )
+    return generation_id, result.scalar_one()
+
+
+async def renew_generation_lease(
+    session: AsyncSession,
+    generation_id: UUID,
+    claimed_at: datetime,
+    ) -> bool:
+    """Push back the lease of a running claim; False if the claim was lost"""
+    stmt = (
+        update(GenerationRecord)
+        .where(*owned_by_claim(generation_id, claimed_at))
+        .values(heartbeat_at=func.now())
+        .returning(GenerationRecord.id)
+    )
+
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none() is not None
+
+
+async def requeue_generation(
+    session: AsyncSession,
+    generation_id: UUID,
+    claimed_at: datetime,
+    delay: float,
+    ) -> bool:
+    """
+    Put a claimed generation back to PENDING, not to be claimed for `delay`
+    seconds; False if the claim was lost
+    """
+    stmt = (
+        update(GenerationRecord)
+        .where(*owned_by_claim(generation_id, claimed_at))
+        .values(
+            status=GenerationStatus.PENDING,
+            started_at=None,
+            heartbeat_at=None,
+            run_after=func.now() + timedelta(seconds=delay),
+        )
+        .returning(GenerationRecord.id)
+    )
+
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none() is not None
+
+
+async def reclaim_stale_generations(session: AsyncSession, lease: float) -> list[UUID]:
+    """
+    Return RUNNING generations whose lease (claim or last renewal) is older
+    than `lease` seconds to PENDING: their worker crashed or stalled, or the
+    process stopped mid-job. Rows without started_at predate leases and
+    count as expired.
+    """
+    renewed_at = func.coalesce(GenerationRecord.heartbeat_at, GenerationRecord.started_at)
+    stmt = (
+        update(GenerationRecord)
+        .where(
+            GenerationRecord.status == GenerationStatus.RUNNING,
+            or_(
+                GenerationRecord.started_at.is_(None),
+                renewed_at < func.now() - timedelta(seconds=lease),
+            ),
+        )
+        .values(status=GenerationStatus.PENDING, started_at=None, heartbeat_at=None)
+        .returning(GenerationRecord.id)
+    )
+
+    result = await session.execute(stmt)
+    return list(result.scalars())
+
+
+async def list_pending_generations(session: AsyncSession) -> list[tuple[UUID, float]]:
+    """Every PENDING generation, oldest first, with the seconds left until it may run"""
+    wait = func.greatest(func.extract("epoch", GenerationRecord.run_after - func.now()), 0)
+    stmt = (
+        select(GenerationRecord.id, func.coalesce(wait, 0))
+        .where(GenerationRecord.status == GenerationStatus.PENDING)
+        .order_by(GenerationRecord.created_at)
+    )
+
+    result = await session.execute(stmt)
+    return [(generation_id, float(delay)) for generation_id, delay in result]
+
+
+async def finish_generation(
+    session: AsyncSession,
+    generation_id: UUID,
+    claimed_at: datetime,
+    status: GenerationStatus,
+    markdown_output: str | None = None,
+    cache_key: str | None = None,
+    usage: GenerationUsage | None = None,
+    ) -> bool:
+    """
+    Record the outcome of a claimed generation. False, and nothing written,
+    if the claim was lost (the row was reclaimed and maybe run again).
+    """
+    stmt = (
+        update(GenerationRecord)
+        .where(*owned_by_claim(generation_id, claimed_at))
+        .values(
+            status=status,
+            markdown_output=markdown_output,
+            cache_key=cache_key,
+            **usage_columns(usage),
+        )
+        .returning(GenerationRecord.id)
+    )
+
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none() is not None
+
+
+async def get_generation_metrics(
+    session: AsyncSession,
+    window: timedelta,
+    ) -> list[GenerationModelMetrics]:
+    """
+    Latency percentiles and token totals per model for generations completed
+    in the last `window`. The cutoff is computed by the database, on the
+    same clock that filled created_at.
+    """
+
+    def percentile(column, fraction: float):
+        return func.percentile_cont(fraction).within_group(column)
+
+    latency = GenerationRecord.latency_ms
+    ttft = GenerationRecord.ttft_ms
+
+    stmt = (
+        select(
+            GenerationRecord.ai_model,
+            func.count().label("generations"),
+            func.count(latency).label("upstream_calls"),
+            percentile(latency, 0.50).label("latency_ms_p50"),
+            percentile(latency, 0.95).label("latency_ms_p95"),
+            percentile(latency, 0.99).label("latency_ms_p99"),
+            percentile(ttft, 0.50).label("ttft_ms_p50"),
+            percentile(ttft, 0.95).label("ttft_ms_p95"),
+            percentile(ttft, 0.99).label("ttft_ms_p99"),
+            func.coalesce(func.sum(GenerationRecord.input_tokens), 0).label("input_tokens"),
+            func.coalesce(func.sum(GenerationRecord.output_tokens), 0).label("output_tokens"),
+            func.coalesce(func.sum(GenerationRecord.cached_tokens), 0).label("cached_tokens"),
+            func.count().filter(GenerationRecord.attempts > 1).label("retried"),
+            func.count().filter(GenerationRecord.hedge_won.is_(True)).label("hedge_wins"),
+        )
+        .where(
+            GenerationRecord.status == GenerationStatus.COMPLETED,
+            GenerationRecord.created_at >= func.now() - window,
+        )
+        .group_by(GenerationRecord.ai_model)
+        .order_by(GenerationRecord.ai_model)
+    )
+
+    result = await session.execute(stmt)
+    return [GenerationModelMetrics.model_validate(row._mapping) for row in result]
+
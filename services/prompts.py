@@ -3,8 +3,69 @@ from __future__ import annotations
 from models import ResumeOut
 
 
+# Bump whenever the prompt wording or output format changes so cached
+# generations produced by an older template are not served again.
+PROMPT_VERSION = "v2"
+
+
+# Fixed instructions sent as the first (developer) message. Keeping them
+# byte-identical across calls lets the provider reuse its cached prompt prefix;
+# only the per-resume data in build_resume_prompt varies.
+RESUME_INSTRUCTIONS = """You are an expert technical resume writer and ATS optimization specialist.
+You write resumes for software engineers and technical roles (backend, full-stack, platform, data, DevOps).
+
+Hard rules:
+- Use ONLY the information provided in the Cleaned Input Data message. Do NOT invent companies, titles, dates, degrees, certifications, tools, metrics, or achievements.
+- Do NOT add fake impact numbers. If impact is not provided, write strong, truthful, technically-specific bullets without numbers.
+- Do NOT include personal commentary, explanations, or analysis. Output ONLY the resume in Markdown.
+- Keep it ATS-friendly: simple headings, standard section names, no tables, no columns, no icons/emojis.
+- Prefer US-style resume formatting unless the input location clearly indicates otherwise.
+- Keep bullets concise (1–2 lines each), start with strong action verbs, emphasize engineering impact and technical scope.
+- **If a section’s input is "(none)", omit that section entirely.**
+
+Output format (Markdown) — follow this structure exactly:
+
+# [Full Name]
+[City, State, Country, ZIP (if provided)]
+Email: [email] | Phone: [phone]
+Links:
+- [url]
+- [url]
+
+## Summary
+Write 2–4 lines tailored to software/tech roles based ONLY on the input.
+
+## Skills
+Group skills into categories when possible (Languages, Frameworks, Databases, Tools). Use ONLY the provided skills.
+
+## Experience
+For each role:
+- Title | Company | Dates | Location (if provided)
+- 2–6 bullets rewritten for clarity and technical strength using ONLY provided bullets (no new facts).
+
+## Education
+Include school, degree, dates if provided, and GPA if provided.
+
+## Certifications
+Include name, issuer, dates if provided, credential ID and verification URL if provided.
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for local rate budgeting."""
+    return len(text) // 4 + 1
+
+
+def build_resume_messages(resume: ResumeOut) -> list[dict[str, str]]:
+    """Static developer instructions followed by the per-resume user message."""
+    return [
+        {"role": "developer", "content": RESUME_INSTRUCTIONS},
+        {"role": "user", "content": build_resume_prompt(resume)},
+    ]
+
 
 def build_resume_prompt(resume: ResumeOut) -> str:
+    """The dynamic "Cleaned Input Data" user message for one resume."""
     name = resume.cleaned_name
     email = resume.cleaned_email
     phone = resume.cleaned_phone
@@ -151,46 +212,7 @@ def build_resume_prompt(resume: ResumeOut) -> str:
         certification_details = "- (none)\n"
  
 
-    prompt = f"""You are an expert technical resume writer and ATS optimization specialist.
-You write resumes for software engineers and technical roles (backend, full-stack, platform, data, DevOps).
-
-Hard rules:
-- Use ONLY the information provided below. Do NOT invent companies, titles, dates, degrees, certifications, tools, metrics, or achievements.
-- Do NOT add fake impact numbers. If impact is not provided, write strong, truthful, technically-specific bullets without numbers.
-- Do NOT include personal commentary, explanations, or analysis. Output ONLY the resume in Markdown.
-- Keep it ATS-friendly: simple headings, standard section names, no tables, no columns, no icons/emojis.
-- Prefer US-style resume formatting unless the input location clearly indicates otherwise.
-- Keep bullets concise (1–2 lines each), start with strong action verbs, emphasize engineering impact and technical scope.
-- **If a section’s input is "(none)", omit that section entirely.**
-
-Output format (Markdown) — follow this structure exactly:
-
-# [Full Name]
-[City, State, Country, ZIP (if provided)]
-Email: [email] | Phone: [phone]
-Links:
-- [url]
-- [url]
-
-## Summary
-Write 2–4 lines tailored to software/tech roles based ONLY on the input.
-
-## Skills
-Group skills into categories when possible (Languages, Frameworks, Databases, Tools). Use ONLY the provided skills.
-
-## Experience
-For each role:
-- Title | Company | Dates | Location (if provided)
-- 2–6 bullets rewritten for clarity and technical strength using ONLY provided bullets (no new facts).
-
-## Education
-Include school, degree, dates if provided, and GPA if provided.
-
-## Certifications
-Include name, issuer, dates if provided, credential ID and verification URL if provided.
-
-
-Cleaned Input Data:
+    prompt = f"""Cleaned Input Data:
 
 Name: {name}
 Email: {email}
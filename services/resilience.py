@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections import deque
+
+import openai
+from fastapi import HTTPException
+
+
+class AIRateLimitError(RuntimeError):
+    """Local request/token budget exhausted and the wait queue is full."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("AI rate limit exceeded")
+        self.retry_after = retry_after
+
+
+class AICircuitOpenError(RuntimeError):
+    """Upstream failed repeatedly; calls are rejected until the breaker resets."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("AI circuit breaker is open")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding at most `per_minute` tokens."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
+class AIRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budgets for upstream AI calls.
+
+    Callers that cannot be admitted immediately wait in FIFO order. Once
+    `max_queue` callers are already waiting, new ones fail fast with
+    AIRateLimitError so the route can answer 429 with Retry-After.
+    A budget of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_queue: int):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_queue = max(0, max_queue)
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._queue_lock = asyncio.Lock()
+
+    def _wait_time(self, tokens: int) -> float:
+        now = time.monotonic()
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1, now))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_time(tokens, now))
+        return wait
+
+    def _try_take(self, tokens: int) -> float:
+        wait = self._wait_time(tokens)
+        if wait == 0:
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None:
+                self.tokens.take(tokens)
+        return wait
+
+    async def acquire(self, tokens: int) -> None:
+        if self.waiting == 0 and self._try_take(tokens) == 0:
+            self.admitted += 1
+            return
+
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise AIRateLimitError(retry_after=self._wait_time(tokens) * (self.waiting + 1))
+
+        self.waiting += 1
+        try:
+            async with self._queue_lock:
+                while (wait := self._try_take(tokens)) > 0:
+                    await asyncio.sleep(wait)
+        finally:
+            self.waiting -= 1
+
+        self.admitted += 1
+
+    def try_acquire(self, tokens: int) -> bool:
+        """Take budget only if it is available right now and nobody is queued."""
+        if self.waiting == 0 and self._try_take(tokens) == 0:
+            self.admitted += 1
+            return True
+        return False
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "waiting": self.waiting,
+            "max_queue": self.max_queue,
+            "requests_available": self.requests.tokens if self.requests else -1,
+            "tokens_available": self.tokens.tokens if self.tokens else -1,
+        }
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive upstream failures. After
+    `reset_timeout` seconds one trial call is let through (half-open); its
+    outcome closes the breaker or opens it again. A trial that ends without
+    an upstream answer (cancelled, say) must be given back with release_trial.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._trial_in_flight = False
+
+    def _remaining(self) -> float:
+        return self.reset_timeout - (time.monotonic() - self.opened_at)
+
+    def check(self) -> None:
+        """Raise if before_call would reject right now, without claiming the trial."""
+        if self.state == self.CLOSED:
+            return
+
+        remaining = self._remaining()
+        if (self.state == self.OPEN and remaining > 0) or (self.state == self.HALF_OPEN and self._trial_in_flight):
+            raise AICircuitOpenError(retry_after=max(remaining, 1.0))
+
+    def before_call(self) -> None:
+        if self.state == self.CLOSED:
+            return
+
+        remaining = self._remaining()
+
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+        if self.state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+
+        raise AICircuitOpenError(retry_after=max(remaining, 1.0))
+
+    def release_trial(self) -> None:
+        """Let the next call be the half-open trial; no-op once an outcome was recorded."""
+        if self.state == self.HALF_OPEN:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+            self._trial_in_flight = False
+
+    def stats(self) -> dict[str, int | float | str]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+        }
+
+
+class LatencyWindow:
+    """Rolling window of recent successful upstream call durations, in seconds."""
+
+    def __init__(self, size: int = 200):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        if not self._samples:
+            return None
+
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Transient upstream errors worth another attempt."""
+    if isinstance(exc, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in (408, 409) or exc.status_code >= 500
+    return isinstance(exc, asyncio.TimeoutError)
+
+
+def upstream_retry_after(exc: BaseException) -> float | None:
+    """Seconds from an upstream Retry-After header, if the error carries one."""
+    response = getattr(exc, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: float | None = None) -> float:
+    """Exponential backoff with full jitter, never shorter than an upstream Retry-After."""
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    return max(delay, retry_after or 0.0)
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Errors that say the upstream is unhealthy, as opposed to a bad request."""
+    if isinstance(exc, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code >= 500
+    if isinstance(exc, (AIRateLimitError, AICircuitOpenError)):
+        return False
+    return isinstance(exc, (asyncio.TimeoutError, RuntimeError))
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
+
+
+def ai_http_exception(exc: Exception) -> HTTPException:
+    """Translate an AI call failure into the HTTP error returned to clients."""
+    if isinstance(exc, AIRateLimitError):
+        return HTTPException(
+            status_code=429,
+            detail="AI rate limit exceeded",
+            headers={"Retry-After": retry_after_header(exc.retry_after)},
+        )
+
+    if isinstance(exc, openai.RateLimitError):
+        retry_after = exc.response.headers.get("retry-after", "1")
+        return HTTPException(
+            status_code=429,
+            detail="AI rate limit exceeded",
+            headers={"Retry-After": retry_after},
+        )
+
+    if isinstance(exc, AICircuitOpenError):
+        return HTTPException(
+            status_code=503,
+            detail="AI service temporarily unavailable",
+            headers={"Retry-After": retry_after_header(exc.retry_after)},
+        )
+
+    if isinstance(exc, (openai.APITimeoutError, asyncio.TimeoutError)):
+        return HTTPException(status_code=504, detail="AI generation timed out")
+
+    return HTTPException(status_code=503, detail="AI generation failed")
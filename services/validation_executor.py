@@ -0,0 +1,217 @@
+"""
+Runs resume validation off the event loop.
+
+clean_and_validate_resume is synchronous CPU work (phonenumbers, regexes,
+Pydantic). With VALIDATION_EXECUTOR set to "thread" or "process", payloads
+heavier than VALIDATION_OFFLOAD_MIN_ITEMS and all batch validation run in
+one shared pool; "none" keeps everything inline on the loop.
+
+Task functions run in the pool and must stay module-level and return
+picklable values: HTTPException does not survive a process boundary, so
+workers hand back a ValidationFailure that the caller turns back into one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple, TypeVar
+
+from fastapi import HTTPException
+
+from config import settings
+from models import ResumeIn, ResumeOut
+from services.validation_service import (
+    clean_and_validate_resume,
+    parse_ndjson_item,
+    payload_weight,
+    validate_batch_item,
+)
+from validations import to_e164_many
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ("none", "thread", "process")
+
+T = TypeVar("T")
+
+
+class ValidationFailure(NamedTuple):
+    """Picklable stand-in for an HTTPException raised inside a task."""
+
+    status_code: int
+    detail: Any
+
+    def to_exception(self) -> HTTPException:
+        return HTTPException(status_code=self.status_code, detail=self.detail)
+
+
+def _capture(fn: Callable[[Any], T], arg: Any) -> T | ValidationFailure:
+    try:
+        return fn(arg)
+    except HTTPException as exc:
+        return ValidationFailure(exc.status_code, exc.detail)
+
+
+def validate_payload_task(payload: ResumeIn) -> ResumeOut | ValidationFailure:
+    return _capture(clean_and_validate_resume, payload)
+
+
+def validate_items_task(items: list[Any]) -> list[ResumeOut | ValidationFailure]:
+    # Parse each distinct phone once up front; item validation then hits the cache.
+    to_e164_many(raw["phone"] for raw in items if isinstance(raw, dict) and isinstance(raw.get("phone"), str))
+    return [_capture(validate_batch_item, raw) for raw in items]
+
+
+def validate_line_task(line: bytes) -> dict[str, Any] | ValidationFailure:
+    """Clean one NDJSON line and return the ResumeOut already dumped to JSON types."""
+    result = _capture(parse_ndjson_item, line)
+    if isinstance(result, ValidationFailure):
+        return result
+    return result.model_dump(mode="json")
+
+
+WARMUP_PAYLOAD: dict[str, Any] = {
+    "name": "Dr. Jane Q. Doe",
+    "email": "Jane.Doe@Example.com",
+    "phone": "+1 816 555 0100",
+    "location": {"country": "united states", "state": "missouri", "city": "kansas city"},
+    "urls": ["https://github.com/janedoe"],
+    "experience": [{
+        "company": "acme corp",
+        "position": ["software engineer"],
+        "start_date": "2019-03",
+        "end_date": "Present",
+        "description": ["Built the  ingestion pipeline."],
+    }],
+    "skills": ["Python", "FastAPI"],
+    "education": [{
+        "school": "university of missouri",
+        "degree": "b.s. computer science",
+        "start_date": "2014-08",
+        "graduation_date": "May 2018",
+        "gpa": 3.6,
+    }],
+    "certifications": [{
+        "name": "AWS Certified Developer",
+        "issuer": "amazon web services",
+        "issue_date": "2021-03",
+    }],
+}
+
+
+def warm_validation() -> None:
+    """Load phonenumbers metadata and build the model validators once, before real traffic."""
+    clean_and_validate_resume(ResumeIn.model_validate(WARMUP_PAYLOAD))
+
+
+class ValidationExecutor:
+    """A thread or spawn-based process pool shared by every validation path."""
+
+    def __init__(self, mode: str, workers: int):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported validation executor mode: {mode!r}")
+
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.offloaded = 0
+        self._pool: Executor | None = None
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if self.mode == "process":
+            # spawn, not fork: the parent already holds an event loop and sockets.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_validation,
+            )
+            # Workers start lazily; one call each brings them all up (and warm) now.
+            await asyncio.gather(*(loop.run_in_executor(self._pool, int) for _ in range(self.workers)))
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="validation")
+            await loop.run_in_executor(self._pool, warm_validation)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> asyncio.Future[T]:
+        self.offloaded += 1
+        return asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "offload_min_items": settings.VALIDATION_OFFLOAD_MIN_ITEMS,
+            "offloaded": self.offloaded,
+        }
+
+
+_executor: ValidationExecutor | None = None
+
+
+def get_validation_executor() -> ValidationExecutor | None:
+    """The running pool, or None when validation runs inline."""
+    return _executor
+
+
+async def start_validation_executor() -> None:
+    global _executor
+
+    if _executor is not None or settings.VALIDATION_EXECUTOR == "none":
+        return
+
+    executor = ValidationExecutor(settings.VALIDATION_EXECUTOR, settings.VALIDATION_EXECUTOR_WORKERS)
+    await executor.start()
+    _executor = executor
+    logger.info("Validation executor started (%s, %s workers)", executor.mode, executor.workers)
+
+
+async def stop_validation_executor() -> None:
+    global _executor
+
+    if _executor is not None:
+        await asyncio.to_thread(_executor.shutdown)
+
+    _executor = None
+
+
+def submit_validation(fn: Callable[..., T], *args: Any) -> asyncio.Future[T]:
+    """Run a task function in the pool, or inline into a finished future without one."""
+    if _executor is not None:
+        return _executor.submit(fn, *args)
+
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(fn(*args))
+    return future
+
+
+async def validate_resume(payload: ResumeIn) -> ResumeOut:
+    """clean_and_validate_resume, offloaded when the payload is heavy enough to stall the loop."""
+    if _executor is None or payload_weight(payload) < settings.VALIDATION_OFFLOAD_MIN_ITEMS:
+        return clean_and_validate_resume(payload)
+
+    result = await _executor.submit(validate_payload_task, payload)
+    if isinstance(result, ValidationFailure):
+        raise result.to_exception()
+    return result
+
+
+async def validate_items(items: list[Any]) -> list[ResumeOut | ValidationFailure]:
+    """Validate raw batch items, split into one chunk per worker when a pool is running."""
+    if _executor is None:
+        return validate_items_task(items)
+
+    size = math.ceil(len(items) / _executor.workers) or 1
+    chunks = await asyncio.gather(*(
+        _executor.submit(validate_items_task, items[start:start + size])
+        for start in range(0, len(items), size)
+    ))
+    return [result for chunk in chunks for result in chunk]
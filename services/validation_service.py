@@ -1,4 +1,10 @@
-from models import ResumeIn, ResumeOut
+import json
+from typing import Any
+
+from fastapi import HTTPException
+from pydantic import HttpUrl, ValidationError
+
+from models import ResumeIn, ResumeOut, ResumePatch, build_trusted
 from validations import (
     clean_name,
     to_e164,
@@ -39,16 +45,85 @@ def clean_and_validate_resume(payload: ResumeIn) -> ResumeOut:
 
     warnings = resume_warnings(payload) + education_warnings
 
-    return ResumeOut(
+    return build_trusted(
+        ResumeOut,
         ok=True,
         cleaned_name=cleaned_name,
         cleaned_email=cleaned_email,
         cleaned_phone=cleaned_phone,
         cleaned_location=cleaned_location,
-        cleaned_urls=cleaned_urls,
+        cleaned_urls=[HttpUrl(url) for url in cleaned_urls],
         cleaned_experience=cleaned_experience,
         cleaned_education=cleaned_education,
         cleaned_skills=cleaned_skills,
         cleaned_certifications=cleaned_certifications,
         warnings=warnings,
-    )
\ No newline at end of file
+    )
+
+
+def clean_resume_sections(patch: ResumePatch) -> tuple[dict[str, Any], list[str]]:
+    """
+    Clean only the sections present in a ResumePatch.
+
+    Returns the cleaned values keyed by their ResumeOut field
+    (cleaned_name, cleaned_experience, ...) plus any warnings those
+    sections produced; None means the section was cleared.
+    """
+    cleaned: dict[str, Any] = {}
+    warnings: list[str] = []
+
+    for section in ResumePatch.model_fields:
+        if section not in patch.model_fields_set:
+            continue
+
+        value = getattr(patch, section)
+        if section == "name":
+            cleaned["cleaned_name"] = clean_name(value)
+        elif section == "email":
+            cleaned["cleaned_email"] = clean_email(str(value))
+        elif section == "phone":
+            cleaned["cleaned_phone"] = to_e164(value)
+        elif section == "location":
+            cleaned["cleaned_location"] = clean_location(value)
+        elif section == "urls":
+            urls = clean_urls([str(url) for url in value] if value else [])
+            cleaned["cleaned_urls"] = [HttpUrl(url) for url in urls]
+        elif section == "experience":
+            cleaned["cleaned_experience"] = clean_experience(value)
+        elif section == "skills":
+            cleaned["cleaned_skills"] = clean_skills(value)
+        elif section == "education":
+            cleaned["cleaned_education"], education_warnings = clean_education(value)
+            warnings += education_warnings
+        elif section == "certifications":
+            cleaned["cleaned_certifications"] = clean_certifications(value)
+
+    return cleaned, warnings
+
+
+def payload_weight(payload: ResumeIn) -> int:
+    """Rough validation cost: the number of list entries the cleaners walk."""
+    weight = len(payload.skills) + len(payload.urls or ())
+    for experience in payload.experience or ():
+        weight += 1 + len(experience.position or ()) + len(experience.description or ())
+    return weight + len(payload.education or ()) + len(payload.certifications or ())
+
+
+def validate_batch_item(raw: Any) -> ResumeOut:
+    """Parse and clean one batch item; raises HTTPException(422) on bad input."""
+    try:
+        payload = ResumeIn.model_validate(raw)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors(include_url=False))
+
+    return clean_and_validate_resume(payload)
+
+
+def parse_ndjson_item(line: bytes) -> ResumeOut:
+    """Decode and clean one NDJSON line; raises HTTPException on bad input."""
+    try:
+        raw = json.loads(line)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {exc}")
+
+    return validate_batch_item(raw)
@@ -1,7 +1,34 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
 import db.session as db_session
 import pytest
 
 from config import settings
+from db import get_db
+from main import app
+
+
+class FakeSession:
+    """
+    AsyncSession stand-in: begin() is a no-op transaction and execute() is an
+    AsyncMock returning `result`, whose scalar_one() returns `scalar`.
+    """
+
+    def __init__(self, scalar=None):
+        self.result = MagicMock()
+        self.result.scalar_one.return_value = scalar
+        self.execute = AsyncMock(return_value=self.result)
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self
+
+
+@pytest.fixture(autouse=True)
+def strict_model_validation(monkeypatch):
+    """Re-validate cleaner output models so schema violations fail tests."""
+    monkeypatch.setattr(settings, "STRICT_MODEL_VALIDATION", True)
 
 
 @pytest.fixture
@@ -35,3 +62,43 @@ def missing_database_url():
         settings.DATABASE_URL = old_database_url
         db_session._engine = old_engine
         db_session._async_session_local = old_sessionmaker
+
+
+@pytest.fixture
+def fake_session():
+    return FakeSession()
+
+
+@pytest.fixture
+def fake_session_scope(monkeypatch):
+    """
+    Patch `module.session_scope` to yield `session` (a new FakeSession by
+    default) and return that session.
+    """
+
+    def patch(module, session=None):
+        session = FakeSession() if session is None else session
+
+        @asynccontextmanager
+        async def session_scope():
+            yield session
+
+        monkeypatch.setattr(module, "session_scope", session_scope)
+        return session
+
+    return patch
+
+
+@pytest.fixture
+def fake_db(fake_session):
+    """Route tests: get_db yields the fake_session fixture."""
+
+    async def fake_get_db():
+        yield fake_session
+
+    app.dependency_overrides[get_db] = fake_get_db
+    try:
+        yield fake_session
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
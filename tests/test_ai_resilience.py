@@ -0,0 +1,61 @@
+import pytest
+
+from services import (
+    AICircuitOpenError,
+    AIRateLimitError,
+    AIRateLimiter,
+    CircuitBreaker,
+    ai_http_exception,
+)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_rejects_when_budget_and_queue_are_exhausted():
+    limiter = AIRateLimiter(requests_per_minute=1, tokens_per_minute=0, max_queue=0)
+
+    await limiter.acquire(tokens=100)
+
+    with pytest.raises(AIRateLimitError) as exc_info:
+        await limiter.acquire(tokens=100)
+
+    assert exc_info.value.retry_after > 0
+    assert limiter.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_enforces_token_budget():
+    limiter = AIRateLimiter(requests_per_minute=0, tokens_per_minute=1000, max_queue=0)
+
+    await limiter.acquire(tokens=900)
+
+    with pytest.raises(AIRateLimitError):
+        await limiter.acquire(tokens=200)
+
+
+def test_circuit_breaker_opens_after_threshold_and_allows_one_trial(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("services.resilience.time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+
+    with pytest.raises(AICircuitOpenError):
+        breaker.before_call()
+
+    now += 31
+    breaker.before_call()
+    with pytest.raises(AICircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    breaker.before_call()
+    assert breaker.stats()["state"] == "closed"
+
+
+def test_rate_limit_error_maps_to_429_with_retry_after():
+    error = ai_http_exception(AIRateLimitError(retry_after=2.2))
+
+    assert error.status_code == 429
+    assert error.headers == {"Retry-After": "3"}
@@ -0,0 +1,178 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import openai
+import pytest
+
+from config import settings
+from models import ResumeIn
+from services import AIRateLimiter, AIRateLimitError, AIService, CircuitBreaker, clean_and_validate_resume
+
+
+def resume_out():
+    payload = ResumeIn(name="John Doe", email="john@example.com", phone="+18165551234", skills=["Python"])
+    return clean_and_validate_resume(payload)
+
+
+@pytest.mark.asyncio
+async def test_generate_resume_returns_usage_metadata(fixed_api_keys):
+    ai_service = AIService()
+    response = SimpleNamespace(
+        output_text="  # John Doe  ",
+        usage=SimpleNamespace(
+            input_tokens=1200,
+            output_tokens=350,
+            input_tokens_details=SimpleNamespace(cached_tokens=1024),
+        ),
+    )
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=AsyncMock(return_value=response)))
+
+    result = await ai_service.generate_resume(resume_out())
+
+    assert result.markdown == "# John Doe"
+    assert (result.usage.input_tokens, result.usage.output_tokens, result.usage.cached_tokens) == (1200, 350, 1024)
+    assert result.usage.latency_ms is not None
+    assert result.usage.ttft_ms == result.usage.latency_ms
+    assert ai_service.stats()["prompt_cache"]["cached_input_tokens"] == 1024
+
+
+def fake_response(text="# John Doe"):
+    return SimpleNamespace(output_text=text, usage=None)
+
+
+@pytest.mark.asyncio
+async def test_generate_resume_retries_transient_errors(fixed_api_keys, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "OPENAI_RETRY_BASE_DELAY", 0)
+    ai_service = AIService()
+    create = AsyncMock(side_effect=[asyncio.TimeoutError(), fake_response()])
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=create))
+
+    result = await ai_service.generate_resume(resume_out())
+
+    assert result.markdown == "# John Doe"
+    assert result.usage.attempts == 2
+    assert result.usage.hedge_won is False
+    assert ai_service.stats()["retries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_resume_does_not_retry_bad_requests(fixed_api_keys, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_RETRY_BASE_DELAY", 0)
+    ai_service = AIService()
+    create = AsyncMock(return_value=fake_response(text=""))
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=create))
+
+    with pytest.raises(RuntimeError):
+        await ai_service.generate_resume(resume_out())
+
+    assert create.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_attempt_is_hedged(fixed_api_keys, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_HEDGE_ENABLED", True)
+    monkeypatch.setattr(settings, "OPENAI_HEDGE_MIN_SAMPLES", 1)
+    ai_service = AIService()
+    ai_service.latencies.record(0.01)
+    calls = 0
+
+    async def create(**_kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)
+        return fake_response()
+
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=create))
+
+    result = await asyncio.wait_for(ai_service.generate_resume(resume_out()), timeout=1)
+
+    assert result.usage.hedge_won is True
+    assert result.usage.attempts == 1
+    assert ai_service.stats()["hedging"]["won"] == 1
+
+
+@pytest.mark.asyncio
+async def test_latency_excludes_admission_wait_and_backoff(fixed_api_keys, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "OPENAI_RETRY_BASE_DELAY", 0)
+    ai_service = AIService()
+    create = AsyncMock(side_effect=[asyncio.TimeoutError(), fake_response()])
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=create))
+
+    async def slow_admit(_request):
+        await asyncio.sleep(0.2)
+
+    monkeypatch.setattr(ai_service, "_admit", slow_admit)
+
+    result = await ai_service.generate_resume(resume_out())
+
+    assert result.usage.attempts == 2
+    assert result.usage.latency_ms < 200
+
+
+def bad_request():
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    return openai.BadRequestError("bad", response=httpx.Response(400, request=request), body=None)
+
+
+@pytest.mark.asyncio
+async def test_bad_request_during_half_open_trial_closes_the_breaker(fixed_api_keys, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_MAX_RETRIES", 0)
+    ai_service = AIService()
+    ai_service.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    server_error = openai.InternalServerError("boom", response=httpx.Response(500, request=request), body=None)
+    create = AsyncMock(side_effect=[server_error, bad_request(), fake_response()])
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=create))
+
+    with pytest.raises(openai.InternalServerError):
+        await ai_service.generate_resume(resume_out())
+    assert ai_service.circuit_breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(openai.BadRequestError):
+        await ai_service.generate_resume(resume_out())
+
+    assert (await ai_service.generate_resume(resume_out())).markdown == "# John Doe"
+    assert ai_service.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_is_released(fixed_api_keys):
+    ai_service = AIService()
+    ai_service.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    ai_service.circuit_breaker.record_failure()
+    started = asyncio.Event()
+
+    async def hang(**_kwargs):
+        started.set()
+        await asyncio.sleep(60)
+
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=hang))
+    task = asyncio.create_task(ai_service.generate_resume(resume_out()))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=AsyncMock(return_value=fake_response())))
+    assert (await ai_service.generate_resume(resume_out())).markdown == "# John Doe"
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_does_not_claim_the_half_open_trial(fixed_api_keys):
+    ai_service = AIService()
+    ai_service.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    ai_service.circuit_breaker.record_failure()
+    ai_service.rate_limiter = AIRateLimiter(requests_per_minute=1, tokens_per_minute=0, max_queue=0)
+    ai_service.rate_limiter.try_acquire(1)
+    ai_service.client = SimpleNamespace(responses=SimpleNamespace(create=AsyncMock(return_value=fake_response())))
+
+    with pytest.raises(AIRateLimitError):
+        await ai_service.generate_resume(resume_out())
+
+    ai_service.rate_limiter = AIRateLimiter(requests_per_minute=0, tokens_per_minute=0, max_queue=0)
+    assert (await ai_service.generate_resume(resume_out())).markdown == "# John Doe"
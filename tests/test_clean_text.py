@@ -0,0 +1,58 @@
+import re
+import unicodedata
+
+import pytest
+
+from utils import clean_skills, clean_text, clean_text_list, title_case
+
+
+def reference_clean_text(s):
+    """clean_text before the ASCII fast path."""
+    if s is None:
+        return None
+    t = " ".join(s.split())
+    if not t:
+        return None
+    t = re.sub(r"[\U00010000-\U0010FFFF]", "", t)
+    t = unicodedata.normalize("NFC", t)
+    return t or None
+
+
+SAMPLES = [
+    None,
+    "",
+    "   ",
+    "Senior  Backend\tEngineer\n",
+    "python",
+    "José Álvarez",
+    "José Álvarez",
+    "Rocket 🚀 launch",
+    "🚀",
+    "🚀 🚀",
+    "naïve café résumé",
+    "東京 エンジニア",
+    "Ünïcödé non-breaking",
+    "x" * 5000,
+]
+
+
+@pytest.mark.parametrize("value", SAMPLES)
+def test_clean_text_matches_reference(value):
+    assert clean_text(value) == reference_clean_text(value)
+
+
+def test_clean_text_list_matches_per_item_cleaning():
+    values = [value for value in SAMPLES if value is not None] + ["PYTHON", "Python ", "José Álvarez"]
+
+    expected, seen = [], set()
+    for value in values:
+        cleaned = title_case(value)
+        if cleaned and cleaned.lower() not in seen:
+            seen.add(cleaned.lower())
+            expected.append(cleaned)
+
+    assert clean_text_list(values, title=True) == expected
+
+
+def test_clean_skills_dedupes_case_insensitively():
+    assert clean_skills(["Python", " python ", "", "🚀Go", "SQL"]) == ["Python", "Go", "SQL"]
@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+import utils.utils as date_utils
+from models import CertificationIn, EducationIn, ExperienceIn
+from models.dates import parse_month_date
+from utils import clean_date, date_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_date_cache():
+    date_cache.clear()
+    yield
+    date_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["2020-01", "2020/1", "2020-01-15", "01/2020", "1/15/2020", "12-2019", "Jan 2020",
+     "january 2020", "Sept. 15, 2020", "Jan, 2020", "Mar 3rd 2021", "2019", "MAY 2018"],
+)
+def test_fast_path_matches_dateutil(raw):
+    assert date_utils._parse_fast(raw.lower()) == date_utils._parse_dateutil(raw)
+
+
+@pytest.mark.parametrize("raw", ["Present", " current ", "Ongoing", "", None, "not a date"])
+def test_present_and_unparseable_dates_are_none(raw):
+    assert clean_date(raw) is None
+
+
+def test_clean_date_falls_back_to_dateutil_and_memoizes(monkeypatch):
+    assert clean_date("15/01/2020") == date(2020, 1, 1)
+
+    def fail(_raw):
+        raise AssertionError("date was parsed again")
+
+    monkeypatch.setattr(date_utils, "_parse_dateutil", fail)
+    monkeypatch.setattr(date_utils, "_parse_fast", fail)
+
+    assert clean_date("15/01/2020") == date(2020, 1, 1)
+    assert date_cache.stats()["hits"] == 1
+
+
+def test_input_models_accept_month_level_strings():
+    experience = ExperienceIn(company="Acme", position=["Engineer"], start_date="Jan 2020", end_date="Present")
+    education = EducationIn(school="Mizzou", graduation_date="05/2014")
+    certification = CertificationIn(name="AWS", issuer="Amazon", issue_date="2021-03", expiry_date="March 2024")
+
+    assert (experience.start_date, experience.end_date) == (date(2020, 1, 1), None)
+    assert education.graduation_date == date(2014, 5, 1)
+    assert (certification.issue_date, certification.expiry_date) == (date(2021, 3, 1), date(2024, 3, 1))
+
+
+def test_unreadable_or_present_start_date_is_rejected():
+    for raw in ("garbage", "Present"):
+        with pytest.raises(ValidationError):
+            ExperienceIn(company="Acme", position=["Engineer"], start_date=raw)
+
+
+@pytest.mark.parametrize("raw", ["12", "asdf 5", "Q3", "5 years", "Jan '20", "1577836800", "2020-02-30", "0000-01"])
+def test_fuzzy_or_impossible_input_dates_are_left_to_pydantic(raw):
+    assert parse_month_date(raw) == raw
+
+
+@pytest.mark.parametrize("raw", ["12", "asdf 5", "Q3", "5 years", "Jan '20", "1577836801", "2020-02-30"])
+def test_fuzzy_or_impossible_input_dates_are_rejected(raw):
+    with pytest.raises(ValidationError):
+        ExperienceIn(company="Acme", position=["Engineer"], start_date=raw)
+
@@ -47,7 +47,19 @@ async def test_init_db_and_dispose_db_manage_shared_state(monkeypatch):
 
     db_session.init_db()
 
-    create_engine_mock.assert_called_once_with(settings.DATABASE_URL)
+    create_engine_mock.assert_called_once_with(
+        settings.DATABASE_URL,
+        poolclass=db_session.InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
     sessionmaker_mock.assert_called_once_with(
         fake_engine,
         class_=db_session.AsyncSession,
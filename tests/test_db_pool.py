@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+import db.session as db_session
+from config import settings
+from main import app
+
+
+@pytest.fixture
+def fresh_pool_metrics():
+    db_session.pool_metrics.reset()
+    yield db_session.pool_metrics
+    db_session.pool_metrics.reset()
+
+
+def test_engine_options_follow_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 20)
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 0)
+
+    asyncpg_options = db_session.engine_options("postgresql+asyncpg://u:p@localhost/db")
+    assert asyncpg_options["pool_size"] == 20
+    assert asyncpg_options["connect_args"] == {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+
+    assert "connect_args" not in db_session.engine_options("postgresql+psycopg://u:p@localhost/db")
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_records_waits_and_timeouts(fresh_pool_metrics):
+    pool = db_session.InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0.05)
+
+    held = await greenlet_spawn(pool.connect)
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    await greenlet_spawn(held.close)
+
+    again = await greenlet_spawn(pool.connect)
+    await greenlet_spawn(again.close)
+
+    stats = fresh_pool_metrics.stats()
+    assert stats["acquired"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_histogram"]["le_inf"] == 2
+
+
+def test_pool_stats_reports_occupancy(monkeypatch, fresh_pool_metrics):
+    pool = SimpleNamespace(size=lambda: 5, overflow=lambda: 2, checkedout=lambda: 7, checkedin=lambda: 0)
+    monkeypatch.setattr(db_session, "_engine", SimpleNamespace(pool=pool))
+    fresh_pool_metrics.observe(3.0)
+    fresh_pool_metrics.observe(700.0)
+
+    stats = db_session.pool_stats()
+
+    assert stats["checked_out"] == 7
+    assert stats["overflow"] == 2
+    assert stats["connections"] == 7
+    assert stats["wait_ms_histogram"]["le_5ms"] == 1
+    assert stats["wait_ms_histogram"]["le_1000ms"] == 2
+
+
+@pytest.mark.asyncio
+async def test_db_pool_metrics_without_database_returns_503(fixed_api_keys, missing_database_url):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/v1/metrics/db-pool", headers={"X-API-Key": settings.APP_API_KEY})
+
+    assert response.status_code == 503
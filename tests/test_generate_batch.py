@@ -0,0 +1,116 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+import services.batch_service as batch_service
+from services import GenerationResult, GenerationUsage, generation_cache
+
+
+VALID = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python"],
+}
+
+
+@pytest.fixture
+def fake_batch_persistence(fake_session_scope, monkeypatch):
+    persist_mock = AsyncMock()
+    fake_session_scope(batch_service)
+    monkeypatch.setattr(batch_service, "create_resumes_with_generations", persist_mock)
+    generation_cache.clear()
+    try:
+        yield persist_mock
+    finally:
+        generation_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_failures_per_item_and_bulk_persists(fake_batch_persistence, monkeypatch):
+    monkeypatch.setattr(batch_service.settings, "GENERATION_BATCH_CONCURRENCY", 2)
+    running = 0
+    peak = 0
+
+    async def generate_resume(cleaned):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return GenerationResult(markdown=f"# {cleaned.cleaned_name}", usage=GenerationUsage(latency_ms=10))
+
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", generate_resume=generate_resume)
+    items = [
+        {**VALID, "name": "Ada Lovelace"},
+        {**VALID, "phone": "not-a-phone"},
+        {**VALID, "name": "Grace Hopper"},
+        {**VALID, "name": "Alan Turing"},
+    ]
+
+    lines = [json.loads(line) async for line in batch_service.stream_batch_generation(ai_service, items, bypass_cache=True)]
+    results = {line["index"]: line for line in lines if line["type"] == "item"}
+    summary = lines[-1]
+
+    assert results[1]["ok"] is False
+    assert results[1]["status_code"] == 422
+    assert results[0]["ai_resume_markdown"] == "# Ada Lovelace"
+    assert summary == {
+        "type": "summary",
+        "total": 4,
+        "succeeded": 3,
+        "failed": 1,
+        "persisted": 3,
+        "persistence_failed": 0,
+    }
+    assert peak <= 2
+    fake_batch_persistence.assert_awaited_once()
+    assert len(fake_batch_persistence.await_args.args[1]) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_resumes_that_were_already_stored(fake_batch_persistence):
+    stored_id = uuid4()
+
+    async def store(_session, pairs):
+        resume, generation = pairs[0]
+        resume.id = generation.resume_id = stored_id
+
+    fake_batch_persistence.side_effect = store
+
+    async def generate_resume(cleaned):
+        return GenerationResult(markdown=f"# {cleaned.cleaned_name}", usage=GenerationUsage())
+
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", generate_resume=generate_resume)
+
+    lines = [json.loads(line) async for line in batch_service.stream_batch_generation(ai_service, [VALID], bypass_cache=True)]
+
+    assert [line["type"] for line in lines] == ["item", "deduplicated", "summary"]
+    assert lines[1] == {"type": "deduplicated", "index": 0, "resume_id": str(stored_id)}
+    assert lines[0]["resume_id"] != str(stored_id)
+
+
+@pytest.mark.asyncio
+async def test_items_of_a_chunk_that_fails_to_persist_get_error_lines(fake_batch_persistence, monkeypatch):
+    monkeypatch.setattr(batch_service, "BATCH_PERSIST_CHUNK", 2)
+    fake_batch_persistence.side_effect = [RuntimeError("db down"), None]
+
+    async def generate_resume(cleaned):
+        return GenerationResult(markdown=f"# {cleaned.cleaned_name}", usage=GenerationUsage())
+
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", generate_resume=generate_resume)
+    items = [{**VALID, "name": name} for name in ("Ada Lovelace", "Grace Hopper", "Alan Turing")]
+
+    lines = [json.loads(line) async for line in batch_service.stream_batch_generation(ai_service, items, bypass_cache=True)]
+
+    errors = [line for line in lines if line["type"] == "item" and not line["ok"]]
+    stored = [line for line in lines if line["type"] == "item" and line["ok"]]
+    assert len(stored) == 3
+    assert {line["index"] for line in errors} == {stored[0]["index"], stored[1]["index"]}
+    assert all(line["status_code"] == 503 for line in errors)
+    assert lines.index(errors[0]) > lines.index(stored[1])
+    assert lines[-1]["persisted"] == 1 and lines[-1]["persistence_failed"] == 2
@@ -0,0 +1,100 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import services.generation_service as generation_service
+from config import settings
+from main import app
+from models import ResumeIn
+from routes.routes import get_ai_service
+from services import clean_and_validate_resume, generation_cache
+
+
+PAYLOAD = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python"],
+}
+
+
+def parse_events(frames: list[str]) -> list[tuple[str, dict]]:
+    events = []
+    for frame in frames:
+        event_line, data_line = frame.strip().split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+@pytest.fixture
+def fake_stream_persistence(fake_session_scope, monkeypatch):
+    resume_id, generation_id = uuid4(), uuid4()
+    fake_session_scope(generation_service)
+    monkeypatch.setattr(
+        generation_service,
+        "create_resume_with_generation",
+        AsyncMock(return_value=(SimpleNamespace(id=resume_id), SimpleNamespace(id=generation_id))),
+    )
+    generation_cache.clear()
+    try:
+        yield resume_id, generation_id
+    finally:
+        generation_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_deltas_then_persists(fake_stream_persistence):
+    resume_id, generation_id = fake_stream_persistence
+
+    async def stream_resume(_cleaned, _usage=None):
+        for delta in ["# John", " Doe"]:
+            yield delta
+
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", stream_resume=stream_resume)
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+
+    frames = [frame async for frame in generation_service.stream_generation_events(ai_service, resume_out, bypass_cache=True)]
+    events = parse_events(frames)
+
+    assert events[:2] == [("delta", {"text": "# John"}), ("delta", {"text": " Doe"})]
+    assert events[-1][0] == "done"
+    assert events[-1][1]["resume_id"] == str(resume_id)
+    assert events[-1][1]["generation_id"] == str(generation_id)
+    generation_service.create_resume_with_generation.assert_awaited_once()
+    assert generation_service.create_resume_with_generation.await_args.kwargs["markdown_output"] == "# John Doe"
+
+
+@pytest.mark.asyncio
+async def test_stream_failure_emits_error_without_persisting(fake_stream_persistence):
+    async def stream_resume(_cleaned, _usage=None):
+        yield "# John"
+        raise RuntimeError("upstream dropped")
+
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", stream_resume=stream_resume)
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+
+    frames = [frame async for frame in generation_service.stream_generation_events(ai_service, resume_out, bypass_cache=True)]
+
+    assert parse_events(frames)[-1] == ("error", {"detail": "AI generation failed", "status_code": 503})
+    generation_service.create_resume_with_generation.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stream_route_without_database_returns_503(fixed_api_keys, missing_database_url):
+    app.dependency_overrides[get_ai_service] = lambda: SimpleNamespace(gpt_model="gpt-4o-mini")
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post(
+                "/api/v1/resume/generate/stream",
+                json=PAYLOAD,
+                headers={"X-API-Key": settings.APP_API_KEY},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Database not configured"}
@@ -0,0 +1,113 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+import services.cache_service as cache_module
+from models import ResumeIn
+from services import (
+    GenerationResult,
+    GenerationUsage,
+    clean_and_validate_resume,
+    generate_markdown,
+    generation_cache,
+    generation_cache_key,
+    generation_flight,
+)
+from utils import LRUCache
+
+
+PAYLOAD = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python", "FastAPI"],
+}
+
+RESULT = GenerationResult(markdown="# John Doe", usage=GenerationUsage(input_tokens=900, latency_ms=1200))
+
+
+@pytest.fixture
+def empty_generation_cache(monkeypatch):
+    generation_cache.clear()
+    monkeypatch.setattr(cache_module, "find_completed_generation", AsyncMock(return_value=None))
+    try:
+        yield generation_cache
+    finally:
+        generation_cache.clear()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.stats()["hits"] == 1
+
+
+def test_generation_cache_key_is_stable_and_model_scoped():
+    first = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+    second = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+
+    assert generation_cache_key(first, "gpt-4o-mini") == generation_cache_key(second, "gpt-4o-mini")
+    assert generation_cache_key(first, "gpt-4o-mini") != generation_cache_key(first, "gpt-4o")
+    assert generation_cache_key(first, "gpt-4o-mini", "v1") != generation_cache_key(first, "gpt-4o-mini", "v2")
+
+
+@pytest.mark.asyncio
+async def test_repeat_generation_is_served_from_cache(empty_generation_cache, fake_session):
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", generate_resume=AsyncMock(return_value=RESULT))
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+
+    first = await generate_markdown(fake_session, ai_service, resume_out)
+    second = await generate_markdown(fake_session, ai_service, resume_out)
+
+    assert first.cache_hit is False
+    assert second.cache_hit is True
+    assert second.markdown == "# John Doe"
+    ai_service.generate_resume.assert_awaited_once()
+    assert empty_generation_cache.stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bypass_cache_always_calls_ai_service(empty_generation_cache, fake_session):
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", generate_resume=AsyncMock(return_value=RESULT))
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+
+    await generate_markdown(fake_session, ai_service, resume_out)
+    result = await generate_markdown(fake_session, ai_service, resume_out, bypass_cache=True)
+
+    assert result.cache_hit is False
+    assert ai_service.generate_resume.await_count == 2
+    assert empty_generation_cache.stats()["bypassed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_generations_share_one_call(empty_generation_cache, fake_session):
+    generation_flight.reset()
+    release = asyncio.Event()
+
+    async def generate_resume(_cleaned):
+        await release.wait()
+        return RESULT
+
+    ai_service = SimpleNamespace(gpt_model="gpt-4o-mini", generate_resume=AsyncMock(side_effect=generate_resume))
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+
+    pending = [
+        asyncio.create_task(generate_markdown(fake_session, ai_service, resume_out, bypass_cache=True))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*pending)
+
+    assert [result.markdown for result in results] == ["# John Doe"] * 3
+    assert sum(result.usage is not None for result in results) == 1
+    ai_service.generate_resume.assert_awaited_once()
+    assert generation_flight.stats()["collapsed"] == 2
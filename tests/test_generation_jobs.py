@@ -0,0 +1,195 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, call
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import services.job_service as job_service
+from config import settings
+from db import GenerationStatus
+from main import app
+from models import ResumeIn
+from services import (
+    AIRateLimitError,
+    InProcessJobQueue,
+    clean_and_validate_resume,
+    load_resume_out,
+    serialize_cleaned_data,
+)
+from services.generation_service import GeneratedResume
+from services.job_service import GenerationWorkerPool, JobClaim, run_generation_job
+
+
+PAYLOAD = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python"],
+    "experience": [
+        {
+            "company": "acme",
+            "position": ["engineer"],
+            "start_date": "2020-01-15",
+            "end_date": "2022-06-01",
+            "description": ["Built APIs"],
+        }
+    ],
+}
+
+
+CLEANED_DATA = serialize_cleaned_data(clean_and_validate_resume(ResumeIn(**PAYLOAD)))
+
+CLAIMED_AT = datetime(2024, 5, 1, 12, 0)
+
+
+def test_load_resume_out_round_trips_cleaned_data():
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+    cleaned_data = serialize_cleaned_data(resume_out)
+
+    assert serialize_cleaned_data(load_resume_out(cleaned_data)) == cleaned_data
+
+
+@pytest.mark.asyncio
+async def test_in_process_queue_skips_jobs_claimed_elsewhere(fake_session_scope, monkeypatch):
+    taken, free = uuid4(), uuid4()
+    fake_session_scope(job_service)
+    monkeypatch.setattr(
+        job_service,
+        "claim_generation",
+        AsyncMock(side_effect=lambda _session, generation_id: CLAIMED_AT if generation_id == free else None),
+    )
+
+    queue = InProcessJobQueue()
+    await queue.enqueue(taken)
+    await queue.enqueue(free)
+
+    assert await queue.claim() == JobClaim(free, CLAIMED_AT)
+
+
+@pytest.mark.asyncio
+async def test_in_process_queue_holds_delayed_jobs_back(fake_session_scope, monkeypatch):
+    later, now = uuid4(), uuid4()
+    fake_session_scope(job_service)
+    monkeypatch.setattr(job_service, "claim_generation", AsyncMock(return_value=CLAIMED_AT))
+
+    queue = InProcessJobQueue()
+    await queue.enqueue(later, 0.05)
+    await queue.enqueue(now)
+
+    assert (await queue.claim()).generation_id == now
+    assert (await asyncio.wait_for(queue.claim(), timeout=1)).generation_id == later
+
+
+@pytest.mark.asyncio
+async def test_throttled_job_is_requeued_instead_of_failed(fake_session_scope, monkeypatch):
+    generation_id = uuid4()
+    session = fake_session_scope(job_service)
+    session.result.scalar_one.return_value = CLEANED_DATA
+    requeue = AsyncMock(return_value=True)
+    finish = AsyncMock()
+    queue = MagicMock(enqueue=AsyncMock())
+    monkeypatch.setattr(job_service, "generate_markdown", AsyncMock(side_effect=AIRateLimitError(retry_after=7.5)))
+    monkeypatch.setattr(job_service, "requeue_generation", requeue)
+    monkeypatch.setattr(job_service, "finish_generation", finish)
+
+    await run_generation_job(AsyncMock(), queue, JobClaim(generation_id, CLAIMED_AT))
+
+    requeue.assert_awaited_once_with(session, generation_id, CLAIMED_AT, 7.5)
+    queue.enqueue.assert_awaited_once_with(generation_id, 7.5)
+    finish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_job_whose_result_cannot_be_stored_is_failed(fake_session_scope, monkeypatch):
+    generation_id = uuid4()
+    session = fake_session_scope(job_service)
+    session.result.scalar_one.return_value = CLEANED_DATA
+    finish = AsyncMock(side_effect=[RuntimeError("connection lost"), True])
+    monkeypatch.setattr(
+        job_service,
+        "generate_markdown",
+        AsyncMock(return_value=GeneratedResume(markdown="# John Doe", cache_key="key", cache_hit=False)),
+    )
+    monkeypatch.setattr(job_service, "finish_generation", finish)
+
+    await run_generation_job(AsyncMock(), MagicMock(), JobClaim(generation_id, CLAIMED_AT))
+
+    assert finish.await_args_list[-1] == call(session, generation_id, CLAIMED_AT, GenerationStatus.FAILED)
+
+
+@pytest.mark.asyncio
+async def test_result_of_a_lost_claim_is_discarded(fake_session_scope, monkeypatch):
+    generation_id = uuid4()
+    session = fake_session_scope(job_service)
+    session.result.scalar_one.return_value = CLEANED_DATA
+    finish = AsyncMock(return_value=False)
+    monkeypatch.setattr(
+        job_service,
+        "generate_markdown",
+        AsyncMock(return_value=GeneratedResume(markdown="# John Doe", cache_key="key", cache_hit=False)),
+    )
+    monkeypatch.setattr(job_service, "finish_generation", finish)
+
+    await run_generation_job(AsyncMock(), MagicMock(), JobClaim(generation_id, CLAIMED_AT))
+
+    finish.assert_awaited_once()
+    assert finish.await_args.args[3] == GenerationStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_cancels_the_running_job(fake_session_scope, monkeypatch):
+    cancelled = asyncio.Event()
+
+    async def slow_job(*_args):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    fake_session_scope(job_service)
+    renew = AsyncMock(side_effect=[True, False])
+    monkeypatch.setattr(job_service, "run_generation_job", slow_job)
+    monkeypatch.setattr(job_service, "renew_generation_lease", renew)
+    pool = GenerationWorkerPool(MagicMock(), AsyncMock(), size=1, lease=0.03)
+
+    await asyncio.wait_for(pool._run_with_lease(JobClaim(uuid4(), CLAIMED_AT)), timeout=1)
+
+    assert cancelled.is_set()
+    assert renew.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_recover_enqueues_pending_and_reclaimed_jobs(fake_session_scope, monkeypatch):
+    stale, pending = uuid4(), uuid4()
+    reclaim = AsyncMock(return_value=[stale])
+    fake_session_scope(job_service)
+    monkeypatch.setattr(job_service, "reclaim_stale_generations", reclaim)
+    monkeypatch.setattr(
+        job_service,
+        "list_pending_generations",
+        AsyncMock(return_value=[(stale, 0.0), (pending, 12.0)]),
+    )
+    queue = MagicMock(enqueue=AsyncMock())
+
+    await GenerationWorkerPool(queue, AsyncMock(), size=1, lease=300).recover()
+
+    assert reclaim.await_args.args[1] == 300
+    assert queue.enqueue.await_args_list == [call(stale, 0.0), call(pending, 12.0)]
+
+
+@pytest.mark.asyncio
+async def test_generate_job_without_workers_returns_503(fixed_api_keys, fake_db, monkeypatch):
+    monkeypatch.setattr(job_service, "_pool", None)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/resume/generate/jobs",
+            json=PAYLOAD,
+            headers={"X-API-Key": settings.APP_API_KEY},
+        )
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Generation workers not running"}
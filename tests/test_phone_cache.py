@@ -0,0 +1,47 @@
+import pytest
+from fastapi import HTTPException
+
+import validations.resume as resume_validations
+from validations import phone_cache, to_e164, to_e164_many
+
+
+@pytest.fixture(autouse=True)
+def empty_phone_cache():
+    phone_cache.clear()
+    yield
+    phone_cache.clear()
+
+
+def test_to_e164_is_memoized(monkeypatch):
+    assert to_e164(" (816) 555-1234 ") == "+18165551234"
+
+    def fail(*_args):
+        raise AssertionError("phone was parsed again")
+
+    monkeypatch.setattr(resume_validations, "_parse_e164", fail)
+
+    assert to_e164("(816) 555-1234") == "+18165551234"
+    assert phone_cache.stats()["hits"] == 1
+
+
+def test_invalid_phone_is_negatively_cached():
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            to_e164("not-a-phone")
+        assert exc_info.value.status_code == 422
+
+    assert phone_cache.stats()["hits"] == 1
+
+
+def test_region_is_part_of_the_key():
+    assert to_e164("020 7946 0958", region_default="GB") == "+442079460958"
+
+    with pytest.raises(HTTPException):
+        to_e164("020 7946 0958", region_default="US")
+
+
+def test_to_e164_many_parses_each_distinct_value_once():
+    result = to_e164_many(["+18165551234", "bad", "+18165551234"])
+
+    assert result == ["+18165551234", None, "+18165551234"]
+    assert len(phone_cache) == 2
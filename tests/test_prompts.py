@@ -0,0 +1,42 @@
+from models import ResumeIn
+from services import (
+    PROMPT_VERSION,
+    RESUME_INSTRUCTIONS,
+    build_resume_messages,
+    clean_and_validate_resume,
+    generation_cache_key,
+)
+
+
+def resume_out(name: str):
+    payload = ResumeIn(name=name, email="john@example.com", phone="+18165551234", skills=["Python"])
+    return clean_and_validate_resume(payload)
+
+
+def build(name: str):
+    return build_resume_messages(resume_out(name))
+
+
+def test_instructions_are_a_static_developer_prefix():
+    first = build("John Doe")
+    second = build("Jane Smith")
+
+    assert first[0] == second[0] == {"role": "developer", "content": RESUME_INSTRUCTIONS}
+    assert first[1]["role"] == "user"
+    assert first[1]["content"] != second[1]["content"]
+
+
+def test_user_message_only_carries_cleaned_input():
+    user_message = build("John Doe")[1]["content"]
+
+    assert user_message.startswith("Cleaned Input Data:")
+    assert "Name: John Doe" in user_message
+    assert "Hard rules" not in user_message
+
+
+def test_prompt_version_is_part_of_the_cache_key():
+    resume = resume_out("John Doe")
+    current = generation_cache_key(resume, "gpt-4o-mini")
+
+    assert generation_cache_key(resume, "gpt-4o-mini", prompt_version=PROMPT_VERSION) == current
+    assert generation_cache_key(resume, "gpt-4o-mini", prompt_version=f"{PROMPT_VERSION}-next") != current
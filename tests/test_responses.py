@@ -0,0 +1,83 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from httpx import ASGITransport, AsyncClient
+
+import routes.responses as responses
+from main import app
+from models import ResumeIn, ResumeOut
+from routes.responses import FastJSONResponse
+from services import clean_and_validate_resume
+
+
+PAYLOAD = {
+    "name": "Zoë Ångström",
+    "email": "zoe@example.com",
+    "phone": "+18165551234",
+    "urls": ["https://github.com/zoe"],
+    "experience": [{
+        "company": "acme corp",
+        "position": ["engineer"],
+        "start_date": "2019-03-15",
+        "end_date": "Present",
+        "description": ["Built a café ordering API"],
+    }],
+    "skills": ["Python", "Go"],
+    "certifications": [{"name": "CKA", "issuer": "cncf", "issue_date": "Jan 2022"}],
+}
+
+
+@pytest.mark.asyncio
+async def test_body_matches_fastapi_default_encoding():
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+    resume_out.ai_resume_markdown = "# Zoë\n\n- naïve ✓"
+
+    field = create_model_field(name="Response_validate", type_=ResumeOut, mode="serialization")
+    default = JSONResponse(await serialize_response(field=field, response_content=resume_out)).body
+
+    assert FastJSONResponse(resume_out).body == default
+    assert json.loads(default)["cleaned_experience"][0]["start_date"] == "2019-03"
+
+
+CONTENT = {"name": "Zoë", "items": [1, 2.5, None, True], "nested": {"k": "✓"}}
+
+
+def test_non_model_content_goes_through_orjson_when_installed(monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    spy = MagicMock(wraps=orjson.dumps)
+    monkeypatch.setattr(responses, "orjson", SimpleNamespace(dumps=spy))
+
+    assert FastJSONResponse(CONTENT).body == orjson.dumps(CONTENT)
+    spy.assert_called_once_with(CONTENT)
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    with_orjson = orjson.dumps(CONTENT)
+
+    monkeypatch.setattr(responses, "orjson", None)
+
+    assert responses.dumps(CONTENT) == with_orjson
+    assert FastJSONResponse(CONTENT).body == with_orjson
+
+
+@pytest.mark.asyncio
+async def test_validate_route_returns_model_json(fixed_api_keys):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/resume/validate",
+            json=PAYLOAD,
+            headers={"X-API-Key": "test-app-key"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["cleaned_name"] == "Zoë Ångström"
+    assert body["cleaned_certifications"][0]["issue_date"] == "2022-01"
@@ -0,0 +1,113 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import routes.routes as resume_routes
+import services.count_service as count_service
+from config import settings
+from main import app, lifespan
+from models import CountStrategy
+from services import CachedCount, estimate_resumes, resolve_resume_total
+
+
+class ScalarSession:
+    def __init__(self, value):
+        self.value = value
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params))
+        return SimpleNamespace(scalar_one_or_none=lambda: self.value)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_estimate_reads_planner_statistics():
+    session = ScalarSession(2_300_000)
+
+    assert await estimate_resumes(session) == 2_300_000
+    [(sql, params)] = session.statements
+    assert "reltuples" in sql and params == {"table_name": "resumes"}
+
+    assert await estimate_resumes(ScalarSession(-1)) is None
+    assert await estimate_resumes(ScalarSession(None)) is None
+
+
+@pytest.mark.asyncio
+async def test_estimate_falls_back_to_exact_until_analyzed(monkeypatch):
+    monkeypatch.setattr(count_service, "estimate_resumes", AsyncMock(return_value=None))
+    monkeypatch.setattr(count_service, "count_resumes", AsyncMock(return_value=42))
+
+    assert await resolve_resume_total(None, CountStrategy.ESTIMATED) == (42, CountStrategy.EXACT)
+
+    monkeypatch.setattr(count_service, "estimate_resumes", AsyncMock(return_value=40))
+    assert await resolve_resume_total(None, CountStrategy.ESTIMATED) == (40, CountStrategy.ESTIMATED)
+
+
+@pytest.mark.asyncio
+async def test_cached_count_serves_stale_value_while_refreshing(fake_session_scope, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(count_service.time, "monotonic", clock.monotonic)
+
+    background_session = fake_session_scope(count_service)
+
+    counts = iter([10, 11])
+    count = AsyncMock(side_effect=lambda session: next(counts))
+    cache = CachedCount(60, count)
+
+    assert await cache.get("request-session") == 10
+    clock.now += 30
+    assert await cache.get("request-session") == 10
+    assert count.await_count == 1
+
+    clock.now += 31
+    assert await cache.get("request-session") == 10
+    assert await cache.get("request-session") == 10
+    await asyncio.sleep(0)
+
+    assert count.await_count == 2
+    assert count.await_args.args == (background_session,)
+    assert await cache.get("request-session") == 11
+    assert cache.refreshes == 2
+
+
+@pytest.mark.asyncio
+async def test_route_reports_the_strategy_used(fixed_api_keys, fake_db, monkeypatch):
+    resolve_mock = AsyncMock(return_value=(2_300_000, CountStrategy.ESTIMATED))
+    monkeypatch.setattr(resume_routes, "list_resumes_page", AsyncMock(return_value=([], None)))
+    monkeypatch.setattr(resume_routes, "list_resumes_offset", AsyncMock(return_value=([], False)))
+    monkeypatch.setattr(resume_routes, "resolve_resume_total", resolve_mock)
+    monkeypatch.setattr(settings, "RESUME_COUNT_STRATEGY", "cached")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        headers = {"X-API-Key": settings.APP_API_KEY}
+        body = (await client.get("/api/v1/resume/", params={"count": "estimated"}, headers=headers)).json()
+        await client.get("/api/v1/resume/", params={"skip": 0}, headers=headers)
+        bad = await client.get("/api/v1/resume/", params={"count": "approximate"}, headers=headers)
+
+    assert (body["total"], body["total_strategy"]) == (2_300_000, "estimated")
+    assert [call.args[1] for call in resolve_mock.await_args_list] == [CountStrategy.ESTIMATED, CountStrategy.CACHED]
+    assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_unknown_default_strategy_stops_startup(monkeypatch):
+    init_db = MagicMock()
+    monkeypatch.setattr(settings, "RESUME_COUNT_STRATEGY", "approximate")
+    monkeypatch.setattr("main.init_db", init_db)
+
+    with pytest.raises(ValueError, match="RESUME_COUNT_STRATEGY must be one of exact, estimated, cached"):
+        async with lifespan(app):
+            pass
+
+    init_db.assert_not_called()
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
+
+import routes.routes as resume_routes
+from config import settings
+from main import app
+from models import CountStrategy
+from services import decode_resume_cursor, encode_resume_cursor, list_resumes_page
+
+
+NOW = datetime(2026, 3, 1, 12, 0, 0, 123456)
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(id=uuid4(), created_at=NOW - timedelta(minutes=n), updated_at=NOW)
+        for n in range(count)
+    ]
+
+
+class RowsSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        limit = stmt._limit_clause.value
+        return SimpleNamespace(all=lambda: self.rows[:limit])
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    resume_id = uuid4()
+
+    assert decode_resume_cursor(encode_resume_cursor(NOW, resume_id)) == (NOW, resume_id)
+    for bad in ("", "not-base64!", encode_resume_cursor(NOW, resume_id)[:-4]):
+        with pytest.raises(ValueError):
+            decode_resume_cursor(bad)
+
+
+@pytest.mark.asyncio
+async def test_page_fetches_one_extra_row_to_detect_more():
+    rows = make_rows(3)
+    session = RowsSession(rows)
+
+    page, next_cursor = await list_resumes_page(session, 2)
+
+    assert page == rows[:2]
+    assert decode_resume_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+    assert session.statements[0]._limit_clause.value == 3
+
+    page, next_cursor = await list_resumes_page(RowsSession(rows), 3)
+    assert len(page) == 3 and next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_page_after_cursor_uses_row_value_comparison():
+    session = RowsSession([])
+
+    await list_resumes_page(session, 20, (NOW, uuid4()))
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "(resumes.created_at, resumes.id) < (" in sql
+    assert "ORDER BY resumes.created_at DESC, resumes.id DESC" in sql
+    assert "OFFSET" not in sql and "cleaned_data" not in sql
+
+
+async def list_resumes(params):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get("/api/v1/resume/", params=params, headers={"X-API-Key": settings.APP_API_KEY})
+
+
+@pytest.mark.asyncio
+async def test_cursor_mode_skips_the_count(fixed_api_keys, fake_db, monkeypatch):
+    rows = make_rows(2)
+    count_mock = AsyncMock(return_value=(10, CountStrategy.EXACT))
+    monkeypatch.setattr(resume_routes, "list_resumes_page", AsyncMock(return_value=(rows, "next")))
+    monkeypatch.setattr(resume_routes, "resolve_resume_total", count_mock)
+
+    response = await list_resumes({"mode": "cursor", "limit": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [str(row.id) for row in rows]
+    assert body["has_more"] is True
+    assert body["next_cursor"] == "next"
+    assert body["total"] is None and body["total_strategy"] is None
+    count_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_skip_mode_and_bad_cursors(fixed_api_keys, fake_db, monkeypatch):
+    monkeypatch.setattr(resume_routes, "list_resumes_offset", AsyncMock(return_value=(make_rows(2), True)))
+    monkeypatch.setattr(resume_routes, "resolve_resume_total", AsyncMock(return_value=(5, CountStrategy.EXACT)))
+
+    body = (await list_resumes({"skip": 2, "limit": 2})).json()
+    assert (body["total"], body["total_strategy"], body["skip"], body["has_more"]) == (5, "exact", 2, True)
+
+    assert (await list_resumes({"cursor": "garbage"})).status_code == 400
+    assert (await list_resumes({"cursor": encode_resume_cursor(NOW, uuid4()), "skip": 0})).status_code == 400
+    assert (await list_resumes({"mode": "cursor", "skip": 0})).status_code == 400
+    assert (await list_resumes({"mode": "offset", "cursor": encode_resume_cursor(NOW, uuid4())})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_plain_listing_keeps_offset_mode(fixed_api_keys, fake_db, monkeypatch):
+    offset_mock = AsyncMock(return_value=(make_rows(2), False))
+    monkeypatch.setattr(resume_routes, "list_resumes_offset", offset_mock)
+    monkeypatch.setattr(resume_routes, "list_resumes_page", AsyncMock(side_effect=AssertionError("cursor mode")))
+    monkeypatch.setattr(resume_routes, "resolve_resume_total", AsyncMock(return_value=(2, CountStrategy.EXACT)))
+
+    body = (await list_resumes({})).json()
+
+    offset_mock.assert_awaited_once_with(ANY, 0, 20)
+    assert (body["total"], body["skip"], body["limit"], body["next_cursor"]) == (2, 0, 20, None)
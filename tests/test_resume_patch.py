@@ -0,0 +1,125 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
+
+import routes.routes as resume_routes
+import services.validation_service as validation_service
+from config import settings
+from main import app
+from models import ResumeIn, ResumePatch
+from services import (
+    DuplicateResumeError,
+    clean_and_validate_resume,
+    clean_resume_sections,
+    patch_resume_sections,
+    serialize_cleaned_data,
+    serialize_cleaned_sections,
+)
+
+
+PAYLOAD = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "location": {"country": "united states", "state": "missouri", "city": "kansas city"},
+    "skills": ["Python", "JS"],
+    "experience": [
+        {
+            "company": "acme",
+            "position": ["engineer"],
+            "start_date": "2020-01-15",
+            "end_date": "2022-06-01",
+            "description": ["Built APIs"],
+        }
+    ],
+}
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+
+        class Result:
+            def one_or_none(self):
+                return None
+
+        return Result()
+
+
+def test_only_patched_sections_are_cleaned(monkeypatch):
+    monkeypatch.setattr(validation_service, "clean_experience", lambda _: pytest.fail("experience was re-cleaned"))
+
+    cleaned, warnings = clean_resume_sections(ResumePatch(skills=["javascript", "Go"], location=None))
+
+    assert cleaned == {"cleaned_location": None, "cleaned_skills": ["JavaScript", "Go"]}
+    assert warnings == []
+
+
+def test_patched_sections_serialize_like_stored_cleaned_data():
+    stored = serialize_cleaned_data(clean_and_validate_resume(ResumeIn(**PAYLOAD)))
+
+    patch = ResumePatch(**{key: PAYLOAD[key] for key in ("experience", "skills", "location")})
+    sections = serialize_cleaned_sections(clean_resume_sections(patch)[0])
+
+    assert sections == {key: stored[key] for key in ("cleaned_experience", "cleaned_skills", "cleaned_location")}
+
+
+@pytest.mark.asyncio
+async def test_patch_is_a_single_in_place_jsonb_update():
+    session = RecordingSession()
+
+    assert await patch_resume_sections(session, uuid4(), {"cleaned_skills": ["Go"], "cleaned_location": None}) is None
+
+    [sql] = session.statements
+    assert sql.startswith("UPDATE resumes SET cleaned_data=((resumes.cleaned_data || ")
+    assert "jsonb_each" in sql and "IS DISTINCT FROM" in sql
+    assert "updated_at=now()" in sql
+    assert "content_hash=encode(sha256(convert_to(CAST((resumes.cleaned_data || " in sql
+    assert "RETURNING resumes.updated_at, resumes.changed_sections" in sql
+
+
+async def send_patch(resume_id, body):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.patch(
+            f"/api/v1/resume/{resume_id}",
+            json=body,
+            headers={"X-API-Key": settings.APP_API_KEY},
+        )
+
+
+@pytest.mark.asyncio
+async def test_patch_route_reports_changed_sections(fixed_api_keys, fake_db, monkeypatch):
+    updated_at = datetime(2026, 1, 2, 3, 4, 5)
+    patch_mock = AsyncMock(return_value=(updated_at, ["cleaned_skills"]))
+    monkeypatch.setattr(resume_routes, "patch_resume_sections", patch_mock)
+    resume_id = uuid4()
+
+    response = await send_patch(resume_id, {"skills": ["Python", "JS"], "name": "  mr john   DOE "})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["changed_sections"] == ["skills"]
+    assert body["cleaned"] == {"cleaned_name": "John Doe", "cleaned_skills": ["Python", "JavaScript"]}
+    assert body["generation_id"] is None
+    assert patch_mock.await_args.args[1] == resume_id
+
+
+@pytest.mark.asyncio
+async def test_patch_route_errors(fixed_api_keys, fake_db, monkeypatch):
+    monkeypatch.setattr(resume_routes, "patch_resume_sections", AsyncMock(return_value=None))
+
+    assert (await send_patch(uuid4(), {"skills": ["Python"]})).status_code == 404
+    assert (await send_patch(uuid4(), {})).status_code == 422
+    assert (await send_patch(uuid4(), {"phone": None})).status_code == 422
+
+    monkeypatch.setattr(resume_routes, "patch_resume_sections", AsyncMock(side_effect=DuplicateResumeError()))
+    response = await send_patch(uuid4(), {"skills": ["Python"]})
+    assert response.status_code == 409
+    assert response.json()["detail"] == "An identical resume already exists"
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+import services.persistence_service as persistence_service
+from db import GenerationStatus
+from models import ResumeIn
+from services import (
+    clean_and_validate_resume,
+    create_resume_with_generation,
+    create_resumes_with_generations,
+    insert_resumes_with_generations,
+    new_resume_with_generation,
+)
+from services.ai_service import GenerationUsage
+
+
+PAYLOAD = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python"],
+}
+
+
+class StoringSession:
+    """
+    Stands in for the database: each statement is compiled and answered with
+    (generation id, resume id) rows, where every resume resolves to
+    `stored_id` if given (already stored) or to its own id (inserted).
+    The first `racing` statements return no rows, as when an identical
+    resume is committed after the statement's snapshot.
+    """
+
+    def __init__(self, stored_id=None, racing=0):
+        self.stored_id = stored_id
+        self.racing = racing
+        self.statements = []
+        self.chunks = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt.compile(dialect=asyncpg.dialect()))
+        pairs = self.chunks[len(self.statements) - 1]
+        if len(self.statements) <= self.racing:
+            pairs = []
+        return SimpleNamespace(all=lambda: [
+            (generation.id, self.stored_id or generation.resume_id) for _, generation in pairs
+        ])
+
+    def add(self, _record):
+        pytest.fail("records must not be added to the session")
+
+    async def flush(self):
+        pytest.fail("persistence must not flush")
+
+
+@pytest.fixture
+def storing_session(monkeypatch):
+    def make(stored_id=None, racing=0):
+        session = StoringSession(stored_id, racing)
+
+        def build(pairs):
+            session.chunks.append(pairs)
+            return insert_resumes_with_generations(pairs)
+
+        monkeypatch.setattr(persistence_service, "insert_resumes_with_generations", build)
+        return session
+
+    return make
+
+
+def make_pair(**kwargs):
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+    return new_resume_with_generation(
+        resume_out,
+        status=GenerationStatus.COMPLETED,
+        markdown_output="# John Doe",
+        ai_model="gpt-4o-mini",
+        **kwargs,
+    )
+
+
+def test_pairs_are_linked_by_client_ids():
+    resume, generation = make_pair(usage=GenerationUsage(input_tokens=12, latency_ms=30))
+
+    assert resume.id is not None and generation.id is not None
+    assert generation.resume_id == resume.id
+    assert resume.cleaned_data["cleaned_name"] == "John Doe"
+    assert (generation.input_tokens, generation.latency_ms) == (12, 30)
+
+
+@pytest.mark.asyncio
+async def test_single_pair_is_one_round_trip(storing_session):
+    session = storing_session()
+
+    resume, generation = await create_resume_with_generation(
+        session,
+        clean_and_validate_resume(ResumeIn(**PAYLOAD)),
+        status=GenerationStatus.PENDING,
+        markdown_output=None,
+        ai_model="gpt-4o-mini",
+    )
+
+    assert len(session.statements) == 1
+    assert generation.resume_id == resume.id
+    assert generation.status == GenerationStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_generation_attaches_to_the_stored_resume(storing_session):
+    stored_id = uuid4()
+    pairs = [make_pair(), make_pair()]
+
+    await create_resumes_with_generations(storing_session(stored_id), pairs)
+
+    assert all(resume.id == generation.resume_id == stored_id for resume, generation in pairs)
+
+
+@pytest.mark.asyncio
+async def test_pairs_missed_by_a_concurrent_insert_are_retried(storing_session):
+    stored_id = uuid4()
+    pairs = [make_pair()]
+    session = storing_session(stored_id, racing=1)
+
+    await create_resumes_with_generations(session, pairs)
+
+    assert len(session.statements) == 2
+    assert pairs[0][0].id == pairs[0][1].resume_id == stored_id
+
+
+@pytest.mark.asyncio
+async def test_pairs_that_never_link_raise(storing_session):
+    with pytest.raises(RuntimeError):
+        await create_resumes_with_generations(storing_session(racing=2), [make_pair()])
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_is_chunked(storing_session, monkeypatch):
+    monkeypatch.setattr(persistence_service, "PAIRS_PER_INSERT", 2)
+    session = storing_session()
+
+    await create_resumes_with_generations(session, [make_pair() for _ in range(5)])
+    await create_resumes_with_generations(session, [])
+
+    assert [len(chunk) for chunk in session.chunks] == [2, 2, 1]
@@ -0,0 +1,164 @@
+"""
+Persistence statements run against a real, migrated PostgreSQL database
+(DATABASE_URL). Skipped when it is not set. Every test rolls back.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from config import settings
+from db import GenerationRecord, GenerationStatus, ResumeRecord
+from models import ResumeIn
+from services import (
+    clean_and_validate_resume,
+    create_resume_with_generation,
+    create_resumes_with_generations,
+    new_resume_with_generation,
+    patch_resume_sections,
+)
+from services.ai_service import GenerationUsage
+
+
+pytestmark = pytest.mark.skipif(
+    not settings.DATABASE_URL,
+    reason="needs a migrated PostgreSQL database in DATABASE_URL",
+)
+
+
+PAYLOAD = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python"],
+}
+
+
+@pytest_asyncio.fixture
+async def pg_session():
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await session.begin()
+            try:
+                yield session
+            finally:
+                await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def statements(pg_session):
+    """SQL statements sent to the database during the test."""
+    sent = []
+
+    def record(_conn, _cursor, statement, *_args):
+        sent.append(statement)
+
+    engine = pg_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield sent
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def make_pair(name="John Doe", **kwargs):
+    resume_out = clean_and_validate_resume(ResumeIn(**{**PAYLOAD, "name": name}))
+    return new_resume_with_generation(resume_out, GenerationStatus.PENDING, None, "gpt-4o-mini", **kwargs)
+
+
+async def stored_generations(session, pairs):
+    stmt = (
+        select(GenerationRecord, ResumeRecord.cleaned_data)
+        .join(ResumeRecord, ResumeRecord.id == GenerationRecord.resume_id)
+        .where(GenerationRecord.id.in_([generation.id for _, generation in pairs]))
+    )
+    return {generation.id: (generation, cleaned_data) for generation, cleaned_data in await session.execute(stmt)}
+
+
+async def row_version(session, resume_id):
+    """The resume row's physical location; any UPDATE moves it to a new tuple."""
+    stmt = select(literal_column("ctid::text")).select_from(ResumeRecord).where(ResumeRecord.id == resume_id)
+    return await session.scalar(stmt)
+
+
+@pytest.mark.asyncio
+async def test_resume_and_generation_are_stored_in_one_statement(pg_session, statements):
+    resume, generation = await create_resume_with_generation(
+        pg_session,
+        clean_and_validate_resume(ResumeIn(**PAYLOAD)),
+        status=GenerationStatus.COMPLETED,
+        markdown_output="# John Doe",
+        ai_model="gpt-4o-mini",
+        usage=GenerationUsage(input_tokens=12, latency_ms=30),
+    )
+
+    assert len(statements) == 1
+    [(stored, cleaned_data)] = (await stored_generations(pg_session, [(resume, generation)])).values()
+    assert stored.resume_id == resume.id
+    assert stored.status == GenerationStatus.COMPLETED
+    assert (stored.markdown_output, stored.input_tokens, stored.output_tokens, stored.latency_ms) == (
+        "# John Doe", 12, None, 30
+    )
+    assert stored.created_at is not None
+    assert cleaned_data["cleaned_name"] == "John Doe"
+
+
+@pytest.mark.asyncio
+async def test_batch_links_each_generation_to_its_resume(pg_session, statements):
+    pairs = [make_pair("John Doe"), make_pair("Jane Doe"), make_pair("John Doe", cache_key="k" * 64)]
+
+    await create_resumes_with_generations(pg_session, pairs)
+
+    assert len(statements) == 1
+    stored = await stored_generations(pg_session, pairs)
+    assert {stored[generation.id][0].resume_id for _, generation in pairs} == {pairs[0][0].id, pairs[1][0].id}
+    for (resume, generation), name in zip(pairs, ("John Doe", "Jane Doe", "John Doe")):
+        assert stored[generation.id][0].resume_id == resume.id == generation.resume_id
+        assert stored[generation.id][1]["cleaned_name"] == name
+    assert stored[pairs[2][1].id][0].cache_key == "k" * 64
+
+
+@pytest.mark.asyncio
+async def test_resubmitted_resume_reuses_the_stored_row_untouched(pg_session):
+    first, again = make_pair(), make_pair()
+
+    await create_resumes_with_generations(pg_session, [first])
+    version = await row_version(pg_session, first[0].id)
+    await create_resumes_with_generations(pg_session, [again])
+
+    assert again[0].id == again[1].resume_id == first[0].id
+    assert await row_version(pg_session, first[0].id) == version
+    assert await pg_session.scalar(
+        select(func.count()).select_from(GenerationRecord).where(GenerationRecord.resume_id == first[0].id)
+    ) == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_resume_generation_attaches_to_the_stored_resume(pg_session):
+    resume_out = clean_and_validate_resume(ResumeIn(**PAYLOAD))
+
+    stored, _ = await create_resume_with_generation(pg_session, resume_out, GenerationStatus.PENDING, None, None)
+    again, generation = await create_resume_with_generation(pg_session, resume_out, GenerationStatus.PENDING, None, None)
+
+    assert again.id == generation.resume_id == stored.id
+
+
+@pytest.mark.asyncio
+async def test_patch_of_a_shared_resume_changes_it_for_every_submitter(pg_session):
+    mine, theirs = make_pair(), make_pair()
+    await create_resumes_with_generations(pg_session, [mine, theirs])
+    assert mine[0].id == theirs[0].id
+
+    await patch_resume_sections(pg_session, mine[0].id, {"cleaned_skills": ["Go"]})
+
+    cleaned_data = await pg_session.scalar(
+        select(ResumeRecord.cleaned_data)
+        .join(GenerationRecord, GenerationRecord.resume_id == ResumeRecord.id)
+        .where(GenerationRecord.id == theirs[1].id)
+    )
+    assert cleaned_data["cleaned_skills"] == ["Go"]
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+import utils.utils as utils_module
+from utils import SkillIndex, alias_key, clean_skills, load_skill_index
+
+
+def test_aliases_and_misspellings_map_to_canonical_names():
+    assert clean_skills(["JS", "Javascript", "JavaScript", "node js", "NodeJS", "k8s", "Pyhton"]) == [
+        "JavaScript",
+        "Node.js",
+        "Kubernetes",
+        "Python",
+    ]
+
+
+def test_related_but_distinct_skills_are_both_kept():
+    skills = ["Django", "Django REST Framework", "Docker", "Docker Compose", "Elasticsearch", "OpenSearch", "Scrum", "Scrum Master"]
+
+    assert clean_skills(skills) == skills
+
+
+def test_versions_and_ambiguous_abbreviations_are_kept():
+    skills = ["HTML5", "CSS3", "Java SE", "SQLite3", "RN", "Node", "REST", "ML", "DL", "Spark"]
+
+    assert clean_skills(skills) == skills
+
+
+def test_unknown_skills_are_kept_and_symbols_still_distinguish_skills():
+    assert clean_skills(["Haskell", "haskell", "C", "C++", "C#"]) == ["Haskell", "C", "C++", "C#"]
+
+
+def test_alias_key_ignores_case_and_separators():
+    assert alias_key("Node.js") == alias_key("node js") == alias_key("NODE-JS") == "nodejs"
+
+
+def test_conflicting_aliases_are_rejected():
+    with pytest.raises(ValueError, match="both .Go. and .Google Go."):
+        SkillIndex({"Go": ["Golang"], "Google Go": ["golang"]})
+
+
+def test_index_is_read_only():
+    index = SkillIndex({"Go": ["Golang"]})
+
+    with pytest.raises(TypeError):
+        index._aliases["rust"] = "Rust"
+    assert "golang" in index
+    assert len(index) == 2
+
+
+def test_taxonomy_path_setting(tmp_path, monkeypatch):
+    taxonomy = tmp_path / "skills.json"
+    taxonomy.write_text(json.dumps({"Elixir": ["Elixr"]}), encoding="utf-8")
+
+    monkeypatch.setattr(utils_module, "skill_index", load_skill_index(taxonomy))
+    assert clean_skills(["elixr", "JS"]) == ["Elixir", "JS"]
+
+    monkeypatch.setattr(utils_module, "skill_index", load_skill_index(""))
+    assert clean_skills(["Javascript", "JS"]) == ["Javascript", "JS"]
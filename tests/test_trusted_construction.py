@@ -0,0 +1,45 @@
+from config import settings
+from models import ResumeIn
+from services import clean_and_validate_resume
+
+
+PAYLOAD = {
+    "name": "Dr. José  Álvarez",
+    "email": " Jose@Example.COM ",
+    "phone": "816 555 1234",
+    "location": {"country": "united states", "city": "kansas city"},
+    "urls": ["https://github.com/jose/", "https://GITHUB.com/jose", "https://example.com"],
+    "skills": ["Python", "python", "SQL"],
+    "experience": [
+        {
+            "company": "acme",
+            "position": ["engineer", "Engineer"],
+            "start_date": "2020-01-15",
+            "end_date": "2022-06-01",
+            "description": ["Built APIs", "built apis", "Ran on-call 🚀"],
+        }
+    ],
+    "education": [{"school": "mizzou", "degree": "bs", "graduation_date": "2014-05-01", "gpa": 3.5}],
+    "certifications": [
+        {
+            "name": "AWS Developer",
+            "issuer": "amazon",
+            "issue_date": "2021-03-01",
+            "expiry_date": "2024-03-01",
+            "verification_url": "https://aws.amazon.com/verify",
+        }
+    ],
+}
+
+
+def test_trusted_construction_matches_validated_output(monkeypatch):
+    payload = ResumeIn(**PAYLOAD)
+
+    strict = clean_and_validate_resume(payload)
+    monkeypatch.setattr(settings, "STRICT_MODEL_VALIDATION", False)
+    trusted = clean_and_validate_resume(payload)
+
+    assert trusted.model_dump(mode="json") == strict.model_dump(mode="json")
+    assert trusted.model_dump_json() == strict.model_dump_json()
+    assert trusted == strict
+
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import services.batch_service as batch_service
+from main import app
+
+
+VALID = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python"],
+}
+
+
+async def chunked(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_are_split_across_chunks(monkeypatch):
+    lines = [line async for line in batch_service.iter_ndjson_lines(chunked(b'{"a":', b' 1}\n\n{"b"', b": 2}"), 1024)]
+
+    assert lines == [b'{"a": 1}', b'{"b": 2}']
+
+
+@pytest.mark.asyncio
+async def test_oversized_line_is_reported_and_skipped():
+    lines = [line async for line in batch_service.iter_ndjson_lines(chunked(b"x" * 20, b"x\n{}\n"), 8)]
+
+    assert lines == [None, b"{}"]
+
+
+@pytest.mark.asyncio
+async def test_oversized_line_inside_one_chunk_is_reported():
+    body = b"{}\n" + b"x" * 100 + b"\n{}\n"
+
+    lines = [line async for line in batch_service.iter_ndjson_lines(chunked(body), 10)]
+
+    assert lines == [b"{}", None, b"{}"]
+
+
+@pytest.mark.asyncio
+async def test_validate_batch_streams_per_record_results(fixed_api_keys):
+    body = "\n".join([
+        json.dumps(VALID),
+        json.dumps({**VALID, "phone": "not-a-phone"}),
+        "{not json",
+        json.dumps({**VALID, "email": "not-an-email"}),
+    ])
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/resume/validate/batch",
+            content=body,
+            headers={"X-API-Key": "test-app-key", "Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert lines[0]["ok"] is True
+    assert lines[0]["resume"]["cleaned_phone"] == "+18165551234"
+    assert [line["status_code"] for line in lines[1:4]] == [422, 400, 422]
+    assert lines[-1] == {"type": "summary", "total": 4, "succeeded": 1, "failed": 3}
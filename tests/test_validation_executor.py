@@ -0,0 +1,113 @@
+import json
+import pickle
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+import services.batch_service as batch_service
+import services.validation_executor as validation_executor
+from config import settings
+from models import ResumeIn
+from services import clean_and_validate_resume, payload_weight
+
+
+VALID = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "+18165551234",
+    "skills": ["Python"],
+}
+
+# Matches the input pattern but is not a valid US number, so cleaning raises.
+BAD_PHONE = "020 7946 0958"
+
+
+async def chunked(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest_asyncio.fixture
+async def executor_mode(monkeypatch):
+    async def start(mode: str, workers: int = 2):
+        monkeypatch.setattr(settings, "VALIDATION_EXECUTOR", mode)
+        monkeypatch.setattr(settings, "VALIDATION_EXECUTOR_WORKERS", workers)
+        await validation_executor.start_validation_executor()
+        return validation_executor.get_validation_executor()
+
+    try:
+        yield start
+    finally:
+        await validation_executor.stop_validation_executor()
+
+
+def test_warmup_payload_validates():
+    validation_executor.warm_validation()
+
+
+def test_failures_survive_pickling():
+    result = validation_executor.validate_payload_task(ResumeIn(**{**VALID, "phone": BAD_PHONE}))
+
+    assert isinstance(result, validation_executor.ValidationFailure)
+    exc = pickle.loads(pickle.dumps(result)).to_exception()
+    assert isinstance(exc, HTTPException)
+    assert exc.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_only_heavy_payloads_are_offloaded(executor_mode, monkeypatch):
+    executor = await executor_mode("thread")
+    monkeypatch.setattr(settings, "VALIDATION_OFFLOAD_MIN_ITEMS", 10)
+
+    light = ResumeIn(**VALID)
+    heavy = ResumeIn(**{**VALID, "skills": [f"Skill {n}" for n in range(20)]})
+    assert payload_weight(light) < 10 <= payload_weight(heavy)
+
+    offloaded = executor.offloaded
+    assert await validation_executor.validate_resume(light) == clean_and_validate_resume(light)
+    assert executor.offloaded == offloaded
+
+    assert await validation_executor.validate_resume(heavy) == clean_and_validate_resume(heavy)
+    assert executor.offloaded == offloaded + 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        await validation_executor.validate_resume(ResumeIn(**{**heavy.model_dump(mode="json"), "phone": BAD_PHONE}))
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_batch_items_keep_order_across_worker_chunks(executor_mode):
+    await executor_mode("thread", workers=3)
+    items = [{**VALID, "name": f"Person {n}"} if n % 4 else {"name": "missing fields"} for n in range(10)]
+
+    results = await validation_executor.validate_items(items)
+
+    assert [isinstance(result, validation_executor.ValidationFailure) for result in results] == [n % 4 == 0 for n in range(10)]
+    assert results[1].cleaned_name == "Person 1"
+    assert results[9].cleaned_name == "Person 9"
+
+
+@pytest.mark.asyncio
+async def test_pooled_ndjson_validation_matches_inline(executor_mode):
+    body = b"\n".join(
+        json.dumps({**VALID, "name": f"Person {n}"} if n % 3 else {**VALID, "phone": "bad"}).encode()
+        for n in range(25)
+    )
+
+    inline = [line async for line in batch_service.stream_batch_validation(chunked(body))]
+    await executor_mode("thread")
+    pooled = [line async for line in batch_service.stream_batch_validation(chunked(body))]
+
+    assert pooled == inline
+    assert json.loads(pooled[-1]) == {"type": "summary", "total": 25, "succeeded": 16, "failed": 9}
+
+
+@pytest.mark.asyncio
+async def test_process_pool_round_trips_results_and_errors(executor_mode):
+    await executor_mode("process", workers=1)
+
+    results = await validation_executor.validate_items([VALID, {**VALID, "phone": "bad"}])
+
+    assert results[0] == clean_and_validate_resume(ResumeIn(**VALID))
+    assert results[1].status_code == 422
@@ -2,22 +2,38 @@
 
 from .utils import (
     clean_text,
+    clean_text_list,
     title_case,
     clean_email,
     clean_date,
+    parse_month,
+    date_cache,
+    is_present_date,
     first_of_month,
     normalize_url,
     clean_urls,
     clean_skills,
+    skill_index,
 )
+from .lru import LRUCache
+from .skills import SkillIndex, alias_key, load_skill_index
 
 __all__ = [
     "clean_text",
+    "clean_text_list",
     "title_case",
     "clean_email",
     "clean_date",
+    "parse_month",
+    "date_cache",
+    "is_present_date",
     "first_of_month",
     "normalize_url",
     "clean_urls",
     "clean_skills",
+    "skill_index",
+    "LRUCache",
+    "SkillIndex",
+    "alias_key",
+    "load_skill_index",
 ]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).with_name("skill_taxonomy.json")
+
+# Spacing and punctuation that never tells two skills apart ("Node.js" / "node js" / "NodeJS")
+_SEPARATORS = str.maketrans("", "", " .-_/")
+
+
+def alias_key(skill: str) -> str:
+    """Lookup key for a skill: casefolded with separators removed."""
+    return skill.casefold().translate(_SEPARATORS)
+
+
+class SkillIndex:
+    """
+    Immutable alias -> canonical skill name index.
+
+    Built once from a taxonomy of {canonical: [aliases, misspellings, ...]};
+    every canonical name is also an alias of itself. Lookups are one
+    alias_key() plus one dict probe regardless of the taxonomy size.
+    """
+
+    __slots__ = ("_aliases", "canonical_count")
+
+    def __init__(self, taxonomy: Mapping[str, list[str]]):
+        aliases: dict[str, str] = {}
+
+        for canonical, names in taxonomy.items():
+            for name in (canonical, *names):
+                key = alias_key(name)
+                if not key:
+                    continue
+
+                existing = aliases.setdefault(key, canonical)
+                if existing != canonical:
+                    raise ValueError(f"Skill alias {name!r} maps to both {existing!r} and {canonical!r}")
+
+        self._aliases: Mapping[str, str] = MappingProxyType(aliases)
+        self.canonical_count = len(taxonomy)
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """The canonical name for `skill`, or None if it is not in the taxonomy."""
+        return self._aliases.get(alias_key(skill))
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    def __contains__(self, skill: object) -> bool:
+        return isinstance(skill, str) and alias_key(skill) in self._aliases
+
+
+def load_skill_index(path: str | Path | None = None) -> SkillIndex:
+    """
+    Read a JSON taxonomy file (the bundled one when `path` is None). An empty
+    path gives an empty index, which turns canonicalization off.
+    """
+    if path is None:
+        path = DEFAULT_TAXONOMY_PATH
+    if not path:
+        return SkillIndex({})
+
+    with open(path, encoding="utf-8") as taxonomy_file:
+        return SkillIndex(json.load(taxonomy_file))
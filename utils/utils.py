@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Iterable, Optional
 from datetime import datetime, date
 from urllib.parse import urlparse, urlunparse
 import re
@@ -8,6 +8,13 @@ import unicodedata
 from dateutil import parser
 from dateutil.parser import ParserError
 
+from config import settings
+from utils.lru import LRUCache
+from utils.skills import load_skill_index
+
+
+# Most emoji/symbols live in the supplementary planes
+SUPPLEMENTARY_RE = re.compile("[\U00010000-\U0010FFFF]")
 
 
 def clean_text(s: Optional[str]) -> Optional[str]:
@@ -20,12 +27,53 @@ def clean_text(s: Optional[str]) -> Optional[str]:
     if not t:
         return None
 
-    # Remove most emoji/symbols in supplementary planes
-    t = re.sub(r"[\U00010000-\U0010FFFF]", "", t)
+    # Plain ASCII has nothing to strip or normalize
+    if t.isascii():
+        return t
+
+    t = SUPPLEMENTARY_RE.sub("", t)
     t = unicodedata.normalize("NFC", t)
     return t or None
 
 
+def clean_text_list(
+    values: Iterable[Optional[str]],
+    title: bool = False,
+    canonical: Optional[Callable[[str], Optional[str]]] = None,
+) -> list[str]:
+    """
+    clean_text (or title_case with `title=True`) over a list in one pass,
+    dropping empty results and case-insensitive duplicates (first one wins).
+    `canonical` may map a cleaned value to a preferred spelling before the
+    duplicate check; None from it keeps the value as is.
+    """
+    cleaned: list[str] = []
+    seen: set[str] = set()
+
+    for value in values:
+        if not value:
+            continue
+
+        t = " ".join(value.split())
+        if not t.isascii():
+            t = unicodedata.normalize("NFC", SUPPLEMENTARY_RE.sub("", t))
+        if not t:
+            continue
+        if title:
+            t = t.title()
+        if canonical is not None:
+            t = canonical(t) or t
+
+        key = t.lower()
+        if key in seen:
+            continue
+
+        seen.add(key)
+        cleaned.append(t)
+
+    return cleaned
+
+
 def title_case(s: Optional[str]) -> Optional[str]:
     """Clean then Title-Case a string."""
     t = clean_text(s)
@@ -38,10 +86,91 @@ def clean_email(email: str) -> str:
     return t.lower() if t else t
 
 
+PRESENT_WORDS = frozenset({"present", "current", "ongoing", "now"})
+
+MONTHS = {
+    name: number
+    for number, names in enumerate(
+        [
+            ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+            ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+            ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+
+# Month-level formats resumes actually use; anything else goes to dateutil.
+YEAR_MONTH_RE = re.compile(r"(\d{4})[-/.](\d{1,2})(?:[-/.](\d{1,2}))?")  # 2020-01, 2020/01/15
+MONTH_YEAR_RE = re.compile(r"(\d{1,2})[-/.](?:(\d{1,2})[-/.])?(\d{4})")  # 01/2020, 1/15/2020
+MONTH_NAME_RE = re.compile(r"([a-z]{3,9})\.?(?:\s+(\d{1,2})(?:st|nd|rd|th)?)?,?\s+(\d{4})")  # Jan 2020, Sept. 15, 2020
+YEAR_RE = re.compile(r"\d{4}")
+
+date_cache: LRUCache[str, Optional[date]] = LRUCache(settings.DATE_CACHE_SIZE)
+_MISSING = object()
+
+
+def _month_date(year: str, month: int | None, day: str | None = None) -> Optional[date]:
+    """First of the month, or None if the year, month or (given) day does not exist."""
+    try:
+        if day is not None:
+            date(int(year), month, int(day))
+        return date(int(year), month, 1)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_fast(t: str) -> Optional[date]:
+    """Common month-level formats, or None to fall back to dateutil."""
+    if m := YEAR_MONTH_RE.fullmatch(t):
+        return _month_date(m[1], int(m[2]), m[3])
+    if m := MONTH_YEAR_RE.fullmatch(t):
+        return _month_date(m[3], int(m[1]), m[2])
+    if m := MONTH_NAME_RE.fullmatch(t):
+        return _month_date(m[3], MONTHS.get(m[1]), m[2])
+    if YEAR_RE.fullmatch(t):
+        return _month_date(t, 1)
+    return None
+
+
+def _parse_dateutil(t: str) -> Optional[date]:
+    try:
+        dt = parser.parse(
+            t,
+            fuzzy=True,
+            dayfirst=False,
+            yearfirst=True,
+            default=datetime(2000, 1, 1),
+        )
+        return date(dt.year, dt.month, 1)
+    except (ParserError, ValueError, OverflowError):
+        return None
+
+
+def is_present_date(value: Optional[str]) -> bool:
+    """True for end dates meaning 'still ongoing' ('present', 'current', ...)."""
+    t = clean_text(value)
+    return bool(t) and t.lower() in PRESENT_WORDS
+
+
+def parse_month(value: Optional[str]) -> Optional[date]:
+    """
+    Strict counterpart of clean_date for validating input: only the
+    month-level formats of the fast path, with real days and 4-digit years.
+    No dateutil fallback, so fuzzy strings ("Q3", "5 years") are None.
+    """
+    t = clean_text(value)
+    return _parse_fast(t.lower()) if t else None
+
+
 def clean_date(date_cleaned: Optional[str]) -> Optional[date]:
     """
     Parse many date formats to a date object set to the first of the month.
     Special values ('present', 'current', 'ongoing', 'now') => None.
+
+    Common month-level formats are matched with precompiled patterns;
+    dateutil's fuzzy parser is only the fallback. Results are memoized.
     """
     if not date_cleaned:
         return None
@@ -50,20 +179,17 @@ def clean_date(date_cleaned: Optional[str]) -> Optional[date]:
     if not date_cleaned:
         return None
 
-    if date_cleaned.lower() in ("present", "current", "ongoing", "now"):
+    key = date_cleaned.lower()
+    if key in PRESENT_WORDS:
         return None
 
-    try:
-        dt = parser.parse(
-            date_cleaned,
-            fuzzy=True,
-            dayfirst=False,
-            yearfirst=True,
-            default=datetime(2000, 1, 1),
-        )
-        return date(dt.year, dt.month, 1)  
-    except (ParserError, ValueError):
-        return None
+    cached = date_cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    parsed = _parse_fast(key) or _parse_dateutil(date_cleaned)
+    date_cache.set(key, parsed)
+    return parsed
 
 
 def first_of_month(d: Optional[date]) -> Optional[date]:
@@ -120,24 +246,11 @@ def clean_urls(urls: list[str]) -> list[str]:
 
 
 
-def clean_skills(skills: list[str]) -> list[str]:
-    cleaned: list[str] = []
-    seen: set[str] = set()
+# Loaded once at import from SKILL_TAXONOMY_PATH
+skill_index = load_skill_index(settings.SKILL_TAXONOMY_PATH)
 
-    for skill in skills:
-        if not skill:
-            continue
 
-        skill = clean_text(skill)
-        if not skill:
-            continue
-
-        normalized = skill.lower()
-        if normalized in seen:
-            continue
-
-        seen.add(normalized)
-        cleaned.append(skill)
-
-    return cleaned
+def clean_skills(skills: list[str]) -> list[str]:
+    """Clean skills, map known aliases and misspellings to canonical names, then dedupe."""
+    return clean_text_list(skills, canonical=skill_index.canonical)
 
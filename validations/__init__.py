@@ -1,4 +1,4 @@
-from .resume import clean_name, to_e164, resume_warnings
+from .resume import clean_name, phone_cache, to_e164, to_e164_many, resume_warnings
 from .location import clean_location
 from .experience import clean_experience
 from .education import clean_education
@@ -8,6 +8,8 @@ __all__ = [
     # Resume
     "clean_name",
     "to_e164",
+    "to_e164_many",
+    "phone_cache",
     "resume_warnings",
     # Location
     "clean_location",
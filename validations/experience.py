@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Optional, List
 from fastapi import HTTPException
 from models import ExperienceIn, ExperienceOut
-from utils import title_case, clean_text, first_of_month
+from utils import title_case, clean_text, clean_text_list, first_of_month
 
 
 def clean_experience(items: Optional[List[ExperienceIn]]) -> List[ExperienceOut]:
@@ -16,13 +16,7 @@ def clean_experience(items: Optional[List[ExperienceIn]]) -> List[ExperienceOut]
         company = title_case(experience.company) or ""
 
         if isinstance(experience.position, list):
-            positions = []
-            seen_positions = set()
-            for position in experience.position:
-                cleaned_position = title_case(position)
-                if cleaned_position and cleaned_position.lower() not in seen_positions:
-                    seen_positions.add(cleaned_position.lower())
-                    positions.append(cleaned_position)
+            positions = clean_text_list(experience.position, title=True)
         else:
             cleaned_position = title_case(experience.position)
             positions = [cleaned_position] if cleaned_position else []
@@ -37,13 +31,7 @@ def clean_experience(items: Optional[List[ExperienceIn]]) -> List[ExperienceOut]
                 )
 
         if isinstance(experience.description, list):
-            descriptions = []
-            seen_descriptions = set()
-            for desc in experience.description:
-                cleaned_desc = clean_text(desc)
-                if cleaned_desc and cleaned_desc.lower() not in seen_descriptions:
-                    seen_descriptions.add(cleaned_desc.lower())
-                    descriptions.append(cleaned_desc)
+            descriptions = clean_text_list(experience.description)
         else:
             desc_raw = clean_text(experience.description or "")
             descriptions = [line for line in desc_raw.split("\n") if line.strip()]
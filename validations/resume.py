@@ -1,32 +1,77 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 from fastapi import HTTPException
 import phonenumbers
 from phonenumbers import PhoneNumberFormat, NumberParseException
 
+from config import settings
 from models import ResumeIn
-from utils import clean_text, clean_email
+from utils import LRUCache, clean_text, clean_email
 
 
 def invalid_phone(detail: str = "Invalid phone number."):
     raise HTTPException(status_code=422, detail=detail)
 
 
+# (stripped raw, region or None for "+" numbers) -> (is_valid, E.164 or error detail)
+phone_cache: LRUCache[tuple[str, str | None], tuple[bool, str]] = LRUCache(settings.PHONE_CACHE_SIZE)
+
+
+def _parse_e164(s: str, region: str | None) -> tuple[bool, str]:
+    try:
+        num = phonenumbers.parse(s, region)
+    except NumberParseException:
+        return False, "Invalid phone number format"
+
+    if not phonenumbers.is_possible_number(num) or not phonenumbers.is_valid_number(num):
+        return False, "Invalid phone number format"
+
+    return True, phonenumbers.format_number(num, PhoneNumberFormat.E164)
+
+
 def to_e164(raw: str, region_default: str = "US") -> str:
-    """Convert raw phone to strict E.164."""
+    """
+    Convert raw phone to strict E.164.
+
+    Results, including rejections, are memoized in `phone_cache`.
+    """
     s = (raw or "").strip()
     if not s:
         invalid_phone("Phone number is required")
-    try:
-        region = None if s.startswith("+") else region_default
-        num = phonenumbers.parse(s, region)
-        if not phonenumbers.is_possible_number(num) or not phonenumbers.is_valid_number(
-            num
-        ):
-            invalid_phone("Invalid phone number format")
-        return phonenumbers.format_number(num, phonenumbers.PhoneNumberFormat.E164)
-    except phonenumbers.NumberParseException:
-        invalid_phone("Invalid phone number format")
+
+    # The default region is ignored for numbers with a country code.
+    key = (s, None if s.startswith("+") else region_default)
+    result = phone_cache.get(key)
+    if result is None:
+        result = _parse_e164(*key)
+        phone_cache.set(key, result)
+
+    ok, value = result
+    if not ok:
+        invalid_phone(value)
+    return value
+
+
+def to_e164_many(raws: Iterable[str], region_default: str = "US") -> list[str | None]:
+    """
+    Normalize many phones at once, parsing each distinct value only once.
+    Invalid entries come back as None; they are cached, so a later to_e164
+    call on the same value raises without parsing again.
+    """
+    results: dict[str, str | None] = {}
+    normalized = []
+
+    for raw in raws:
+        if raw not in results:
+            try:
+                results[raw] = to_e164(raw, region_default)
+            except HTTPException:
+                results[raw] = None
+        normalized.append(results[raw])
+
+    return normalized
 
 
 def clean_name(name: str) -> str: